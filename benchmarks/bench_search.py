@@ -0,0 +1,58 @@
+"""Сравнение поиска по триграммному индексу с линейным перебором истории
+
+Запуск: python benchmarks/bench_search.py [--size 200000]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from passgen.engine import Policy, generate_batch
+from passgen.history import HistoryStore
+
+CATEGORIES = ["Общие", "Банковские", "Социальные сети", "Почта", "Другое"]
+
+
+def linear_search(store, query):
+    query = query.lower()
+    return [e.id for e in store
+            if query in e.password.lower() or query in e.category.lower()]
+
+
+def measure(func, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    return (time.perf_counter() - start) / repeat, result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, default=200000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    store = HistoryStore()
+    policy = Policy(12, True, True, True, True)
+    start = time.perf_counter()
+    for category in CATEGORIES:
+        store.add_many(generate_batch(policy, args.size // len(CATEGORIES), rng), category,
+                       strength=0.5)
+    print(f"построение индекса: {len(store)} записей, {time.perf_counter() - start:.2f} s")
+
+    sample = rng.choice(list(store)).password
+    for query in [sample[2:7], sample[:4], "abc", "почт", "q"]:
+        linear, expected = measure(lambda: linear_search(store, query), args.repeat)
+        indexed, found = measure(lambda: store.search_ids(query), args.repeat)
+        assert found == expected, query
+        print(f"{query!r:12} найдено {len(found):7}  перебор {linear * 1000:8.2f} ms"
+              f"  индекс {indexed * 1000:8.2f} ms  x{linear / indexed:.1f}")
+
+
+if __name__ == "__main__":
+    main()
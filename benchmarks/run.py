@@ -0,0 +1,341 @@
+"""Набор замеров производительности без графического интерфейса
+
+Запуск:
+    python benchmarks/run.py                         # размеры 10^3..10^5
+    python benchmarks/run.py --sizes 1000,1000000 --filter history
+    python benchmarks/run.py --output results.json
+    python benchmarks/run.py --runs 3 --output benchmarks/baseline.json
+    python benchmarks/run.py --baseline benchmarks/baseline.json
+
+Входные данные строятся генератором random.Random(--seed), поэтому
+повторные запуски работают с одинаковыми паролями и историей. Результаты
+пишутся в JSON; при --baseline каждый замер сравнивается с сохраненным,
+и при замедлении больше --tolerance скрипт завершается с кодом 1.
+
+Перед каждым замером выполняется калибровочная нагрузка на чистом Python,
+и сравниваются медианы серий относительно нее: так общее замедление машины
+(частота процессора, соседние процессы) не выдается за регрессию. К
+допуску добавляется разброс серий, но не больше MAX_NOISE, замедление
+меньше MIN_SLOWDOWN на вызов не учитывается, а замедлившиеся замеры
+перемеряются до --retries раз и сравниваются по медиане попыток. Соль
+хэшей фиксируется (PYTHONHASHSEED=0), чтобы запуски были сравнимы. Эталон
+все равно лучше перезаписывать после смены окружения, с --runs 3, чтобы в
+него не попал случайно быстрый или медленный прогон.
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from passgen.engine import Policy, compile_policy, generate_batch, generate_password
+from passgen.entropy import EntropyPool
+from passgen.estimator import estimate_batch
+from passgen.export import export_history
+from passgen.history import HistoryStore
+from passgen.strength import calculate_password_strength
+from passgen.templates import compile_template
+
+CATEGORIES = ["Общие", "Банковские", "Социальные сети", "Почта", "Другое"]
+DEFAULT_SIZES = [1000, 10000, 100000]
+# Замедление меньше этого времени на вызов не считается регрессией:
+# микросекундные замеры колеблются сильнее любого допуска
+MIN_SLOWDOWN = 5e-6
+# Наибольшая поправка допуска на разброс серий: шумный эталон не должен
+# пропускать реальные замедления на 30-50%
+MAX_NOISE = 0.10
+POLICY = Policy(12, True, True, True, True)
+TEMPLATE = "Word####!@"
+
+CASES = {}
+
+# Каталог для файлов замеров экспорта; создается на время run()
+WORK_DIR = None
+
+
+def case(name):
+    """Регистрирует замер: setup(size, rng) возвращает измеряемую функцию"""
+    def register(setup):
+        CASES[name] = setup
+        return setup
+    return register
+
+
+def make_passwords(size, rng):
+    return generate_batch(POLICY, size, rng)
+
+
+def make_history(size, rng):
+    store = HistoryStore()
+    passwords = make_passwords(size, rng)
+    strengths = [rng.random() for _ in range(size)]
+    step = max(1, size // len(CATEGORIES))
+    for i, category in enumerate(CATEGORIES):
+        chunk = slice(i * step, size if i == len(CATEGORIES) - 1 else (i + 1) * step)
+        for password, strength in zip(passwords[chunk], strengths[chunk]):
+            store.add(password, category, strength=strength)
+    return store
+
+
+# Генерация замеряется на пуле энтропии, как в приложении; воспроизводимые
+# входные данные для остальных замеров строятся через rng
+
+@case("generate.single")
+def bench_generate_single(size, rng):
+    # То же, что generate_single_password без обновления интерфейса
+    return lambda: [generate_password(POLICY) for _ in range(size)]
+
+
+@case("generate.batch")
+def bench_generate_batch(size, rng):
+    return lambda: generate_batch(POLICY, size)
+
+
+@case("entropy.choose")
+def bench_entropy_choose(size, rng):
+    pool = EntropyPool()
+    alphabet = compile_policy(POLICY).alphabet
+    return lambda: pool.choose(alphabet, size)
+
+
+@case("strength.legacy")
+def bench_strength_legacy(size, rng):
+    passwords = make_passwords(size, rng)
+    return lambda: [calculate_password_strength(p) for p in passwords]
+
+
+@case("strength.entropy")
+def bench_strength_entropy(size, rng):
+    passwords = make_passwords(size, rng)
+    return lambda: estimate_batch(passwords)
+
+
+@case("templates.expand")
+def bench_templates(size, rng):
+    # То же, что apply_template(TEMPLATE, size)
+    return lambda: compile_template(TEMPLATE).expand(size)
+
+
+@case("history.insert")
+def bench_history_insert(size, rng):
+    passwords = make_passwords(size, rng)
+    return lambda: HistoryStore().add_many(passwords, CATEGORIES[0])
+
+
+@case("history.search")
+def bench_history_search(size, rng):
+    store = make_history(size, rng)
+    sample = store.get(rng.randrange(len(store))).password
+    queries = [sample[2:7], sample[:4], "abc", "почт"]
+    return lambda: [store.search_ids(q) for q in queries]
+
+
+@case("history.filter")
+def bench_history_filter(size, rng):
+    store = make_history(size, rng)
+    return lambda: [store.query(bucket=b, category=c)
+                    for b in (None, 0, 2) for c in (None, "Почта")]
+
+
+@case("history.stats")
+def bench_history_stats(size, rng):
+    store = make_history(size, rng)
+    return lambda: (store.strength_distribution(), store.category_counts())
+
+
+def export_case(fmt):
+    def setup(size, rng):
+        entries = make_history(size, rng).snapshot()
+        path = os.path.join(WORK_DIR, f"passgen_bench.{fmt}")
+        return lambda: export_history(entries, path, fmt)
+    return setup
+
+
+case("export.json")(export_case("json"))
+case("export.csv")(export_case("csv"))
+
+
+def calibration_load():
+    """Фиксированная нагрузка на интерпретатор: строки, сортировка, словари"""
+    words = sorted(str(i * 7919 % 10007) for i in range(5000))
+    counts = {}
+    for word in words:
+        counts[word[:2]] = counts.get(word[:2], 0) + 1
+    return len(counts)
+
+
+def measure(func, repeat, min_time=0.2):
+    """Время одного вызова в repeat сериях
+
+    Быстрые функции вызываются в цикле, пока серия не займет min_time,
+    иначе замеры меньше миллисекунды тонут в шуме. Сборщик циклического
+    мусора на время замера выключается, как в timeit: иначе время зависит
+    от того, в какую серию попала сборка объектов подготовки.
+    """
+    gc.collect()
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return _measure(func, repeat, min_time)
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _measure(func, repeat, min_time):
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        number *= 10 if elapsed < min_time / 10 else 2
+    times = [elapsed / number]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        times.append((time.perf_counter() - start) / number)
+    return times
+
+
+def run_case(name, size, repeat, seed):
+    """Один замер и время относительно калибровки, выполненной перед ним
+
+    Калибровка берется лучшей из нескольких серий: одна короткая серия
+    может попасть на помеху и исказить свой замер, а долгие замедления
+    машины она отслеживает вместе с замером.
+    """
+    # Каждый замер получает свой воспроизводимый генератор
+    rng = random.Random(f"{seed}:{name}:{size}")
+    func = CASES[name](size, rng)
+    calibration = min(measure(calibration_load, 5, min_time=0.1))
+    times = measure(func, repeat)
+    best = min(times)
+    median = statistics.median(times)
+    print(f"{name + '/' + str(size):28} median {median * 1000:10.3f} ms"
+          f"  {median / size * 1e6:8.3f} us/item", flush=True)
+    return {"size": size, "best": best, "median": median,
+            "spread": (median - best) / best, "relative": median / calibration}
+
+
+def median_result(attempts):
+    """Попытка с медианным временем относительно калибровки"""
+    attempts = sorted(attempts, key=lambda r: r["relative"])
+    return attempts[(len(attempts) - 1) // 2]
+
+
+def run(sizes, names, repeat, seed, runs=1):
+    """Все замеры; при runs > 1 каждый берется медианным из runs прогонов
+
+    Прогоны идут по очереди через весь набор, а не подряд для одного
+    замера, чтобы долгая помеха на машине не попала во все попытки сразу.
+    """
+    attempts = {}
+    for _ in range(runs):
+        for name in names:
+            for size in sizes:
+                attempts.setdefault(f"{name}/{size}", []).append(
+                    run_case(name, size, repeat, seed))
+    return {key: median_result(tries) for key, tries in attempts.items()}
+
+
+def compare(results, baseline, tolerance):
+    """Сравнивает медианы относительно калибровки с эталоном
+
+    Возвращает замедлившиеся замеры. Для эталонов без калибровки
+    сравниваются абсолютные медианы.
+    """
+    regressions = []
+    for key, result in results.items():
+        base = baseline.get(key)
+        if base is None:
+            continue
+        if "relative" in base:
+            ratio = result["relative"] / base["relative"]
+        else:
+            ratio = result["median"] / base.get("median", base["best"])
+        noise = min(MAX_NOISE, max(result["spread"], base.get("spread", 0)))
+        mark = ""
+        if (ratio > 1 + tolerance + noise
+                and result["median"] - base.get("median", base["best"]) > MIN_SLOWDOWN):
+            regressions.append(key)
+            mark = "  РЕГРЕССИЯ"
+        print(f"{key:28} x{ratio:5.2f} относительно эталона{mark}")
+    return regressions
+
+
+def main():
+    if "PYTHONHASHSEED" not in os.environ:
+        # Скорость словарей со строковыми ключами зависит от случайной соли
+        # хэшей процесса, поэтому все запуски используют одну и ту же.
+        # Дочерний процесс, а не os.execv: на Windows execv не передает
+        # код завершения вызвавшему
+        env = dict(os.environ, PYTHONHASHSEED="0")
+        return subprocess.call([sys.executable] + sys.argv, env=env)
+
+    parser = argparse.ArgumentParser(description="Замеры производительности passgen")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                        help="размеры через запятую, например 1000,1000000")
+    parser.add_argument("--filter", default="", help="только замеры, содержащие строку")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--runs", type=int, default=1,
+                        help="прогнать набор несколько раз и взять медиану "
+                             "(для записи эталона лучше 3)")
+    parser.add_argument("--output", help="записать результаты в JSON")
+    parser.add_argument("--baseline", help="JSON с эталонными результатами")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="допустимое замедление относительно эталона (0.25 = 25%%)")
+    parser.add_argument("--retries", type=int, default=2,
+                        help="сколько раз перемерять замедлившиеся замеры")
+    args = parser.parse_args()
+
+    global WORK_DIR
+    sizes = [int(s) for s in args.sizes.split(",")]
+    names = [name for name in CASES if args.filter in name]
+    regressions = []
+    with tempfile.TemporaryDirectory(prefix="passgen_bench") as WORK_DIR:
+        results = run(sizes, names, args.repeat, args.seed, args.runs)
+        if args.baseline:
+            with open(args.baseline, encoding="utf-8") as f:
+                baseline = json.load(f)["results"]
+            regressions = compare(results, baseline, args.tolerance)
+            # Подозрительные замеры перемеряются --retries раз, и сравнивается
+            # медиана всех попыток: случайная помеха не закрепляется, а одна
+            # удачная попытка не скрывает настоящее замедление
+            if regressions and args.retries > 0:
+                print(f"Повторные замеры: {', '.join(regressions)}")
+                for key in regressions:
+                    name, size = key.rsplit("/", 1)
+                    attempts = [results[key]] + [run_case(name, int(size), args.repeat, args.seed)
+                                                 for _ in range(args.retries)]
+                    results[key] = median_result(attempts)
+                regressions = compare({key: results[key] for key in regressions},
+                                      baseline, args.tolerance)
+
+    if args.output:
+        report = {"python": platform.python_version(), "machine": platform.machine(),
+                  "seed": args.seed, "repeat": args.repeat, "runs": args.runs,
+                  "results": results}
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    if regressions:
+        print(f"Замедлились: {', '.join(regressions)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,30 @@
+"""Ядро Password Master Pro, не зависящее от графического интерфейса
+
+Тяжелые подсистемы (файловый вывод, пул процессов, интерфейс) загружаются
+при первом обращении, чтобы консольный запуск оставался быстрым.
+"""
+from .engine import PROFILES, Policy, compile_policy, generate_password, generate_batch
+from .strength import calculate_password_strength
+
+_LAZY = {
+    "generate_to_file": ".bulk",
+    "generate_parallel": ".parallel",
+    "PasswordGenerator": ".gui",
+}
+
+__all__ = [
+    "PROFILES",
+    "Policy",
+    "compile_policy",
+    "generate_password",
+    "generate_batch",
+    "calculate_password_strength",
+    *_LAZY,
+]
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        import importlib
+        return getattr(importlib.import_module(_LAZY[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,121 @@
+"""Фильтр Блума для быстрых отрицательных ответов"""
+import hashlib
+import math
+import mmap
+import os
+import struct
+
+_MAGIC = b"PGBLOOM1"
+_HEADER = struct.Struct("<8sQI")
+
+
+def check_fp_rate(fp_rate):
+    """Доля ложных срабатываний должна лежать строго между 0 и 1"""
+    if not 0 < fp_rate < 1:
+        raise ValueError(f"Доля ложных срабатываний должна быть между 0 и 1: {fp_rate}")
+
+
+class BloomFilter:
+    """Битовый массив из m бит и k хэш-функций (двойное хэширование)
+
+    Ложноотрицательных ответов не бывает, доля ложноположительных около
+    fp_rate при заполнении до capacity элементов.
+    """
+
+    def __init__(self, capacity, fp_rate=0.01, num_bits=None, num_hashes=None, bits=None):
+        capacity = max(1, capacity)
+        if num_bits is None:
+            check_fp_rate(fp_rate)
+            num_bits = max(8, int(-capacity * math.log(fp_rate) / math.log(2) ** 2))
+        if num_hashes is None:
+            num_hashes = max(1, round(num_bits / capacity * math.log(2)))
+        self.capacity = capacity
+        self.num_bits = num_bits
+        self.num_hashes = num_hashes
+        self.bits = bytearray((num_bits + 7) // 8) if bits is None else bits
+        self.count = 0
+
+    def _positions(self, item):
+        if isinstance(item, str):
+            item = item.encode("utf-8")
+        digest = hashlib.blake2b(item, digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        m = self.num_bits
+        return [(h1 + i * h2) % m for i in range(self.num_hashes)]
+
+    def add(self, item):
+        """Добавляет элемент; возвращает True, если его, возможно, уже не было"""
+        bits = self.bits
+        new = False
+        for pos in self._positions(item):
+            byte, mask = pos >> 3, 1 << (pos & 7)
+            if not bits[byte] & mask:
+                bits[byte] |= mask
+                new = True
+        if new:
+            self.count += 1
+        return new
+
+    def __contains__(self, item):
+        bits = self.bits
+        for pos in self._positions(item):
+            if not bits[pos >> 3] & (1 << (pos & 7)):
+                return False
+        return True
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, self.num_bits, self.num_hashes))
+            f.write(self.bits)
+
+    @classmethod
+    def load(cls, path):
+        """Открывает сохраненный фильтр через mmap, не читая его в память"""
+        with open(path, "rb") as f:
+            header = f.read(_HEADER.size)
+            if len(header) < _HEADER.size or header[:len(_MAGIC)] != _MAGIC:
+                raise ValueError(f"{path}: не файл фильтра Блума")
+            _, num_bits, num_hashes = _HEADER.unpack(header)
+            if num_bits < 1 or num_hashes < 1 or os.fstat(f.fileno()).st_size < _HEADER.size + (num_bits + 7) // 8:
+                raise ValueError(f"{path}: фильтр Блума поврежден")
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        bits = memoryview(mm)[_HEADER.size:]
+        return cls(1, num_bits=num_bits, num_hashes=num_hashes, bits=bits)
+
+
+class ScalableBloomFilter:
+    """Цепочка фильтров Блума, растущая по мере заполнения
+
+    Каждый следующий фильтр вдвое больше и с вдвое меньшей долей ложных
+    срабатываний, поэтому суммарная доля остается ниже fp_rate при любом
+    количестве элементов.
+    """
+
+    def __init__(self, initial_capacity=1 << 20, fp_rate=1e-6, growth=2, tightening=0.5):
+        check_fp_rate(fp_rate)
+        self.fp_rate = fp_rate
+        self.growth = growth
+        self.tightening = tightening
+        self.filters = [BloomFilter(initial_capacity, self._stage_fp_rate(0))]
+
+    def __contains__(self, item):
+        return any(item in f for f in self.filters)
+
+    def __len__(self):
+        return sum(f.count for f in self.filters)
+
+    def add(self, item):
+        """Добавляет элемент; возвращает False, если он, вероятно, уже был"""
+        if item in self:
+            return False
+        current = self.filters[-1]
+        if current.count >= current.capacity:
+            current = BloomFilter(current.capacity * self.growth,
+                                  self._stage_fp_rate(len(self.filters)))
+            self.filters.append(current)
+        current.add(item)
+        return True
+
+    def _stage_fp_rate(self, index):
+        return self.fp_rate * (1 - self.tightening) * self.tightening ** index
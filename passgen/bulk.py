@@ -0,0 +1,116 @@
+"""Потоковая массовая генерация паролей в файл с ограниченным расходом памяти"""
+import json
+import queue
+import threading
+
+from . import metrics
+from .engine import generate_batch
+
+DEFAULT_CHUNK_SIZE = 10000
+FORMATS = ("txt", "csv", "jsonl")
+
+_DONE = object()
+
+
+def check_chunk_size(chunk_size):
+    if chunk_size < 1:
+        raise ValueError(f"Размер порции должен быть больше нуля: {chunk_size}")
+
+
+def iter_chunks(policy, total, chunk_size=DEFAULT_CHUNK_SIZE, rng=None):
+    """Генерирует пароли порциями фиксированного размера"""
+    check_chunk_size(chunk_size)
+    remaining = total
+    while remaining > 0:
+        n = min(chunk_size, remaining)
+        yield generate_batch(policy, n, rng)
+        remaining -= n
+
+
+def format_from_path(path):
+    """Определяет формат вывода по расширению файла"""
+    ext = path.rsplit(".", 1)[-1].lower()
+    return ext if ext in FORMATS else "txt"
+
+
+def _chunk_writer(f, fmt):
+    """Возвращает функцию, записывающую одну порцию в открытый файл"""
+    if fmt == "csv":
+        import csv
+        writer = csv.writer(f)
+        writer.writerow(["password"])
+        return lambda chunk: writer.writerows([p] for p in chunk)
+    if fmt == "jsonl":
+        dumps = json.dumps
+        return lambda chunk: f.write("".join(dumps({"password": p}) + "\n" for p in chunk))
+    if fmt == "txt":
+        return lambda chunk: f.write("\n".join(chunk) + "\n")
+    raise ValueError(f"Неизвестный формат: {fmt}")
+
+
+def stream_to_file(chunks, path, fmt="txt", total=None, progress=None, cancel=None):
+    """Записывает порции паролей в файл, пока генерируется следующая порция
+
+    Запись идет в отдельном потоке через очередь из одной порции, поэтому
+    в памяти одновременно находится не больше трех порций. progress
+    вызывается как progress(written, total) после записи каждой порции.
+    Возвращает количество записанных паролей.
+    """
+    pending = queue.Queue(maxsize=1)
+    errors = []
+    written = [0]
+
+    def writer_loop():
+        try:
+            with open(path, "w", newline="", encoding="utf-8") as f:
+                write_chunk = _chunk_writer(f, fmt)
+                while True:
+                    chunk = pending.get()
+                    if chunk is _DONE:
+                        return
+                    write_chunk(chunk)
+                    written[0] += len(chunk)
+                    if progress:
+                        progress(written[0], total)
+        except Exception as e:
+            errors.append(e)
+            # Освобождаем производителя, если он ждет места в очереди
+            while pending.get() is not _DONE:
+                pass
+
+    thread = threading.Thread(target=writer_loop, daemon=True)
+    thread.start()
+    try:
+        for chunk in chunks:
+            if errors or (cancel and cancel()):
+                break
+            pending.put(chunk)
+    finally:
+        pending.put(_DONE)
+        thread.join()
+    if errors:
+        raise errors[0]
+    return written[0]
+
+
+@metrics.timed("generate.file")
+def generate_to_file(policy, total, path, fmt=None, chunk_size=DEFAULT_CHUNK_SIZE,
+                     progress=None, cancel=None, workers=1, unique=None):
+    """Генерирует total паролей прямо в файл, не накапливая их в памяти
+
+    При workers != 1 порции генерируются в пуле процессов, None означает
+    все доступные ядра. Если передан unique.UniqueFilter, повторы
+    отсеиваются и догенерируются.
+    """
+    check_chunk_size(chunk_size)
+    fmt = fmt or format_from_path(path)
+    if workers == 1:
+        chunks = iter_chunks(policy, total, chunk_size)
+    else:
+        from .parallel import iter_parallel_chunks
+        chunks = iter_parallel_chunks(policy, total, chunk_size, workers, ordered=False)
+    if unique is not None:
+        from .unique import check_capacity, iter_unique_chunks
+        check_capacity(policy, total, unique.seeded + unique.accepted)
+        chunks = iter_unique_chunks(chunks, unique, policy, chunk_size)
+    return stream_to_file(chunks, path, fmt, total, progress, cancel)
@@ -0,0 +1,236 @@
+"""Консольный интерфейс: генерация паролей без загрузки customtkinter"""
+import argparse
+import sys
+import time
+
+from . import entropy, metrics
+from .engine import PROFILE_ALIASES, PROFILES, compile_policy, normalize_exclude, resolve_profile
+
+DEFAULT_CHUNK_SIZE = 10000
+
+
+def _int_range(minimum, maximum=None):
+    """Тип argparse: целое число от minimum до maximum включительно"""
+    def parse(text):
+        try:
+            value = int(text)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"ожидается целое число: {text}")
+        if value < minimum:
+            raise argparse.ArgumentTypeError(f"значение должно быть не меньше {minimum}: {value}")
+        if maximum is not None and value > maximum:
+            raise argparse.ArgumentTypeError(f"значение должно быть не больше {maximum}: {value}")
+        return value
+    return parse
+
+
+def _fraction(text):
+    """Тип argparse: доля строго между 0 и 1"""
+    try:
+        value = float(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"ожидается число: {text}")
+    if not 0 < value < 1:
+        raise argparse.ArgumentTypeError(f"значение должно быть между 0 и 1: {value}")
+    return value
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="pass_gen",
+        description="Password Master Pro. Без команды запускается графический интерфейс.")
+    parser.add_argument("--timings", action="store_true",
+                        help="вывести время запуска и работы в stderr")
+    parser.add_argument("--metrics", metavar="PATH",
+                        help="собирать метрики и записать их при выходе "
+                             "(.prom/.txt - формат Prometheus, иначе JSON)")
+    parser.add_argument("--entropy-buffer", type=int, metavar="BYTES",
+                        help="размер буфера os.urandom для генерации "
+                             f"(по умолчанию {entropy.DEFAULT_BUFFER_SIZE})")
+    commands = parser.add_subparsers(dest="command")
+
+    commands.add_parser("gui", help="запустить графический интерфейс")
+
+    gen = commands.add_parser("generate", help="сгенерировать пароли")
+    gen.add_argument("--profile", default="standard",
+                     help="профиль: " + ", ".join(list(PROFILE_ALIASES) + list(PROFILES)))
+    gen.add_argument("--length", type=int, help="длина пароля (по умолчанию из профиля)")
+    gen.add_argument("--count", type=_int_range(1), default=1, help="количество паролей")
+    for name, desc in [("lowercase", "строчные буквы"), ("uppercase", "заглавные буквы"),
+                       ("digits", "цифры"), ("symbols", "спецсимволы")]:
+        gen.add_argument(f"--{name}", dest=name, action="store_true", default=None,
+                         help=f"включить {desc}")
+        gen.add_argument(f"--no-{name}", dest=name, action="store_false",
+                         help=f"исключить {desc}")
+    gen.add_argument("--min-per-class", type=int,
+                     help="минимум символов каждого выбранного набора (по умолчанию 1)")
+    gen.add_argument("--no-ambiguous", action="store_true", default=None,
+                     help="исключить похожие символы 0Oo1Il|")
+    gen.add_argument("--exclude", metavar="CHARS", help="исключить перечисленные символы")
+    gen.add_argument("-o", "--output", help="записать в файл вместо stdout")
+    gen.add_argument("--format", choices=["txt", "csv", "jsonl"],
+                     help="формат файла (по умолчанию по расширению)")
+    gen.add_argument("--workers", type=_int_range(0), default=1,
+                     help="число процессов, 0 - все ядра")
+    gen.add_argument("--chunk-size", type=_int_range(1), default=DEFAULT_CHUNK_SIZE,
+                     help="размер порции при потоковой генерации")
+    gen.add_argument("--unique", action="store_true", help="не выдавать повторов")
+    gen.add_argument("--seed-history", metavar="PATH",
+                     help="не выдавать пароли из журнала истории (password_history.jsonl)")
+    gen.add_argument("--fp-rate", type=_fraction, default=1e-6,
+                     help="доля ложных срабатываний фильтра Блума при --unique")
+
+    leaks = commands.add_parser("leaks", help="офлайн-база утечек паролей")
+    leaks_commands = leaks.add_subparsers(dest="leaks_command")
+    build = leaks_commands.add_parser("build", help="преобразовать дамп SHA1:COUNT в индекс")
+    build.add_argument("dump", help="файл дампа в формате Have I Been Pwned")
+    build.add_argument("--index", default="leaks.bin", help="путь к индексу")
+    build.add_argument("--bloom", help="дополнительно построить фильтр Блума")
+    build.add_argument("--prefix-bytes", type=_int_range(1, 20), default=8,
+                       help="ширина сохраняемого префикса SHA-1 в байтах")
+    check = leaks_commands.add_parser("check", help="проверить пароли по индексу")
+    check.add_argument("passwords", nargs="*", help="пароли (по умолчанию - строки из stdin)")
+    check.add_argument("--index", default="leaks.bin", help="путь к индексу")
+    check.add_argument("--bloom", help="фильтр Блума для быстрых отрицательных ответов")
+    return parser
+
+
+def policy_from_args(args):
+    """Собирает политику из профиля и переопределений командной строки"""
+    overrides = {}
+    if args.length is not None:
+        overrides["length"] = args.length
+    for key in ("lowercase", "uppercase", "digits", "symbols"):
+        if getattr(args, key) is not None:
+            overrides[key] = getattr(args, key)
+    if args.min_per_class is not None:
+        overrides["min_per_class"] = args.min_per_class
+    if args.no_ambiguous:
+        overrides["exclude_ambiguous"] = True
+    if args.exclude:
+        overrides["exclude"] = normalize_exclude(args.exclude)
+    return resolve_profile(args.profile)._replace(**overrides)
+
+
+def cmd_generate(args):
+    try:
+        policy = policy_from_args(args)
+        compile_policy(policy)
+    except KeyError as e:
+        print(f"Неизвестный профиль: {e.args[0]}", file=sys.stderr)
+        return 2
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 2
+
+    unique = None
+    if args.unique or args.seed_history:
+        from .unique import UniqueFilter, check_capacity
+        unique = UniqueFilter(args.count, args.fp_rate)
+        if args.seed_history:
+            from .storage import HistoryLog
+            unique.seed((r["password"] for r in HistoryLog(args.seed_history, legacy_path=None).load()),
+                        policy)
+        try:
+            check_capacity(policy, args.count, unique.seeded)
+        except ValueError as e:
+            print(e, file=sys.stderr)
+            return 2
+
+    try:
+        write_passwords(args, policy, unique)
+    except ValueError as e:
+        # Например, фильтр повторов отсеял все оставшиеся варианты
+        print(e, file=sys.stderr)
+        return 2
+
+    if unique is not None:
+        print(f"Отброшено повторов: {unique.rejected}", file=sys.stderr)
+    return 0
+
+
+def write_passwords(args, policy, unique):
+    """Пишет пароли в файл или stdout порциями"""
+    workers = args.workers or None
+    if args.output:
+        from .bulk import generate_to_file
+        generate_to_file(policy, args.count, args.output, args.format,
+                         args.chunk_size, workers=workers, unique=unique)
+        return
+    if workers == 1:
+        from .bulk import iter_chunks
+        chunks = iter_chunks(policy, args.count, args.chunk_size)
+    else:
+        from .parallel import iter_parallel_chunks
+        chunks = iter_parallel_chunks(policy, args.count, args.chunk_size, workers)
+    if unique is not None:
+        from .unique import iter_unique_chunks
+        chunks = iter_unique_chunks(chunks, unique, policy, args.chunk_size)
+    write = sys.stdout.write
+    for chunk in chunks:
+        write("\n".join(chunk) + "\n")
+
+
+def cmd_leaks(args):
+    """Код возврата: 0 - утечек нет, 1 - найден пароль из утечки, 2 - ошибка"""
+    from .leaks import LeakIndex, build_index
+    if args.leaks_command == "build":
+        try:
+            count = build_index(args.dump, args.index, args.bloom, args.prefix_bytes)
+        except (OSError, ValueError) as e:
+            print(f"Не удалось построить индекс: {e}", file=sys.stderr)
+            return 2
+        print(f"Записано хэшей: {count}", file=sys.stderr)
+        return 0
+    if args.leaks_command == "check":
+        passwords = args.passwords or [line.rstrip("\n") for line in sys.stdin]
+        try:
+            with LeakIndex(args.index, args.bloom) as index:
+                results = index.check_many(passwords)
+        except (OSError, ValueError) as e:
+            # Отличаем поломку индекса от найденной утечки (код 1)
+            print(f"Не удалось проверить пароли: {e}", file=sys.stderr)
+            return 2
+        for password, leaked in zip(passwords, results):
+            print(f"{password}\t{'leaked' if leaked else 'ok'}")
+        return 1 if any(results) else 0
+    print("Укажите команду: build или check", file=sys.stderr)
+    return 2
+
+
+def run_gui(started=None, timings=False):
+    from .gui import PasswordGenerator  # customtkinter загружается только здесь
+    PasswordGenerator(started, report_timings=timings).run()
+    return 0
+
+
+def main(argv=None, started=None):
+    """Точка входа; started - момент запуска процесса по time.perf_counter()"""
+    started = time.perf_counter() if started is None else started
+    args = build_parser().parse_args(argv)
+    if args.timings:
+        print(f"startup: {(time.perf_counter() - started) * 1000:.1f} ms", file=sys.stderr)
+    if args.metrics:
+        metrics.enable()
+    if args.entropy_buffer is not None:
+        if args.entropy_buffer < 1:
+            print("Размер буфера энтропии должен быть больше нуля", file=sys.stderr)
+            return 2
+        entropy.configure(args.entropy_buffer)
+
+    if args.command == "generate":
+        code = cmd_generate(args)
+    elif args.command == "leaks":
+        code = cmd_leaks(args)
+    else:
+        code = run_gui(started, args.timings)
+
+    if args.metrics:
+        metrics.dump(args.metrics)
+    if args.timings:
+        stats = entropy.default_pool.stats()
+        print(f"entropy: {stats['bytes_consumed']} bytes consumed, "
+              f"{stats['bytes_rejected']} rejected, {stats['refills']} refills",
+              file=sys.stderr)
+        print(f"total: {(time.perf_counter() - started) * 1000:.1f} ms", file=sys.stderr)
+    return code
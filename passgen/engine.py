@@ -0,0 +1,308 @@
+"""Ядро генерации паролей без зависимостей от Tk"""
+from collections import namedtuple
+from functools import lru_cache
+from itertools import permutations
+
+try:
+    from math import comb, perm
+except ImportError:  # Python 3.7
+    from math import factorial
+
+    def perm(n, k):
+        return factorial(n) // factorial(n - k)
+
+    def comb(n, k):
+        return perm(n, k) // factorial(k)
+
+from . import entropy, metrics
+
+LOWERCASE = 'abcdefghijklmnopqrstuvwxyz'
+UPPERCASE = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+DIGITS = '0123456789'
+SYMBOLS = '!@#$%^&*()_+-=[]{}|;:,.<>?'
+
+AMBIGUOUS = '0Oo1Il|'
+
+# Наибольшее число вариантов расстановки обязательных символов, которое
+# держится в таблице; для длинных паролей позиции выбираются через sample
+PLACEMENT_TABLE_LIMIT = 50000
+
+# Пакеты меньше этого размера собираются по одному паролю
+SMALL_BATCH = 8
+
+# Наборы символов в порядке полей политики
+CLASSES = (
+    ("lowercase", LOWERCASE, "строчные буквы"),
+    ("uppercase", UPPERCASE, "заглавные буквы"),
+    ("digits", DIGITS, "цифры"),
+    ("symbols", SYMBOLS, "спецсимволы"),
+)
+
+
+class Policy(namedtuple("Policy", "length lowercase uppercase digits symbols "
+                                  "min_per_class exclude_ambiguous exclude",
+                        defaults=(1, False, ""))):
+    """Параметры генерации: длина, наборы символов, минимумы и исключения
+
+    min_per_class - сколько символов каждого выбранного набора гарантированно
+    попадет в пароль; exclude - строка запрещенных символов, exclude_ambiguous
+    дополнительно убирает похожие символы (AMBIGUOUS).
+    """
+    __slots__ = ()
+
+    @property
+    def alphabet(self):
+        return compile_policy(self).alphabet
+
+
+def normalize_exclude(chars):
+    """Приводит набор исключаемых символов к виду, удобному для кэша политик"""
+    return "".join(sorted(set(chars)))
+
+
+class CompiledPolicy:
+    """Политика с готовым алфавитом и гарантией наборов символов
+
+    Пароль строится сразу правильным, без повторных попыток: все позиции
+    заполняются из общего алфавита, затем в случайные различные позиции
+    ставятся по minimum символов каждого выбранного набора.
+    """
+    __slots__ = ("length", "classes", "minimum", "alphabet", "_required", "_slots",
+                 "_placements", "_space", "_draw_plan", "_charsets")
+
+    def __init__(self, length, classes, minimum):
+        self.length = length
+        self.classes = classes
+        self.minimum = minimum
+        self.alphabet = "".join(classes)
+        # Единственный набор совпадает с алфавитом, обеспечивать нечего
+        self._required = minimum * len(classes) if len(classes) > 1 else 0
+        # Набор, из которого берется символ для каждой обязательной позиции
+        self._slots = tuple(chars for chars in classes for _ in range(minimum))
+        self._placements = None
+        self._space = None
+        self._charsets = None
+        # Размеры диапазонов для одного пароля из пула: символы, шаги
+        # перемешивания позиций, символы обязательных наборов
+        self._draw_plan = None
+        if self.length <= 256:
+            self._draw_plan = entropy.draw_plan(
+                [len(self.alphabet)] * length
+                + list(range(length, length - self._required, -1))
+                + [len(chars) for chars in self._slots[:self._required]])
+
+    def _placement_table(self):
+        """Все упорядоченные наборы позиций, если их немного, иначе None"""
+        if self._placements is None:
+            count = self._required
+            total = perm(self.length, count)
+            self._placements = (list(permutations(range(self.length), count))
+                                if total <= PLACEMENT_TABLE_LIMIT else False)
+        return self._placements or None
+
+    def generate(self, n=1, rng=None):
+        """Возвращает n паролей
+
+        Без rng символы и позиции берутся из криптостойкого пула
+        entropy.default_pool; переданный генератор (например, random.Random
+        с зерном) дает воспроизводимый результат.
+        """
+        if rng is None:
+            pool = entropy.default_pool
+            if n < SMALL_BATCH and self._draw_plan is not None:
+                return [self._generate_one_pooled(pool) for _ in range(n)]
+            return self._generate_pooled(n, pool)
+        if n < SMALL_BATCH:
+            return [self._generate_one(rng) for _ in range(n)]
+        length = self.length
+        total = length * n
+        stream = ''.join(rng.choices(self.alphabet, k=total))
+        if not self._required:
+            return [stream[i:i + length] for i in range(0, total, length)]
+
+        # Обязательные символы: по столбцу на позицию, один вызов на столбец
+        picks = zip(*[rng.choices(chars, k=n) for chars in self._slots])
+        table = self._placement_table()
+        if table is None:
+            positions = range(length)
+            placements = [rng.sample(positions, self._required) for _ in range(n)]
+        else:
+            placements = rng.choices(table, k=n)
+        return self._assemble(stream, picks, placements)
+
+    def _generate_pooled(self, n, pool):
+        # Весь пакет получает индексы несколькими крупными выборками из пула
+        length = self.length
+        total = length * n
+        stream = pool.choose(self.alphabet, total)
+        if not self._required:
+            return [stream[i:i + length] for i in range(0, total, length)]
+
+        picks = zip(*[pool.choose(chars, n) for chars in self._slots])
+        table = self._placement_table()
+        if table is None:
+            placements = self._sample_placements(n, pool)
+        else:
+            placements = [table[i] for i in pool.indices(len(table), n)]
+        return self._assemble(stream, picks, placements)
+
+    def _generate_one_pooled(self, pool):
+        length = self.length
+        required = self._required
+        alphabet = self.alphabet
+        indices = pool.draw(self._draw_plan)
+        password = [alphabet[i] for i in indices[:length]]
+        if required:
+            positions = list(range(length))
+            for i, j in enumerate(indices[length:length + required]):
+                j += i
+                positions[i], positions[j] = positions[j], positions[i]
+            for pos, chars, k in zip(positions, self._slots, indices[length + required:]):
+                password[pos] = chars[k]
+        return ''.join(password)
+
+    def _sample_placements(self, n, pool):
+        """n наборов различных позиций частичным перемешиванием Фишера-Йетса"""
+        length = self.length
+        required = self._required
+        # Шаг i выбирает позицию из оставшихся length - i; столбец на шаг
+        columns = [pool.indices(length - i, n) for i in range(required)]
+        placements = []
+        for steps in zip(*columns):
+            positions = list(range(length))
+            for i, j in enumerate(steps):
+                j += i
+                positions[i], positions[j] = positions[j], positions[i]
+            placements.append(positions[:required])
+        return placements
+
+    def _assemble(self, stream, picks, placements):
+        length = self.length
+        passwords = []
+        append = passwords.append
+        join = ''.join
+        offset = 0
+        for chars, places in zip(picks, placements):
+            password = list(stream[offset:offset + length])
+            offset += length
+            for pos, char in zip(places, chars):
+                password[pos] = char
+            append(join(password))
+        return passwords
+
+    def _generate_one(self, rng):
+        # Индексы выбираются как в random.choices, но без накладных
+        # расходов на отдельный вызов для каждого набора
+        random_ = rng.random
+        alphabet = self.alphabet
+        size = len(alphabet)
+        password = [alphabet[int(random_() * size)] for _ in range(self.length)]
+        if self._required:
+            table = self._placement_table()
+            if table is None:
+                places = rng.sample(range(self.length), self._required)
+            else:
+                places = table[int(random_() * len(table))]
+            for pos, chars in zip(places, self._slots):
+                password[pos] = chars[int(random_() * len(chars))]
+        return ''.join(password)
+
+    def allows(self, password):
+        """Может ли политика выдать такой пароль"""
+        if len(password) != self.length:
+            return False
+        if self._charsets is None:
+            self._charsets = (frozenset(self.alphabet),
+                              tuple(frozenset(chars) for chars in self.classes))
+        alphabet, classes = self._charsets
+        if not alphabet.issuperset(password):
+            return False
+        if self._required:
+            for chars in classes:
+                if sum(c in chars for c in password) < self.minimum:
+                    return False
+        return True
+
+    @property
+    def space(self):
+        """Точное число различных паролей, удовлетворяющих политике"""
+        if self._space is None:
+            minimum = self.minimum if self._required else 0
+            # ways[t] - число способов заполнить t помеченных позиций
+            # уже учтенными наборами с соблюдением минимумов
+            length = self.length
+            ways = [1] + [0] * length
+            for chars in self.classes:
+                powers = [1]
+                for _ in range(length):
+                    powers.append(powers[-1] * len(chars))
+                ways = [sum(comb(t, k) * powers[k] * ways[t - k]
+                            for k in range(minimum, t + 1))
+                        for t in range(length + 1)]
+            self._space = ways[length]
+        return self._space
+
+
+@lru_cache(maxsize=64)
+def compile_policy(policy):
+    """Компилирует политику; результат кэшируется и переиспользуется"""
+    if policy.length < 1:
+        raise ValueError("Длина пароля должна быть больше нуля")
+    excluded = set(policy.exclude)
+    if policy.exclude_ambiguous:
+        excluded.update(AMBIGUOUS)
+
+    classes = []
+    for field, chars, name in CLASSES:
+        if not getattr(policy, field):
+            continue
+        chars = "".join(c for c in chars if c not in excluded)
+        if not chars:
+            raise ValueError(f"Исключены все {name}")
+        classes.append(chars)
+    if not classes:
+        raise ValueError("Выберите хотя бы один тип символов")
+
+    minimum = max(0, policy.min_per_class)
+    if minimum * len(classes) > policy.length:
+        raise ValueError(f"Длина {policy.length} меньше суммы минимумов по наборам "
+                         f"({minimum * len(classes)})")
+    return CompiledPolicy(policy.length, tuple(classes), minimum)
+
+
+PROFILES = {
+    "Стандартный": Policy(12, True, True, True, True),
+    "Только цифры": Policy(8, False, False, True, False),
+    "Максимальная защита": Policy(32, True, True, True, True, min_per_class=2),
+}
+
+# Латинские имена профилей для командной строки
+PROFILE_ALIASES = {
+    "standard": "Стандартный",
+    "digits": "Только цифры",
+    "max": "Максимальная защита",
+}
+
+# Профили компилируются один раз при загрузке модуля
+for _profile in PROFILES.values():
+    compile_policy(_profile)
+
+
+def resolve_profile(name):
+    """Возвращает политику профиля по имени или латинскому псевдониму"""
+    name = PROFILE_ALIASES.get(name, name)
+    if name not in PROFILES:
+        raise KeyError(name)
+    return PROFILES[name]
+
+
+@metrics.timed("generate.single")
+def generate_password(policy, rng=None):
+    """Генерирует один пароль по политике"""
+    return compile_policy(policy).generate(1, rng)[0]
+
+
+@metrics.timed("generate.batch")
+def generate_batch(policy, n, rng=None):
+    """Генерирует n паролей по одной скомпилированной политике"""
+    return compile_policy(policy).generate(n, rng)
@@ -0,0 +1,221 @@
+"""Буферизованный криптостойкий источник случайных индексов"""
+import os
+import threading
+from array import array
+from functools import lru_cache
+
+from . import metrics
+
+DEFAULT_BUFFER_SIZE = 1 << 16
+
+
+@lru_cache(maxsize=64)
+def _byte_tables(alphabet):
+    """Таблицы bytes.translate для алфавита до 256 символов
+
+    Байт b < limit переводится в символ alphabet[b % size] (или в индекс
+    b % size для не-ASCII алфавитов, который затем меняется на символ через
+    str.translate); байты >= limit удаляются, поэтому смещения нет.
+    """
+    size = len(alphabet)
+    limit = 256 - 256 % size
+    ascii_only = all(ord(c) < 128 for c in alphabet)
+    if ascii_only:
+        table = bytes(ord(alphabet[b % size]) if b < limit else 0 for b in range(256))
+        chars = None
+    else:
+        table = bytes(b % size if b < limit else 0 for b in range(256))
+        chars = {i: c for i, c in enumerate(alphabet)}
+    return table, bytes(range(limit, 256)), limit, chars
+
+
+@lru_cache(maxsize=64)
+def _index_table(size):
+    limit = 256 - 256 % size
+    return bytes(b % size if b < limit else 0 for b in range(256)), bytes(range(limit, 256)), limit
+
+
+def draw_plan(sizes):
+    """План для EntropyPool.draw по списку размеров диапазонов"""
+    return tuple((size, 256 - 256 % size) for size in sizes)
+
+
+class EntropyPool:
+    """Выдает несмещенные случайные индексы пачками из буфера os.urandom
+
+    Байты читаются из os.urandom блоками по buffer_size. Индексы получаются
+    отбором: для алфавита до 256 символов принимается байт b < 256 - 256 % size,
+    и отбор вместе с переводом в символы выполняет bytes.translate на C.
+    Для больших диапазонов используются 16- и 32-битные слова. Счетчики
+    bytes_drawn, bytes_consumed, bytes_rejected и refills помогают подобрать
+    размер буфера.
+    """
+
+    def __init__(self, buffer_size=DEFAULT_BUFFER_SIZE):
+        self.buffer_size = buffer_size
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Сбрасывает буфер и счетчики"""
+        with self._lock:
+            self._buffer = b""
+            self._pos = 0
+            self.bytes_drawn = 0
+            self.bytes_consumed = 0
+            self.bytes_rejected = 0
+            self.refills = 0
+
+    def _after_fork(self):
+        # Блокировку мог держать поток родителя, которого в потомке нет,
+        # а байты буфера потомок не должен повторять за родителем
+        self._lock = threading.Lock()
+        self.reset()
+
+    def stats(self):
+        with self._lock:
+            return {"buffer_size": self.buffer_size, "bytes_drawn": self.bytes_drawn,
+                    "bytes_consumed": self.bytes_consumed,
+                    "bytes_rejected": self.bytes_rejected, "refills": self.refills}
+
+    def read(self, count):
+        """count случайных байтов из буфера"""
+        with self._lock:
+            data = self._read(count)
+        metrics.count("entropy.bytes_consumed", count)
+        return data
+
+    def _read(self, count):
+        # Вызывается под self._lock
+        available = len(self._buffer) - self._pos
+        if count > available:
+            if count >= self.buffer_size:
+                # Большой запрос читается напрямую, минуя буфер
+                fresh = os.urandom(count - available)
+                data = self._buffer[self._pos:] + fresh
+                self._buffer, self._pos = b"", 0
+            else:
+                fresh = os.urandom(self.buffer_size)
+                self._buffer = self._buffer[self._pos:] + fresh
+                data = self._buffer[:count]
+                self._pos = count
+            self.bytes_drawn += len(fresh)
+            self.refills += 1
+            metrics.count("entropy.refills")
+            metrics.count("entropy.bytes_drawn", len(fresh))
+        else:
+            data = self._buffer[self._pos:self._pos + count]
+            self._pos += count
+        self.bytes_consumed += count
+        return data
+
+    def _accepted_bytes(self, table, delete, limit, count):
+        """count байтов после отбора и bytes.translate"""
+        parts = []
+        need = count
+        consumed = 0
+        with self._lock:
+            while need > 0:
+                # Запрашиваем с запасом на отброшенные байты
+                request = need * 256 // limit + 16
+                accepted = self._read(request).translate(table, delete)
+                self.bytes_rejected += request - len(accepted)
+                consumed += request
+                parts.append(accepted)
+                need -= len(accepted)
+        metrics.count("entropy.bytes_consumed", consumed)
+        result = b"".join(parts) if len(parts) > 1 else parts[0]
+        return result[:count]
+
+    def choose(self, alphabet, count):
+        """Строка из count равновероятных символов алфавита"""
+        size = len(alphabet)
+        if size == 0:
+            raise ValueError("Пустой алфавит")
+        if size == 1:
+            return alphabet * count
+        if size <= 256:
+            table, delete, limit, chars = _byte_tables(alphabet)
+            data = self._accepted_bytes(table, delete, limit, count)
+            if chars is None:
+                return data.decode("ascii")
+            return data.decode("latin-1").translate(chars)
+        return "".join([alphabet[i] for i in self.indices(size, count)])
+
+    def indices(self, size, count):
+        """count равновероятных индексов в range(size)
+
+        Для size <= 256 возвращает bytes (элементы - целые числа).
+        """
+        if size <= 0:
+            raise ValueError("Пустой диапазон")
+        if size == 1:
+            return bytes(count)
+        if size <= 256:
+            table, delete, limit = _index_table(size)
+            return self._accepted_bytes(table, delete, limit, count)
+        # Слова по 2 или 4 байта: H и I во всех поддерживаемых сборках CPython
+        typecode, width = ("H", 2) if size <= 1 << 16 else ("I", 4)
+        span = 1 << (8 * width)
+        if size > span:
+            raise ValueError("Слишком большой диапазон")
+        limit = span - span % size
+        result = []
+        while len(result) < count:
+            need = count - len(result)
+            request = need * span // limit + 4
+            words = array(typecode, self.read(request * width))
+            accepted = [w % size for w in words if w < limit]
+            self._count_rejected((request - len(accepted)) * width)
+            result.extend(accepted)
+        del result[count:]
+        return result
+
+    def _count_rejected(self, count):
+        if count:
+            with self._lock:
+                self.bytes_rejected += count
+
+    def draw(self, plan):
+        """По одному индексу для каждой пары (size, limit) плана одним чтением
+
+        Для коротких запросов вроде одного пароля: блокировка берется один
+        раз на весь план, а не на каждый набор символов.
+        size не больше 256, limit = 256 - 256 % size.
+        """
+        request = len(plan) + len(plan) // 4 + 4
+        consumed = request
+        result = []
+        append = result.append
+        with self._lock:
+            data = self._read(request)
+            pos = 0
+            for size, limit in plan:
+                while True:
+                    if pos == len(data):
+                        data = self._read(8)
+                        consumed += 8
+                        pos = 0
+                    byte = data[pos]
+                    pos += 1
+                    if byte < limit:
+                        break
+                    self.bytes_rejected += 1
+                append(byte % size)
+        metrics.count("entropy.bytes_consumed", consumed)
+        return result
+
+    def randbelow(self, n):
+        return self.indices(n, 1)[0]
+
+
+default_pool = EntropyPool()
+
+if hasattr(os, "register_at_fork"):
+    # Дочерний процесс не должен повторять байты родителя из буфера
+    os.register_at_fork(after_in_child=default_pool._after_fork)
+
+
+def configure(buffer_size):
+    """Меняет размер буфера общего пула"""
+    default_pool.buffer_size = buffer_size
@@ -0,0 +1,241 @@
+"""Оценка энтропии пароля с поиском словарных слов, последовательностей и повторов
+
+Все шаблоны (словарь, алфавитные и цифровые последовательности, прогулки
+по клавиатуре) собираются при импорте в префиксное дерево, которое
+сворачивается в одно регулярное выражение. Поэтому оценка одного пароля -
+несколько проходов регулярных выражений на уровне C, без циклов Python по
+символам.
+"""
+import math
+import re
+from collections import namedtuple
+
+from . import metrics
+from .engine import DIGITS, LOWERCASE, SYMBOLS, UPPERCASE
+
+# Энтропия, при которой пароль считается максимально надежным
+STRONG_BITS = 80.0
+
+COMMON_WORDS = """
+password passw0rd admin administrator root user login welcome letmein
+master secret dragon monkey shadow sunshine princess football baseball soccer
+hockey iloveyou love trustno1 starwars superman batman hello freedom whatever
+michael jordan jennifer hunter ranger buster killer charlie george thomas
+summer winter spring autumn flower cookie cheese chocolate coffee pepper
+orange banana apple computer internet google yahoo facebook twitter
+access default guest changeme mypass pass test tester testing
+qazwsx
+parol parol123 privet lubov sobaka kotik solnce
+dog cat god sex money family friend happy lucky magic
+""".split()
+
+SEQUENCES = [
+    LOWERCASE,
+    DIGITS + "0",
+    # Ряды клавиатуры и популярные диагонали
+    "qwertyuiop", "asdfghjkl", "zxcvbnm",
+    "1qaz2wsx3edc4rfv5tgb6yhn7ujm8ik9ol0p",
+    "!@#$%^&*()",
+]
+
+# Замены «leet», приводящие пароль к словарному виду
+_LEET = {"o": "0", "i": "1!|", "e": "3", "a": "4@", "s": "5$", "t": "7", "b": "8", "l": "1|"}
+
+Estimate = namedtuple("Estimate", "bits score patterns")
+
+
+def _build_trie(words):
+    trie = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = True
+    return trie
+
+
+def _char_regex(ch, leet):
+    variants = leet.get(ch) if leet else None
+    if not variants:
+        return re.escape(ch)
+    return "[" + re.escape(ch + variants) + "]"
+
+
+def _trie_to_regex(node, leet=None):
+    """Сворачивает дерево в регулярное выражение с жадным самым длинным совпадением"""
+    terminal = "" in node
+    branches = [_char_regex(ch, leet) + _trie_to_regex(child, leet)
+                for ch, child in sorted(node.items()) if ch]
+    if not branches:
+        return ""
+    if len(branches) == 1 and not terminal:
+        return branches[0]
+    body = "(?:" + "|".join(branches) + ")"
+    return body + "?" if terminal else body
+
+
+def _sequence_runs(min_length=3):
+    runs = set()
+    for seq in SEQUENCES:
+        for s in (seq, seq[::-1]):
+            for i in range(len(s)):
+                for j in range(i + min_length, len(s) + 1):
+                    runs.add(s[i:j])
+    return runs
+
+
+_WORDS = {w for w in COMMON_WORDS if len(w) >= 3}
+_RUNS = _sequence_runs()
+# Словарь (с вариантами leet) и последовательности в одном автомате
+_PATTERN_RE = re.compile("(?P<dictionary>%s)|(?P<sequence>%s)" % (
+    _trie_to_regex(_build_trie(_WORDS), _LEET), _trie_to_regex(_build_trie(_RUNS))))
+
+
+def _first_trigrams():
+    """Все возможные первые три символа совпадения, включая варианты leet"""
+    grams = {run[:3] for run in _RUNS}
+    for word in _WORDS:
+        variants = [""]
+        for ch in word[:3]:
+            variants = [v + c for v in variants for c in ch + _LEET.get(ch, "")]
+        grams.update(variants)
+    return frozenset(tuple(g) for g in grams)
+
+
+# Быстрый отсев: автомат запускается, только если в пароле есть начало шаблона
+_PATTERN_TRIGRAMS = _first_trigrams()
+_REPEAT_RE = re.compile(r"(.+?)\1+", re.S)
+# Повторы, которые не видны по повторной триграмме: aaa и abab
+_SHORT_REPEAT_RE = re.compile(r"(.)\1\1|(..)\2", re.S)
+
+_WORD_BITS = math.log2(len(_WORDS))
+_SEQUENCE_BITS = math.log2(sum(len(s) for s in SEQUENCES) * 2)
+
+
+class _ClassTable(dict):
+    """Таблица str.translate: символ -> буква класса, прочие символы -> 'o'"""
+
+    def __missing__(self, key):
+        return "o"
+
+
+_CLASS_TABLE = _ClassTable()
+for _chars, _cls in [(LOWERCASE, "l"), (UPPERCASE, "u"), (DIGITS, "d"), (SYMBOLS, "s")]:
+    _CLASS_TABLE.update(dict.fromkeys(map(ord, _chars), _cls))
+# Кириллица и прочие символы считаются алфавитом из 100 знаков
+_CLASS_SIZES = {"l": 26, "u": 26, "d": 10, "s": len(SYMBOLS), "o": 100}
+# Бит на символ для каждого сочетания классов
+_CHAR_BITS = {
+    frozenset(combo): math.log2(sum(_CLASS_SIZES[c] for c in combo))
+    for combo in (
+        [c for i, c in enumerate(_CLASS_SIZES) if mask >> i & 1]
+        for mask in range(1, 1 << len(_CLASS_SIZES))
+    )
+}
+_log2 = math.log2
+
+
+def _char_bits(password):
+    """Бит на символ для набора классов, встречающихся в пароле"""
+    return _CHAR_BITS[frozenset(password.translate(_CLASS_TABLE))]
+
+
+def _matches(password, char_bits):
+    """Найденные шаблоны: список (начало, конец, бит, вид)"""
+    found = []
+    lower = password.lower()
+    trigrams = set(zip(lower, lower[1:], lower[2:]))
+    # Автомат запускается, только если в пароле есть начало какого-либо шаблона
+    pattern_matches = () if trigrams.isdisjoint(_PATTERN_TRIGRAMS) else _PATTERN_RE.finditer(lower)
+    for m in pattern_matches:
+        start, end = m.span()
+        kind = m.lastgroup
+        if kind == "dictionary":
+            bits = _WORD_BITS
+            segment = password[start:end]
+            if segment != lower[start:end]:
+                bits += 1  # заглавные буквы
+            if not segment.isalpha():
+                bits += 1  # замены leet
+        else:
+            bits = _SEQUENCE_BITS + _log2(end - start)
+        found.append((start, end, bits, kind))
+
+    # Остальные повторы дают повторную триграмму
+    if len(trigrams) < len(password) - 2 or _SHORT_REPEAT_RE.search(password):
+        for m in _REPEAT_RE.finditer(password):
+            start, end = m.span()
+            if end - start < 3:
+                continue
+            base = len(m.group(1))
+            found.append((start, end, base * char_bits + _log2((end - start) // base), "repeat"))
+    return found
+
+
+def _cheapest_cover(length, found, char_bits):
+    """Минимальная энтропия разбиения пароля на шаблоны и случайные символы"""
+    by_end = {}
+    for match in found:
+        by_end.setdefault(match[1], []).append(match)
+    best = [0.0] * (length + 1)
+    choice = [None] * (length + 1)
+    for i in range(1, length + 1):
+        best[i] = best[i - 1] + char_bits
+        for match in by_end.get(i, ()):
+            cost = best[match[0]] + match[2]
+            if cost < best[i]:
+                best[i] = cost
+                choice[i] = match
+    patterns = []
+    i = length
+    while i > 0:
+        match = choice[i]
+        if match is None:
+            i -= 1
+        else:
+            patterns.append((match[3], match[0], match[1]))
+            i = match[0]
+    patterns.reverse()
+    return best[length], patterns
+
+
+def estimate(password):
+    """Возвращает Estimate(бит энтропии, оценка 0..1, найденные шаблоны)"""
+    if not password:
+        return Estimate(0.0, 0.0, ())
+    char_bits = _char_bits(password)
+    found = _matches(password, char_bits)
+    if not found:
+        bits = len(password) * char_bits
+        return Estimate(bits, min(bits / STRONG_BITS, 1.0), ())
+    bits, cover = _cheapest_cover(len(password), found, char_bits)
+    patterns = tuple((kind, password[start:end]) for kind, start, end in cover)
+    return Estimate(bits, min(bits / STRONG_BITS, 1.0), patterns)
+
+
+def entropy_bits(password):
+    return estimate(password).bits
+
+
+def estimate_strength(password):
+    """Оценка надежности 0..1 по энтропии с учетом шаблонов"""
+    return estimate(password).score
+
+
+@metrics.timed("strength.entropy_batch")
+def estimate_batch(passwords):
+    """Оценки надежности для пакета паролей"""
+    scores = []
+    append = scores.append
+    for password in passwords:
+        if not password:
+            append(0.0)
+            continue
+        char_bits = _char_bits(password)
+        found = _matches(password, char_bits)
+        if found:
+            bits = _cheapest_cover(len(password), found, char_bits)[0]
+        else:
+            bits = len(password) * char_bits
+        append(bits / STRONG_BITS if bits < STRONG_BITS else 1.0)
+    return scores
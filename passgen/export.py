@@ -0,0 +1,107 @@
+"""Потоковый экспорт истории в JSON, JSONL и CSV с необязательным сжатием"""
+import bz2
+import gzip
+import io
+import json
+import lzma
+from itertools import islice
+
+from . import metrics
+
+EXPORT_FORMATS = ("json", "jsonl", "csv")
+CSV_HEADER = ["Дата", "Пароль", "Категория", "Надежность"]
+
+COMPRESSORS = {
+    ".gz": gzip.open,
+    ".bz2": bz2.open,
+    ".xz": lzma.open,
+}
+try:  # Python 3.14+
+    from compression import zstd
+    COMPRESSORS[".zst"] = zstd.open
+except ImportError:
+    pass
+
+
+def detect_format(path, default="json"):
+    """Возвращает (формат, расширение сжатия) по имени файла"""
+    name = path.lower()
+    compression = None
+    for ext in COMPRESSORS:
+        if name.endswith(ext):
+            compression = ext
+            name = name[:-len(ext)]
+            break
+    fmt = name.rsplit(".", 1)[-1]
+    return (fmt if fmt in EXPORT_FORMATS else default), compression
+
+
+def open_output(path, compression=None):
+    """Открывает текстовый файл для записи, при необходимости со сжатием"""
+    if compression is None:
+        return open(path, "w", newline="", encoding="utf-8")
+    raw = COMPRESSORS[compression](path, "wb")
+    return io.TextIOWrapper(raw, encoding="utf-8", newline="")
+
+
+def _iter_chunks(entries, chunk_size):
+    it = iter(entries)
+    while True:
+        chunk = list(islice(it, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _format_json(chunk, first):
+    dumps = json.dumps
+    body = ",\n".join("    " + dumps(e.to_dict(), ensure_ascii=False) for e in chunk)
+    return body if first else ",\n" + body
+
+
+def _format_jsonl(chunk):
+    dumps = json.dumps
+    return "".join(dumps(e.to_dict(), ensure_ascii=False) + "\n" for e in chunk)
+
+
+@metrics.timed("export")
+def export_history(entries, path, fmt=None, compression=None, total=None,
+                   progress=None, cancel=None, chunk_size=1000):
+    """Записывает записи истории в файл порциями
+
+    entries - любая итерация HistoryEntry; в памяти одновременно находится
+    одна порция. JSON пишется как потоковый массив. progress вызывается как
+    progress(written, total) после каждой порции, cancel() прерывает экспорт.
+    Возвращает количество записанных записей.
+    """
+    if fmt is None:
+        fmt, compression = detect_format(path)
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Неизвестный формат: {fmt}")
+
+    written = 0
+    with open_output(path, compression) as f:
+        if fmt == "csv":
+            import csv
+            writer = csv.writer(f)
+            writer.writerow(CSV_HEADER)
+        elif fmt == "json":
+            f.write("[\n")
+
+        for chunk in _iter_chunks(entries, chunk_size):
+            if cancel and cancel():
+                break
+            if fmt == "csv":
+                writer.writerows([e.date, e.password, e.category, f"{int(e.strength * 100)}%"]
+                                 for e in chunk)
+            elif fmt == "json":
+                f.write(_format_json(chunk, written == 0))
+            else:
+                f.write(_format_jsonl(chunk))
+            written += len(chunk)
+            if progress:
+                progress(written, total)
+
+        if fmt == "json":
+            f.write("\n]\n")
+    return written
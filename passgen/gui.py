@@ -0,0 +1,1409 @@
+import customtkinter as ctk
+from tkinter import messagebox, filedialog
+import os
+import sys
+import tempfile
+import time
+
+from .history import HistoryStore
+from . import entropy, metrics
+from .leaks import LEAKS_BLOOM_PATH, LEAKS_INDEX_PATH, LeakIndex
+from .notifications import NotificationManager
+from .stats import StatsAggregator, strength_bucket
+from .storage import HistoryLog
+from .engine import PROFILES, Policy, compile_policy, generate_password, generate_batch, normalize_exclude
+from .bulk import generate_to_file
+from .estimator import estimate, estimate_strength
+from .export import detect_format, export_history
+from .scheduler import FrameScheduler
+from .parallel import PARALLEL_THRESHOLD
+from .strength import cached_password_strength, calculate_password_strength
+from .templates import TemplateError, compile_template
+from .unique import UniqueFilter, check_capacity, generate_unique
+from .widgets import BarChart, SegmentMeter, VirtualList
+from .workers import WorkerPool
+
+CATEGORIES = ["Общие", "Банковские", "Социальные сети", "Почта", "Другое"]
+
+# Пакеты больше этого размера показываются виртуальным списком
+# и генерируются в фоновой задаче
+LARGE_BATCH = 1000
+
+# При истории больше этого размера поиск выполняется в фоновой задаче
+LARGE_HISTORY = 50000
+
+BUCKET_COLORS = ["#2ecc71", "#f1c40f", "#e74c3c"]
+
+
+class PasswordGenerator:
+    def __init__(self, started=None, report_timings=False):
+        # started - момент запуска процесса по time.perf_counter()
+        self.started = time.perf_counter() if started is None else started
+        self.report_timings = report_timings
+        self.first_window_ms = None
+        self.window = ctk.CTk()
+        self.window.title("Password Master Pro")
+        self.window.geometry("800x600")
+        
+        # Настройка темы
+        ctk.set_appearance_mode("dark")
+        ctk.set_default_color_theme("blue")
+        
+        # Основные переменные
+        self.password_length = ctk.IntVar(value=12)
+        self.use_lowercase = ctk.BooleanVar(value=True)
+        self.use_uppercase = ctk.BooleanVar(value=True)
+        self.use_digits = ctk.BooleanVar(value=True)
+        self.use_symbols = ctk.BooleanVar(value=True)
+        self.exclude_ambiguous = ctk.BooleanVar(value=False)
+        self.exclude_chars = ctk.StringVar()
+        self.min_per_class = 1
+        self.generated_password = ctk.StringVar()
+        self.num_passwords = ctk.IntVar(value=1)
+        self.unique_only = ctk.BooleanVar(value=False)
+        self.reduced_motion = ctk.BooleanVar(value=False)
+        self.collect_metrics = ctk.BooleanVar(value=metrics.is_enabled())
+        self.category = ctk.StringVar(value="Общие")
+        
+        # История паролей; журнал читается в фоне после появления окна
+        self.history = HistoryStore(HistoryLog(), load=False)
+        # Статистика сгенерированных паролей для боковой панели и достижений
+        self.generated_stats = StatsAggregator()
+        
+        # Все анимации и периодические обновления идут через один цикл кадров
+        self.scheduler = FrameScheduler(self.window, is_visible=self.is_view_visible)
+        
+        # Уведомления показываются по одному в переиспользуемом окне
+        self.notifications = NotificationManager(self.window)
+        
+        # Фоновые задачи; результаты возвращаются в главный поток через after
+        self.workers = WorkerPool(self.window)
+        self.batch_job = None
+        self.search_job = None
+        self.export_job = None
+        self.history_loading = False
+        # Задача, которая сейчас показывает прогресс на индикаторе
+        self.progress_owners = {}
+        
+        # Вкладки, кроме генератора, строятся при первом открытии
+        self.tab_builders = {
+            "История": self.build_history_tab,
+            "Настройки": self.build_settings_tab,
+        }
+        
+        # Инициализация систем
+        self.create_main_layout()
+        self.setup_achievements_system()
+        self.create_animated_strength_meter()
+        self.create_tooltip_system()
+        
+        # Визуальные эффекты и горячие клавиши
+        self.add_visual_effects()
+        self.setup_hotkeys()
+        
+        # Статистика и достижения
+        self.level = 0
+        self.xp = 0
+        self.achievements = {
+            "beginner": {"name": "Новичок", "desc": "Создан первый пароль", "unlocked": False},
+            "master": {"name": "Мастер", "desc": "Создано 100 паролей", "unlocked": False},
+            "secure": {"name": "Защитник", "desc": "Создан пароль максимальной надежности", "unlocked": False},
+            "collector": {"name": "Коллекционер", "desc": "Использованы все категории", "unlocked": False}
+        }
+
+    def create_main_layout(self):
+        # Добавляем стильный заголовок
+        header = ctk.CTkFrame(self.window, height=60)
+        header.pack(fill="x", padx=10, pady=5)
+        
+        logo_label = ctk.CTkLabel(header,
+                                 text="🔒 Password Master Pro",
+                                 font=("Roboto", 24, "bold"))
+        logo_label.pack(side="left", padx=20)
+        
+        # Добавляем кнопки быстрого доступа
+        quick_buttons = ctk.CTkFrame(header)
+        quick_buttons.pack(side="right", padx=20)
+        
+        for icon, command in [
+            ("🔄", self.generate_multiple_passwords),
+            ("📋", self.copy_password),
+            ("💾", self.save_password),
+            ("🔍", self.analyze_password)
+        ]:
+            ctk.CTkButton(quick_buttons,
+                         text=icon,
+                         width=40,
+                         command=command).pack(side="left", padx=5)
+        
+        # Создаем боковую панель
+        self.sidebar = ctk.CTkFrame(self.window, width=200)
+        self.sidebar.pack(side="left", fill="y", padx=10, pady=10)
+        
+        # Основной контент
+        self.main_content = ctk.CTkTabview(self.window, command=self.on_tab_changed)
+        self.main_content.pack(side="right", fill="both", expand=True, padx=10, pady=10)
+        
+        # Добавляем вкладки
+        self.tab_generator = self.main_content.add("Генератор")
+        self.tab_history = self.main_content.add("История")
+        self.tab_settings = self.main_content.add("Настройки")
+        
+        self.create_sidebar()
+        self.create_generator_tab()
+        
+        # Первое появление окна запускает отложенную инициализацию
+        self.window.bind("<Map>", self.on_first_map, add="+")
+        # После сворачивания планировщик простаивает, пока окно не вернется
+        self.window.bind("<Map>", self.on_window_map, add="+")
+        
+    def on_first_map(self, event=None):
+        if self.first_window_ms is not None or event is None or event.widget is not self.window:
+            return
+        self.first_window_ms = (time.perf_counter() - self.started) * 1000
+        metrics.observe("startup.first_window", self.first_window_ms / 1000)
+        if self.report_timings:
+            print(f"first window: {self.first_window_ms:.1f} ms", file=sys.stderr)
+        self.load_history()
+
+    def load_history(self):
+        """Читает журнал истории в фоновой задаче
+
+        Хранилище блокируется только на время подмены загруженных данных,
+        поэтому история и сохранение паролей доступны во время загрузки.
+        """
+        def finish():
+            self.history_loading = False
+            self.update_history_status()
+            self.refresh_history_view()
+        
+        def on_error(e):
+            finish()
+            messagebox.showerror("Ошибка", f"Не удалось загрузить историю: {e}")
+        
+        self.history_loading = True
+        self.update_history_status()
+        self.workers.submit(lambda job: self.history.load(),
+                            on_done=lambda _: finish(), on_error=on_error)
+
+    def update_history_status(self):
+        if self.tab_ready("История"):
+            self.history_status.configure(
+                text="Загрузка истории..." if self.history_loading else "")
+
+    def on_window_map(self, event=None):
+        if event is not None and event.widget is self.window:
+            self.scheduler.view_shown()
+
+    def on_tab_changed(self):
+        self.ensure_tab(self.main_content.get())
+        self.scheduler.view_shown()
+
+    def ensure_tab(self, name):
+        """Строит содержимое вкладки, если она еще не открывалась"""
+        builder = self.tab_builders.pop(name, None)
+        if builder is not None:
+            with metrics.span("ui.build_tab"):
+                builder()
+
+    def show_tab(self, name):
+        self.main_content.set(name)
+        self.on_tab_changed()
+
+    def tab_ready(self, name):
+        return name not in self.tab_builders
+
+    def build_history_tab(self):
+        self.create_history_tab()
+        self.create_animated_statistics()
+        self.refresh_history_view()
+
+    def build_settings_tab(self):
+        self.create_settings_tab()
+        self.create_profiles_system()
+        self.create_template_system()
+        
+    def create_sidebar(self):
+        # Статистика
+        stats_label = ctk.CTkLabel(self.sidebar, text="Статистика", font=("Roboto", 16, "bold"))
+        stats_label.pack(pady=10)
+        
+        self.passwords_count = ctk.CTkLabel(self.sidebar, text="Создано паролей: 0")
+        self.passwords_count.pack()
+        
+        self.avg_strength = ctk.CTkLabel(self.sidebar, text="Средняя надежность: 0%")
+        self.avg_strength.pack()
+        
+        # Категории
+        ctk.CTkLabel(self.sidebar, text="Категории", font=("Roboto", 16, "bold")).pack(pady=(20,10))
+        for cat in CATEGORIES:
+            btn = ctk.CTkButton(self.sidebar, text=cat, command=lambda c=cat: self.set_category(c))
+            btn.pack(pady=2)
+            
+    def create_generator_tab(self):
+        # Основные настройки
+        settings_frame = ctk.CTkFrame(self.tab_generator)
+        settings_frame.pack(fill="x", padx=20, pady=10)
+        
+        # Длина пароля с числовым индикатором
+        length_frame = ctk.CTkFrame(settings_frame)
+        length_frame.pack(fill="x", pady=5)
+        
+        ctk.CTkLabel(length_frame, text="Длина пароля:").pack(side="left", padx=5)
+        self.length_indicator = ctk.CTkLabel(length_frame, text="12")
+        self.length_indicator.pack(side="right", padx=5)
+        
+        length_slider = ctk.CTkSlider(settings_frame, 
+                                    from_=8, to=32,
+                                    variable=self.password_length,
+                                    command=self.update_length_indicator)
+        length_slider.pack(fill="x", pady=5)
+        
+        # Колиство паролей
+        num_frame = ctk.CTkFrame(settings_frame)
+        num_frame.pack(fill="x", pady=5)
+        ctk.CTkLabel(num_frame, text="Количество паролей:").pack(side="left", padx=5)
+        ctk.CTkEntry(num_frame, textvariable=self.num_passwords, width=50).pack(side="right", padx=5)
+        
+        # Чекбоксы в строку
+        checks_frame = ctk.CTkFrame(settings_frame)
+        checks_frame.pack(fill="x", pady=10)
+        
+        for text, var in [
+            ("a-z", self.use_lowercase),
+            ("A-Z", self.use_uppercase),
+            ("0-9", self.use_digits),
+            ("!@#", self.use_symbols)
+        ]:
+            ctk.CTkCheckBox(checks_frame, text=text, variable=var).pack(side="left", padx=10)
+        
+        ctk.CTkCheckBox(checks_frame, text="Без повторов",
+                        variable=self.unique_only).pack(side="right", padx=10)
+        
+        # Исключаемые символы
+        exclude_frame = ctk.CTkFrame(settings_frame)
+        exclude_frame.pack(fill="x", pady=5)
+        ctk.CTkCheckBox(exclude_frame, text="Без похожих (0O1lI)",
+                        variable=self.exclude_ambiguous).pack(side="left", padx=10)
+        ctk.CTkLabel(exclude_frame, text="Исключить:").pack(side="left", padx=5)
+        ctk.CTkEntry(exclude_frame, textvariable=self.exclude_chars,
+                     width=120).pack(side="left", padx=5)
+            
+        # Кнопки действий
+        buttons_frame = ctk.CTkFrame(self.tab_generator)
+        buttons_frame.pack(fill="x", padx=20, pady=10)
+        
+        ctk.CTkButton(buttons_frame, 
+                     text="Сгенерировать",
+                     command=self.generate_multiple_passwords,
+                     fg_color="green").pack(side="left", padx=5, expand=True)
+                     
+        ctk.CTkButton(buttons_frame,
+                     text="Копировать",
+                     command=self.copy_password).pack(side="left", padx=5, expand=True)
+                     
+        ctk.CTkButton(buttons_frame,
+                     text="Сохранить",
+                     command=self.save_password).pack(side="left", padx=5, expand=True)
+        
+        ctk.CTkButton(buttons_frame,
+                     text="Анализ",
+                     command=self.analyze_password).pack(side="left", padx=5, expand=True)
+        
+        ctk.CTkButton(buttons_frame,
+                     text="Утечки",
+                     command=self.check_password_leaks).pack(side="left", padx=5, expand=True)
+        
+        # Массовая генерация сразу в файл
+        bulk_frame = ctk.CTkFrame(self.tab_generator)
+        bulk_frame.pack(fill="x", padx=20, pady=5)
+        
+        self.bulk_button = ctk.CTkButton(bulk_frame,
+                                         text="Сгенерировать в файл",
+                                         command=self.generate_passwords_to_file)
+        self.bulk_button.pack(side="left", padx=5)
+        
+        self.bulk_progress = ctk.CTkProgressBar(bulk_frame)
+        self.bulk_progress.pack(side="left", fill="x", expand=True, padx=5)
+        self.bulk_progress.set(0)
+        
+        # Пле вывда паролей: текстовое поле или виртуальный список для больших пакетов
+        output_frame = ctk.CTkFrame(self.tab_generator, fg_color="transparent")
+        output_frame.pack(fill="both", padx=20, pady=10, expand=True)
+        
+        self.password_text = ctk.CTkTextbox(output_frame, height=200)
+        self.password_text.pack(fill="both", expand=True)
+        
+        self.password_list = VirtualList(output_frame,
+                                         badge=self.password_badge,
+                                         on_copy=self.copy_text,
+                                         scheduler=self.scheduler)
+        self.batch_passwords = None
+        
+        # Индикатор надежности
+        strength_frame = ctk.CTkFrame(self.tab_generator)
+        strength_frame.pack(fill="x", padx=20, pady=10)
+        
+        self.strength_label = ctk.CTkLabel(strength_frame, text="Надежность: ")
+        self.strength_label.pack(side="left", padx=5)
+        
+        self.strength_progress = ctk.CTkProgressBar(strength_frame, width=300)
+        self.strength_progress.pack(side="left", padx=5, expand=True)
+        self.strength_progress.set(0)
+
+    def create_history_tab(self):
+        # Верхняя панель с поиском и фильтрами
+        top_frame = ctk.CTkFrame(self.tab_history)
+        top_frame.pack(fill="x", padx=10, pady=5)
+        
+        # Поиск
+        search_frame = ctk.CTkFrame(top_frame)
+        search_frame.pack(side="left", fill="x", expand=True)
+        
+        self.search_var = ctk.StringVar()
+        self.search_entry = ctk.CTkEntry(search_frame, 
+                                        placeholder_text="Поиск по истории...",
+                                        textvariable=self.search_var)
+        self.search_entry.pack(side="left", fill="x", expand=True, padx=5)
+        
+        # Состояние загрузки журнала истории
+        self.history_status = ctk.CTkLabel(self.tab_history, text="")
+        self.history_status.pack(fill="x", padx=10)
+        self.update_history_status()
+        
+        # Кнопка поиска
+        ctk.CTkButton(search_frame,
+                     text="🔍",
+                     width=30,
+                     command=lambda: self.search_history(self.search_var.get())).pack(side="left", padx=5)
+        
+        # Фильтры и экспорт
+        filter_frame = ctk.CTkFrame(top_frame)
+        filter_frame.pack(side="right", padx=5)
+        
+        self.filter_var = ctk.StringVar(value="Все")
+        ctk.CTkComboBox(filter_frame,
+                        values=["Все", "Сильные", "Средние", "Слабые"],
+                        variable=self.filter_var,
+                        command=self.filter_history).pack(side="left", padx=5)
+        
+        self.category_filter_var = ctk.StringVar(value="Все категории")
+        ctk.CTkComboBox(filter_frame,
+                        values=["Все категории"] + CATEGORIES,
+                        variable=self.category_filter_var,
+                        command=lambda _: self.refresh_history_view()).pack(side="left", padx=5)
+        
+        # Кнопки ествий
+        actions_frame = ctk.CTkFrame(self.tab_history)
+        actions_frame.pack(fill="x", padx=10, pady=5)
+        
+        ctk.CTkButton(actions_frame,
+                     text="Экспорт в JSON",
+                     command=lambda: self.export_passwords("json")).pack(side="left", padx=5)
+        
+        ctk.CTkButton(actions_frame,
+                     text="Экспорт в CSV",
+                     command=lambda: self.export_passwords("csv")).pack(side="left", padx=5)
+        
+        self.export_progress = ctk.CTkProgressBar(actions_frame, width=150)
+        self.export_progress.pack(side="left", padx=5)
+        self.export_progress.set(0)
+        
+        self.export_cancel_button = ctk.CTkButton(actions_frame,
+                                                  text="Отменить",
+                                                  width=80,
+                                                  state="disabled",
+                                                  command=self.cancel_export)
+        self.export_cancel_button.pack(side="left", padx=5)
+        
+        ctk.CTkButton(actions_frame,
+                     text="Очистить историю",
+                     fg_color="red",
+                     command=self.clear_history).pack(side="right", padx=5)
+        
+        # Список паролей с прокруткой
+        history_frame = ctk.CTkFrame(self.tab_history)
+        history_frame.pack(fill="both", expand=True, padx=10, pady=5)
+        
+        self.history_list = VirtualList(history_frame,
+                                        formatter=lambda e: e.format_line(),
+                                        badge=lambda e: self.strength_badge(e.strength),
+                                        on_copy=lambda e: self.copy_text(e.password),
+                                        scheduler=self.scheduler)
+        self.history_list.pack(fill="both", expand=True)
+
+    def create_settings_tab(self):
+        settings_frame = ctk.CTkFrame(self.tab_settings)
+        settings_frame.pack(fill="both", expand=True, padx=10, pady=5)
+        
+        # Настройки приложения
+        ctk.CTkLabel(settings_frame, 
+                    text="Настройки приложения",
+                    font=("Roboto", 16, "bold")).pack(pady=10)
+        
+        # Выбор темы
+        theme_frame = ctk.CTkFrame(settings_frame)
+        theme_frame.pack(fill="x", pady=5)
+        ctk.CTkLabel(theme_frame, text="Тема:").pack(side="left", padx=5)
+        ctk.CTkComboBox(theme_frame,
+                       values=["Темная", "Светлая", "Системная"],
+                       command=self.change_theme).pack(side="left", padx=5)
+        
+        # Пуь сохранения
+        path_frame = ctk.CTkFrame(settings_frame)
+        path_frame.pack(fill="x", pady=5)
+        ctk.CTkLabel(path_frame, text="Путь сохранения:").pack(side="left", padx=5)
+        ctk.CTkButton(path_frame,
+                     text="Выбрать",
+                     command=self.choose_save_path).pack(side="right", padx=5)
+        
+        # Режим без анимаций для работы с большими пакетами
+        ctk.CTkCheckBox(settings_frame,
+                       text="Без анимаций",
+                       variable=self.reduced_motion,
+                       command=lambda: self.scheduler.set_reduced_motion(
+                           self.reduced_motion.get())).pack(anchor="w", padx=5, pady=5)
+        
+        # Диагностика: счетчики и задержки основных операций
+        metrics_frame = ctk.CTkFrame(settings_frame)
+        metrics_frame.pack(fill="x", pady=5)
+        ctk.CTkCheckBox(metrics_frame,
+                       text="Собирать метрики",
+                       variable=self.collect_metrics,
+                       command=self.toggle_metrics).pack(side="left", padx=5)
+        ctk.CTkButton(metrics_frame,
+                     text="Диагностика",
+                     command=self.show_diagnostics).pack(side="right", padx=5)
+
+    def toggle_metrics(self):
+        if self.collect_metrics.get():
+            metrics.enable()
+        else:
+            metrics.disable()
+
+    def show_diagnostics(self):
+        """Окно с текущими метриками в формате Prometheus"""
+        panel = ctk.CTkToplevel(self.window)
+        panel.title("Диагностика")
+        panel.geometry("520x420")
+        
+        text = ctk.CTkTextbox(panel)
+        text.pack(fill="both", expand=True, padx=10, pady=10)
+        
+        def refresh():
+            text.delete("1.0", "end")
+            if metrics.is_enabled() or metrics.snapshot()["histograms"]:
+                text.insert("1.0", metrics.to_prometheus())
+            else:
+                text.insert("1.0", "Сбор метрик выключен")
+            stats = entropy.default_pool.stats()
+            text.insert("end", "\n# Пул энтропии\n" + "".join(
+                f"{name}: {value}\n" for name, value in stats.items()))
+        
+        def save():
+            path = filedialog.asksaveasfilename(
+                defaultextension=".json",
+                filetypes=[("JSON", "*.json"), ("Prometheus", "*.prom")])
+            if path:
+                metrics.dump(path)
+        
+        buttons = ctk.CTkFrame(panel)
+        buttons.pack(fill="x", padx=10, pady=5)
+        ctk.CTkButton(buttons, text="Обновить", command=refresh).pack(side="left", padx=5)
+        ctk.CTkButton(buttons, text="Сбросить",
+                     command=lambda: (metrics.reset(), refresh())).pack(side="left", padx=5)
+        ctk.CTkButton(buttons, text="Сохранить", command=save).pack(side="right", padx=5)
+        refresh()
+
+    def is_view_visible(self, view):
+        """Видна ли вкладка view; свернутое окно считается скрытым"""
+        if self.window.state() == "iconic":
+            return False
+        return self.main_content.get() == view
+
+    def create_profiles_system(self):
+        profiles_frame = ctk.CTkFrame(self.tab_settings)
+        profiles_frame.pack(fill="x", pady=10, padx=5)
+        
+        ctk.CTkLabel(profiles_frame, 
+                     text="Профили генерации",
+                     font=("Roboto", 16, "bold")).pack(pady=5)
+        
+        self.profiles = PROFILES
+        
+        for name, policy in self.profiles.items():
+            profile_btn = ctk.CTkButton(profiles_frame,
+                                      text=name,
+                                      command=lambda p=policy: self.apply_profile(p))
+            profile_btn.pack(pady=2)
+
+    # Дополнительные методы
+    def update_length_indicator(self, value):
+        self.length_indicator.configure(text=str(int(float(value))))
+        
+    def generate_multiple_passwords(self):
+        num = self.num_passwords.get()
+        if num == 1:
+            self.animate_password_generation()
+        else:
+            policy = self.current_policy()
+            if policy is None:
+                return
+            # Генерируем весь пакет без обращения к виджетам
+            unique = self.make_unique_filter(policy, num)
+            if unique is False:
+                return
+            
+            def work(job):
+                if unique is None:
+                    passwords = generate_batch(policy, num)
+                else:
+                    passwords = generate_unique(policy, num, unique)
+                return passwords, self.score_passwords(passwords)
+            
+            def on_done(result):
+                self.batch_job = None
+                passwords, strengths = result
+                self.show_passwords(passwords)
+                self.on_passwords_generated(passwords, strengths)
+                if unique is not None and unique.rejected:
+                    self.show_notification("Повторы отброшены",
+                                           f"Заменено повторяющихся паролей: {unique.rejected}")
+            
+            def on_error(e):
+                self.batch_job = None
+                messagebox.showerror("Ошибка", f"Не удалось сгенерировать пароли: {e}")
+            
+            # Новый пакет заменяет еще не готовый предыдущий
+            if self.batch_job is not None:
+                self.batch_job.cancel()
+                self.batch_job = None
+            if num <= LARGE_BATCH:
+                on_done(work(None))
+            else:
+                self.batch_job = self.workers.submit(work, on_done=on_done, on_error=on_error)
+
+    def make_unique_filter(self, policy, total):
+        """Фильтр повторов, заполненный паролями из истории
+
+        Возвращает None, если режим выключен, и False, если политика не
+        допускает столько различных паролей.
+        """
+        if not self.unique_only.get():
+            return None
+        unique = UniqueFilter(total + len(self.history))
+        unique.seed((entry.password for entry in self.history.snapshot()), policy)
+        try:
+            check_capacity(policy, total, unique.seeded)
+        except ValueError as e:
+            messagebox.showwarning("Предупреждение", str(e))
+            return False
+        return unique
+
+    def generate_passwords_to_file(self):
+        """Генерирует пароли в файл в фоновом потоке, минуя текстовое поле"""
+        policy = self.current_policy()
+        if policy is None:
+            return
+        total = self.num_passwords.get()
+        file_path = filedialog.asksaveasfilename(
+            defaultextension=".txt",
+            filetypes=[("Text files", "*.txt"), ("CSV files", "*.csv"), ("JSON Lines", "*.jsonl")]
+        )
+        if not file_path:
+            return
+        
+        workers = None if total >= PARALLEL_THRESHOLD else 1
+        unique = self.make_unique_filter(policy, total)
+        if unique is False:
+            return
+        
+        def restore_button():
+            self.bulk_button.configure(text="Сгенерировать в файл",
+                                       command=self.generate_passwords_to_file)
+        
+        def on_done(written):
+            restore_button()
+            message = f"Сохранено паролей: {written}"
+            if unique is not None:
+                message += f", отброшено повторов: {unique.rejected}"
+            self.show_notification("Генерация завершена", message)
+        
+        def on_error(e):
+            restore_button()
+            messagebox.showerror("Ошибка", f"Не удалось сгенерировать пароли: {e}")
+        
+        def on_cancel():
+            restore_button()
+            self.show_notification("Генерация остановлена",
+                                   f"Файл {file_path} записан не полностью")
+        
+        job = self.run_in_background(
+            lambda job: generate_to_file(policy, total, file_path, progress=job.report,
+                                         cancel=job.is_cancelled, workers=workers,
+                                         unique=unique),
+            total, self.bulk_progress, on_done, on_error, on_cancel)
+        # На время генерации кнопка останавливает задачу
+        self.bulk_button.configure(text="Отменить", command=job.cancel)
+
+    def run_in_background(self, work, total, progress_bar, on_done, on_error, on_cancel=None):
+        """Выполняет work(job) в пуле задач, показывая прогресс на progress_bar
+
+        Индикатор обновляет только последняя запущенная на нем задача:
+        завершение замененной задачи не сбрасывает прогресс новой.
+        """
+        job = None
+        
+        def owns_bar():
+            return self.progress_owners.get(id(progress_bar)) is job
+        
+        def on_progress(done_count, _total=None):
+            if owns_bar():
+                progress_bar.set(done_count / total if total else 1)
+        
+        def finish(callback):
+            def handler(*args):
+                if owns_bar():
+                    del self.progress_owners[id(progress_bar)]
+                    progress_bar.set(1 if callback is on_done else 0)
+                if callback is not None:
+                    callback(*args)
+            return handler
+        
+        progress_bar.set(0)
+        job = self.workers.submit(work, on_done=finish(on_done), on_error=finish(on_error),
+                                  on_progress=on_progress, on_cancel=finish(on_cancel))
+        self.progress_owners[id(progress_bar)] = job
+        return job
+
+    def current_policy(self):
+        """Собирает политику генерации из текущих настроек интерфейса
+
+        Скомпилированная политика кэшируется, поэтому повторные генерации с
+        теми же настройками не пересобирают алфавит.
+        """
+        policy = Policy(self.password_length.get(),
+                        self.use_lowercase.get(),
+                        self.use_uppercase.get(),
+                        self.use_digits.get(),
+                        self.use_symbols.get(),
+                        self.min_per_class,
+                        self.exclude_ambiguous.get(),
+                        normalize_exclude(self.exclude_chars.get()))
+        try:
+            compile_policy(policy)
+        except ValueError as e:
+            messagebox.showwarning("Предупреждение", str(e))
+            return None
+        return policy
+
+    def generate_single_password(self):
+        policy = self.current_policy()
+        if policy is None:
+            return None
+        password = generate_password(policy)
+        self.on_passwords_generated([password])
+        return password
+
+    def score_passwords(self, passwords):
+        # Свежий пакет в кэше не найдется: оцениваем напрямую и не
+        # вытесняем из кэша оценки, нужные для значков видимых строк
+        with metrics.span("strength.batch"):
+            return [calculate_password_strength(p) for p in passwords]
+
+    @metrics.timed("ui.passwords_generated")
+    def on_passwords_generated(self, passwords, strengths=None):
+        """Обновляет интерфейс один раз после генерации пакета паролей
+
+        strengths можно передать заранее посчитанными в фоновой задаче.
+        """
+        if not passwords:
+            return
+        if strengths is None:
+            strengths = self.score_passwords(passwords)
+        metrics.count("passwords.generated", len(passwords))
+        
+        # Индикатор показывает оценку по энтропии для последнего пароля
+        strength = estimate_strength(passwords[-1])
+        self.animate_strength(strength, instant=len(passwords) > LARGE_BATCH)
+        self.strength_progress.set(strength)
+        self.strength_label.configure(text=f"Надежность: {int(strength * 100)}%")
+        
+        # Обновляем статистику
+        self.update_statistics(strengths)
+        
+        # Проверяем достижения по самому надежному паролю
+        best = max(range(len(strengths)), key=strengths.__getitem__)
+        self.check_achievements(passwords[best])
+        
+        # Добавляем опыт
+        self.add_xp(sum(10 + int(s * 20) for s in strengths))  # От 10 до 30 XP за пароль
+        
+        # Показываем уведомление при сильных паролях
+        strong = sum(1 for s in strengths if s > 0.8)
+        if strong == 1:
+            self.show_notification("Отличный пароль!", 
+                                 "Создан пароль высокой надежности")
+        elif strong > 1:
+            self.show_notification("Отличный пароль!", 
+                                 f"Создано паролей высокой надежности: {strong}")
+        
+    def export_passwords(self, format):
+        if not len(self.history):
+            messagebox.showwarning("Предупреждение", "История пуста")
+            return
+        
+        file_path = filedialog.asksaveasfilename(
+            defaultextension=f".{format}",
+            filetypes=[(f"{format.upper()} files", f"*.{format}"),
+                       (f"{format.upper()} + gzip", f"*.{format}.gz"),
+                       ("JSON Lines", "*.jsonl *.jsonl.gz")]
+        )
+        if not file_path:
+            return
+        
+        # Формат и сжатие определяются по имени файла, например history.csv.gz
+        fmt, compression = detect_format(file_path, default=format)
+        entries = self.history.snapshot()
+        # Экспорт пишется во временный файл рядом с целевым и заменяет его
+        # только после успешного завершения; у каждого экспорта свой файл
+        fd, part_path = tempfile.mkstemp(prefix=os.path.basename(file_path) + ".",
+                                         suffix=".part",
+                                         dir=os.path.dirname(file_path) or None)
+        os.close(fd)
+        job = None
+        
+        def work(job):
+            written = export_history(entries, part_path, fmt, compression,
+                                     len(entries), job.report, job.is_cancelled)
+            job.check()
+            os.replace(part_path, file_path)
+            return written
+        
+        def discard_part():
+            if os.path.exists(part_path):
+                os.remove(part_path)
+        
+        def finish():
+            # Замененный новым экспорт не трогает его состояние
+            if self.export_job is not job:
+                return False
+            self.export_job = None
+            self.export_cancel_button.configure(state="disabled")
+            return True
+        
+        def on_done(written):
+            if finish():
+                self.show_notification("Экспорт выполнен", 
+                                    f"История сохранена в файл {file_path}")
+        
+        def on_error(e):
+            discard_part()
+            if finish():
+                messagebox.showerror("Ошибка", f"Не удалось экспортировать историю: {str(e)}")
+        
+        def on_cancel():
+            discard_part()
+            finish()
+        
+        self.cancel_export()
+        job = self.export_job = self.run_in_background(
+            work, len(entries), self.export_progress, on_done, on_error, on_cancel)
+        self.export_cancel_button.configure(state="normal")
+
+    def cancel_export(self):
+        if self.export_job is not None:
+            self.export_job.cancel()
+
+    def change_theme(self, theme):
+        theme_map = {
+            "Темная": "dark",
+            "Светлая": "light",
+            "Системная": "system"
+        }
+        ctk.set_appearance_mode(theme_map[theme])
+        
+    def choose_save_path(self):
+        path = filedialog.askdirectory()
+        if path:
+            # Сохранение пуи в настройках
+            pass
+
+    @metrics.timed("ui.show_passwords")
+    def show_passwords(self, passwords):
+        """Выводит пароли: небольшие пакеты в текстовое поле, большие - списком"""
+        # Печатающийся одиночный пароль больше не нужен
+        self.scheduler.cancel("password_output")
+        if len(passwords) > LARGE_BATCH:
+            self.password_text.pack_forget()
+            self.password_list.pack(fill="both", expand=True)
+            self.password_list.set_items(passwords)
+            self.batch_passwords = passwords
+        else:
+            self.show_text_output()
+            self.password_text.delete("1.0", "end")
+            self.password_text.insert("1.0", "\n".join(passwords))
+
+    def show_text_output(self):
+        if self.batch_passwords is not None:
+            self.password_list.pack_forget()
+            self.password_list.set_items([])
+            self.password_text.pack(fill="both", expand=True)
+            self.batch_passwords = None
+
+    def current_passwords(self):
+        """Пароли, показанные в поле вывода"""
+        if self.batch_passwords is not None:
+            return self.batch_passwords
+        text = self.password_text.get("1.0", "end-1c")
+        return [line for line in text.split("\n") if line]
+
+    def strength_badge(self, strength):
+        return f"{int(strength * 100)}%", BUCKET_COLORS[strength_bucket(strength)]
+
+    def password_badge(self, password):
+        # Оценивается только видимая строка, результат берется из кэша
+        return self.strength_badge(self.calculate_password_strength(password))
+
+    def copy_text(self, text):
+        import pyperclip  # Загружаем буфер обмена только при копировании
+        pyperclip.copy(text)
+        self.show_notification("Скопировано", "Пароль скопирован в буфер обмена", 1500)
+
+    def copy_password(self):
+        passwords = self.current_passwords()
+        if passwords:
+            import pyperclip  # Загружаем буфер обмена только при копировании
+            pyperclip.copy("\n".join(passwords))
+            messagebox.showinfo("Успех", "Пароль скопирован в буфер обмена")
+        else:
+            messagebox.showwarning("Предупреждение", "Нет пароля для копирования")
+
+    def save_password(self):
+        passwords = self.current_passwords()
+        if not passwords:
+            messagebox.showwarning("Предупреждение", "Нет пароля для сохранения")
+            return
+        
+        category = self.category.get()
+        
+        def on_done(entries):
+            # Дописываем новые записи в представление, если оно не отфильтровано
+            if not self.tab_ready("История"):
+                pass  # представление построится при открытии вкладки
+            elif (self.search_var.get() or self.filter_var.get() != "Все"
+                    or self.category_filter_var.get() in CATEGORIES):
+                self.refresh_history_view()
+            else:
+                self.history_list.items.extend(entries)
+                self.history_list.scroll_to_end()
+            messagebox.showinfo("Успех", "Пароль сохранен в истории")
+        
+        # Каждая строка поля - отдельная запись с текущей датой и категорией;
+        # индексация и запись в журнал идут в фоновой задаче
+        self.workers.submit(lambda job: self.history.add_many(passwords, category),
+                            on_done=on_done,
+                            on_error=lambda e: messagebox.showerror(
+                                "Ошибка", f"Не удалось сохранить пароли: {e}"))
+
+    def set_category(self, category):
+        self.category.set(category)
+        messagebox.showinfo("Категория", f"Выбрана катерия: {category}")
+
+    def calculate_password_strength(self, password):
+        return cached_password_strength(password)
+
+    def animate_password_generation(self):
+        self.show_text_output()
+        self.password_text.delete("1.0", "end")
+        
+        # Анимация загрузки
+        chars = "⣾⣽⣻⢿⡿⣟⣯⣷"
+        generated = []
+        
+        def password():
+            # Пароль создается один раз: если анимацию пропустят на середине,
+            # final() покажет тот же пароль, а не сгенерирует и учтет второй
+            if not generated:
+                generated.append(self.generate_single_password())
+            return generated[0]
+        
+        def loading_animation():
+            for i in range(10):  # 10 итераций анимации
+                self.password_text.delete("1.0", "end")
+                self.password_text.insert("1.0", f"Генерация пароля {chars[i % len(chars)]}")
+                yield 100
+            if password():
+                yield from self.type_frames(password())
+        
+        def final():
+            if password():
+                self.show_passwords([password()])
+        
+        self.scheduler.animate("password_output", loading_animation(),
+                               view="Генератор", final=final)
+
+    def update_statistics(self, strengths):
+        stats = self.generated_stats
+        stats.add_many(strengths, self.category.get())
+        self.passwords_count.configure(text=f"Создано паролей: {stats.count}")
+        self.avg_strength.configure(text=f"Средняя надежность: {int(stats.mean_strength * 100)}%")
+
+    PATTERN_NAMES = {"dictionary": "Словарное слово",
+                     "sequence": "Последовательность",
+                     "repeat": "Повтор"}
+
+    def analyze_password(self):
+        passwords = self.current_passwords()
+        password = passwords[-1] if passwords else ""
+        if not password:
+            messagebox.showwarning("Предупреждение", "Нет пароля для анализа")
+            return
+        
+        analysis = []
+        # Проека длины
+        if len(password) < 8:
+            analysis.append("❌ Слишком короткий ароль")
+        elif len(password) >= 12:
+            analysis.append("✅ Хорошая длина пароля")
+        
+        # Проверка символов
+        if any(c.islower() for c in password):
+            analysis.append("✅ Есть строчные буквы")
+        if any(c.isupper() for c in password):
+            analysis.append("✅ Есть заглавные буквы")
+        if any(c.isdigit() for c in password):
+            analysis.append("✅ Есть цифры")
+        if any(c in '!@#$%^&*()_+-=[]{}|;:,.<>?' for c in password):
+            analysis.append("✅ Есть специальные символы")
+        
+        # Энтропия с учетом словарных слов, последовательностей и повторов
+        result = estimate(password)
+        analysis.append(f"Энтропия: {result.bits:.0f} бит ({int(result.score * 100)}%)")
+        for kind, fragment in result.patterns:
+            analysis.append(f"⚠️ {self.PATTERN_NAMES[kind]}: {fragment}")
+        
+        messagebox.showinfo("Анализ пароля", "\n".join(analysis))
+
+    def auto_save_passwords(self):
+        # Запись дописывается в журнал истории, файл не перечитывается
+        passwords = self.current_passwords()
+        if passwords:
+            category = self.category.get()
+            self.workers.submit(lambda job: self.history.add_many(passwords, category),
+                                on_error=lambda e: messagebox.showerror(
+                                    "Ошибка", f"Не удалось сохранить пароли: {e}"))
+
+    def run(self):
+        try:
+            self.window.mainloop()
+        finally:
+            self.workers.shutdown()
+            self.notifications.close()
+            self.history.close()
+
+    def search_history(self, query):
+        self.search_var.set(query)
+        self.refresh_history_view()
+
+    def refresh_history_view(self):
+        """Перерисовывает историю с учетом поиска и фильтра"""
+        if not self.tab_ready("История"):
+            return
+        bucket = self.HISTORY_FILTERS.get(self.filter_var.get())
+        category = self.category_filter_var.get()
+        if category not in CATEGORIES:
+            category = None
+        text = self.search_var.get()
+        
+        # Устаревший поиск отменяется: его результат уже не нужен
+        if self.search_job is not None:
+            self.search_job.cancel()
+            self.search_job = None
+        if len(self.history) <= LARGE_HISTORY:
+            self.history_list.set_items(self.history.query(text=text, bucket=bucket,
+                                                           category=category))
+            return
+        
+        def on_done(entries):
+            self.search_job = None
+            self.history_list.set_items(entries)
+        
+        self.search_job = self.workers.submit(
+            lambda job: self.history.query(text=text, bucket=bucket, category=category),
+            on_done=on_done, on_error=lambda e: messagebox.showerror("Ошибка", str(e)))
+
+    def check_password_leaks(self):
+        passwords = self.current_passwords()
+        if not passwords:
+            messagebox.showwarning("Предупреждение", "Нет пароля для проверки")
+            return
+        if not os.path.exists(LEAKS_INDEX_PATH):
+            messagebox.showinfo("Проверка утечек",
+                               "База утечек не найдена. Создайте ее командой\n"
+                               "python pass_gen.py leaks build <дамп>")
+            return
+        
+        bloom_path = LEAKS_BLOOM_PATH if os.path.exists(LEAKS_BLOOM_PATH) else None
+        
+        def work(job):
+            with LeakIndex(LEAKS_INDEX_PATH, bloom_path) as index:
+                return sum(index.check_many(passwords))
+        
+        def on_done(leaked):
+            if leaked:
+                messagebox.showwarning("Проверка утечек",
+                                      f"Найдено в базах утечек: {leaked} из {len(passwords)}")
+            else:
+                messagebox.showinfo("Проверка утечек", 
+                                   "Пароль не найден в базах утечек данных")
+        
+        # Хэширование и поиск по индексу идут в фоновой задаче
+        self.workers.submit(work, on_done=on_done,
+                            on_error=lambda e: messagebox.showerror(
+                                "Проверка утечек", f"Не удалось проверить пароли: {e}"))
+
+    # Группы надежности для фильтра истории (см. strength_bucket)
+    HISTORY_FILTERS = {"Все": None, "Сильные": 0, "Средние": 1, "Слабые": 2}
+
+    def filter_history(self, filter_value):
+        self.filter_var.set(filter_value)
+        self.refresh_history_view()
+
+    def clear_history(self):
+        if messagebox.askyesno("Подтверждение", "Вы уверены, что хотите очистить всю историю?"):
+            # Журнал на диске очищается вместе с хранилищем
+            self.history.clear()
+            self.refresh_history_view()
+            messagebox.showinfo("Успех", "История очищена")
+
+    def type_effect(self, password):
+        self.scheduler.animate("password_output", self.type_frames(password),
+                               view="Генератор", final=lambda: self.show_passwords([password]))
+
+    def type_frames(self, password):
+        """Кадры печати пароля по одному символу"""
+        for index in range(len(password)):
+            self.password_text.delete("1.0", "end")
+            self.password_text.insert("1.0", password[:index+1])
+            yield 50
+
+    def add_visual_effects(self):
+        # Добавляем градиентный фон
+        self.window.configure(fg_color=["#1a1a1a", "#2d2d2d"])
+        
+        # Добавляем тени для всех фреймов
+        for frame in [self.sidebar, self.tab_generator, self.tab_history, self.tab_settings]:
+            frame.configure(corner_radius=10, border_width=2, border_color="#3f3f3f")
+        
+        # Анимация при наведении на кнопки
+        def on_enter(e):
+            e.widget.configure(fg_color=["#2ecc71", "#27ae60"])
+        def on_leave(e):
+            e.widget.configure(fg_color=["#3498db", "#2980b9"])
+        
+        for button in self.window.winfo_children():
+            if isinstance(button, ctk.CTkButton):
+                button.bind("<Enter>", on_enter)
+                button.bind("<Leave>", on_leave)
+
+    def setup_hotkeys(self):
+        self.window.bind("<Control-g>", lambda e: self.generate_multiple_passwords())
+        self.window.bind("<Control-c>", lambda e: self.copy_password())
+        self.window.bind("<Control-s>", lambda e: self.save_password())
+        self.window.bind("<Control-a>", lambda e: self.analyze_password())
+        self.window.bind("<Control-f>", lambda e: self.focus_search())
+
+    def focus_search(self):
+        self.show_tab("История")
+        self.search_entry.focus_set()
+
+    def show_notification(self, title, message, duration=3000):
+        # Повторы с тем же заголовком объединяются в одно уведомление
+        self.notifications.notify(title, message, duration)
+
+    def apply_profile(self, policy):
+        self.password_length.set(policy.length)
+        self.use_lowercase.set(policy.lowercase)
+        self.use_uppercase.set(policy.uppercase)
+        self.use_digits.set(policy.digits)
+        self.use_symbols.set(policy.symbols)
+        self.min_per_class = policy.min_per_class
+        self.exclude_ambiguous.set(policy.exclude_ambiguous)
+        self.exclude_chars.set(policy.exclude)
+        
+        self.update_length_indicator(policy.length)
+        self.show_notification("Профиль применен", 
+                             f"Применены настройки профиля с длиной {policy.length}")
+
+    def setup_achievements(self):
+        self.achievements = {
+            "beginner": {"name": "Новичок", "desc": "Создан первый пароль", "unlocked": False},
+            "master": {"name": "Мастер", "desc": "Создано 100 паролей", "unlocked": False},
+            "secure": {"name": "Защитник", "desc": "Создан пароль максимальной надежности", "unlocked": False},
+            "collector": {"name": "Коллекционер", "desc": "Использованы все категории", "unlocked": False}
+        }
+        
+    def check_achievements(self, password=None):
+        """Проверяет достижения пользователя"""
+        # Проверяем достижения
+        if not self.achievements["beginner"]["unlocked"]:
+            self.unlock_achievement("beginner")
+                
+        if self.generated_stats.count >= 100 and not self.achievements["master"]["unlocked"]:
+            self.unlock_achievement("master")
+                
+        if password and self.calculate_password_strength(password) == 1.0:
+            if not self.achievements["secure"]["unlocked"]:
+                self.unlock_achievement("secure")
+
+    def create_tooltip_system(self):
+        scheduler = self.scheduler
+        
+        class AnimatedTooltip:
+            def __init__(self, widget, text):
+                self.widget = widget
+                self.text = text
+                self.tooltip = None
+                self.alpha = 0.0
+                # Появление и исчезание одной подсказки заменяют друг друга
+                self.key = f"tooltip_{id(self)}"
+                self.widget.bind("<Enter>", self.show)
+                self.widget.bind("<Leave>", self.hide)
+            
+            def show(self, event=None):
+                if self.tooltip is None:
+                    x = self.widget.winfo_rootx() + self.widget.winfo_width() + 10
+                    y = self.widget.winfo_rooty() + self.widget.winfo_height() // 2
+                    
+                    self.tooltip = ctk.CTkToplevel(self.widget)
+                    self.tooltip.wm_overrideredirect(True)
+                    self.tooltip.wm_geometry(f"+{x}+{y}")
+                    self.tooltip.attributes('-alpha', self.alpha)
+                    
+                    frame = ctk.CTkFrame(self.tooltip, fg_color="#2d2d2d")
+                    frame.pack(padx=5, pady=5)
+                    
+                    label = ctk.CTkLabel(frame, text=self.text)
+                    label.pack()
+                
+                def fade_in():
+                    while self.alpha < 1.0:
+                        self.set_alpha(self.alpha + 0.1)
+                        yield 20
+                
+                scheduler.animate(self.key, fade_in(), final=lambda: self.set_alpha(1.0))
+            
+            def hide(self, event=None):
+                def fade_out():
+                    while self.alpha > 0.0:
+                        self.set_alpha(self.alpha - 0.1)
+                        yield 20
+                    self.destroy()
+                
+                if self.tooltip:
+                    scheduler.animate(self.key, fade_out(), final=self.destroy)
+            
+            def set_alpha(self, alpha):
+                self.alpha = min(1.0, max(0.0, alpha))
+                self.tooltip.attributes('-alpha', self.alpha)
+            
+            def destroy(self):
+                self.alpha = 0.0
+                if self.tooltip:
+                    self.tooltip.destroy()
+                    self.tooltip = None
+
+        # Добавляем подсказки к элементам интерфейса
+        tooltips = [
+            (self.strength_progress, "Индикатор надежности пароля"),
+            (self.password_text, "Сгенерированные пароли"),
+            # Добавьте другие элементы и их посказки
+        ]
+        
+        for widget, text in tooltips:
+            AnimatedTooltip(widget, text)
+
+    def apply_template(self, template, count=1):
+        """Применяет шаблон для генерации пароля (или count паролей списком)"""
+        passwords = compile_template(template).expand(count)
+        return passwords[0] if count == 1 else passwords
+
+    def generate_from_template(self, template):
+        """Заполняет поле вывода паролями по шаблону"""
+        try:
+            passwords = self.apply_template(template, max(1, self.num_passwords.get()))
+        except TemplateError as e:
+            messagebox.showwarning("Предупреждение", f"Ошибка в шаблоне: {e}")
+            return
+        if isinstance(passwords, str):
+            passwords = [passwords]
+        self.show_passwords(passwords)
+        self.on_passwords_generated(passwords)
+
+    def create_template_system(self):
+        template_frame = ctk.CTkFrame(self.tab_settings)
+        template_frame.pack(fill="x", pady=10, padx=5)
+        
+        ctk.CTkLabel(template_frame,
+                    text="Шаблоны паролей",
+                    font=("Roboto", 16, "bold")).pack(pady=5)
+        
+        self.templates = {
+            "PIN": "####",
+            "Слово + Число": "word####",
+            "Сложный": "Word####!@",
+            "Особый": "W####w!@"
+        }
+        
+        for name, pattern in self.templates.items():
+            frame = ctk.CTkFrame(template_frame)
+            frame.pack(fill="x", pady=2)
+            ctk.CTkLabel(frame, text=name).pack(side="left", padx=5)
+            ctk.CTkLabel(frame, text=pattern).pack(side="left", padx=5)
+            ctk.CTkButton(frame,
+                         text="Применить",
+                         command=lambda p=pattern: self.generate_from_template(p)).pack(side="right", padx=5)
+
+    def setup_achievements_system(self):
+        self.level = 0
+        self.xp = 0
+        self.achievements_frame = ctk.CTkFrame(self.sidebar)
+        self.achievements_frame.pack(fill="x", pady=10, padx=5)
+        
+        self.level_label = ctk.CTkLabel(self.achievements_frame, 
+                                       text="Уровень: 0",
+                                       font=("Roboto", 14, "bold"))
+        self.level_label.pack()
+        
+        self.xp_progress = ctk.CTkProgressBar(self.achievements_frame, width=150)
+        self.xp_progress.pack(pady=5)
+        self.xp_progress.set(0)
+        
+        def add_xp(amount):
+            self.xp += amount
+            level_threshold = (self.level + 1) * 100
+            level_before = self.level
+            # За один пакет паролей можно получить несколько уровней
+            while self.xp >= level_threshold:
+                self.level += 1
+                self.xp = self.xp - level_threshold
+                level_threshold = (self.level + 1) * 100
+            if self.level != level_before:
+                self.level_label.configure(text=f"Уровень: {self.level}")
+                self.show_notification("Новый уровень!", f"Достигнут уровень {self.level}")
+            
+            self.xp_progress.set(self.xp / level_threshold)
+        
+        self.add_xp = add_xp
+
+    def create_animated_strength_meter(self):
+        strength_frame = ctk.CTkFrame(self.tab_generator)
+        strength_frame.pack(fill="x", padx=20, pady=10)
+        
+        self.strength_canvas = ctk.CTkCanvas(strength_frame, height=40, bg="#2d2d2d")
+        self.strength_canvas.pack(fill="x", pady=5)
+        # Сегменты создаются один раз, анимация только меняет их видимость
+        segments = 20
+        self.strength_meter = SegmentMeter(self.strength_canvas, segments)
+        
+        def animate_strength(strength, instant=False):
+            """Анимирует индикатор надежности пароля"""
+            target = int(strength * segments)
+            
+            def animate_frame():
+                # Движемся от текущего положения, в том числе вниз
+                current = self.strength_meter.lit
+                step = 0.5 if target >= current else -0.5
+                while int(current) != target:
+                    current += step
+                    self.strength_meter.set(current)
+                    yield 50
+            
+            # Новая оценка отменяет еще не закончившуюся анимацию
+            self.scheduler.animate("strength_meter", animate_frame(), view="Генератор",
+                                   final=lambda: self.strength_meter.set(target),
+                                   instant=instant)
+            
+        # Сохраняем функцию как атрибут класса
+        self.animate_strength = animate_strength
+        # Инициализируем с нулевой силой пароля
+        self.animate_strength(0)
+
+    def create_template_preview(self):
+        preview_frame = ctk.CTkFrame(self.tab_generator)
+        preview_frame.pack(fill="x", padx=20, pady=10)
+        
+        ctk.CTkLabel(preview_frame, 
+                    text="Предпросмотр шаблона",
+                    font=("Roboto", 14, "bold")).pack()
+        
+        self.preview_text = ctk.CTkTextbox(preview_frame, height=60)
+        self.preview_text.pack(fill="x", pady=5)
+        
+        def update_preview(template):
+            try:
+                previews = self.apply_template(template, 3)  # Показываем 3 варианта
+            except TemplateError as e:
+                previews = [f"Ошибка в шаблоне: {e}"]
+            
+            self.preview_text.delete("1.0", "end")
+            self.preview_text.insert("1.0", "\n".join(previews))
+        
+        self.update_template_preview = update_preview
+
+    def create_animated_statistics(self):
+        stats_frame = ctk.CTkFrame(self.tab_history)
+        stats_frame.pack(fill="x", pady=10, padx=5)
+        
+        self.stats_canvas = ctk.CTkCanvas(stats_frame, height=200, bg="#2d2d2d")
+        self.stats_canvas.pack(fill="x", pady=5)
+        # [сильные, средние, слабые]; столбцы двигаются через coords
+        self.stats_bars = BarChart(self.stats_canvas, 3)
+        
+        @metrics.timed("stats.refresh")
+        def animate_stats():
+            data = self.get_password_statistics()  # Получаем статистику
+            targets = [int(value * 150) for value in data]
+            bars = self.stats_bars
+            # Перерисовываются только изменившиеся столбцы
+            changed = [i for i, target in enumerate(targets) if bars.heights[i] != target]
+            if not changed:
+                return
+            
+            def animate_bar():
+                for index in changed:
+                    height, target = bars.heights[index], targets[index]
+                    step = 5 if target > height else -5
+                    while abs(target - height) > 5:
+                        height += step
+                        bars.set_height(index, height)
+                        yield 16
+                    bars.set_height(index, target)
+                    yield 100
+            
+            def final():
+                for index in changed:
+                    bars.set_height(index, targets[index])
+            
+            self.scheduler.animate("stats_bars", animate_bar(), view="История", final=final)
+        
+        # Обновляем каждые 5 секунд, пока вкладка истории открыта
+        self.scheduler.every("stats_refresh", 5000, animate_stats, view="История")
+
+    def get_password_statistics(self):
+        """Возвращает статистику паролей для анимированного графика"""
+        # [процент сильных, процент средних, процент слабых паролей]
+        return self.history.strength_distribution()
+
+    def unlock_achievement(self, achievement_id):
+        """Разблокирует достижение и показывает уведомление"""
+        if achievement_id in self.achievements and not self.achievements[achievement_id]["unlocked"]:
+            self.achievements[achievement_id]["unlocked"] = True
+            achievement = self.achievements[achievement_id]
+            self.show_notification(
+                f"🏆 Получено достижение: {achievement['name']}", 
+                achievement['desc']
+            )
+            # Добавляем бонусный опыт за достижение
+            self.add_xp(50)  # Бонус 50 XP за каждое достижение
@@ -0,0 +1,221 @@
+"""Хранилище истории паролей в памяти"""
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime
+import threading
+
+from . import metrics
+from .search import TrigramIndex
+from .stats import StatsAggregator, strength_bucket
+from .strength import calculate_password_strength
+
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+# Сколько раз load() перечитывает журнал без блокировки, если хранилище
+# менялось во время чтения
+LOAD_ATTEMPTS = 3
+
+
+@dataclass
+class HistoryEntry:
+    id: int
+    password: str
+    category: str
+    date: str
+    strength: float
+    # Группа надежности назначается один раз при создании записи
+    bucket: int = field(init=False)
+
+    def __post_init__(self):
+        self.bucket = strength_bucket(self.strength)
+
+    def to_dict(self):
+        # Явный словарь: asdict рекурсивно копирует поля и заметно медленнее
+        return {"password": self.password, "category": self.category,
+                "date": self.date, "strength": self.strength}
+
+    def format_line(self):
+        """Строка для отображения в текстовом поле истории"""
+        return f"{self.date} - {self.password}: {self.category}"
+
+
+class HistoryStore:
+    """Типизированные записи истории с запросами без разбора текста
+
+    Если передан журнал (storage.HistoryLog), записи загружаются из него
+    при создании (или позже через load() при load=False) и дописываются в
+    него при добавлении. Изменения и запросы выполняются под блокировкой,
+    поэтому искать и загружать можно из фонового потока; загрузка держит
+    блокировку только на время подмены готовых структур. Запись в журнал
+    тоже идет под блокировкой, чтобы порядок в файле совпадал с памятью.
+    """
+
+    def __init__(self, log=None, load=True):
+        self._entries = {}
+        self._next_id = 0
+        self.stats = StatsAggregator()
+        self.index = TrigramIndex()
+        # Идентификаторы записей по группам надежности и категориям
+        self._bucket_ids = [[], [], []]
+        self._category_ids = {}
+        self._lock = threading.RLock()
+        # Меняется при каждом add_many() и clear(): по нему load() узнает,
+        # что прочитанный журнал устарел
+        self._generation = 0
+        self.log = log
+        if log is not None and load:
+            self.load()
+
+    def load(self):
+        """Загружает записи из журнала
+
+        Журнал читается и индексируется в отдельное хранилище без
+        блокировки, затем структуры подменяются под блокировкой. Записи,
+        уже добавленные в хранилище, повторно не вставляются: повторный
+        load() ничего не дублирует, а добавленные во время загрузки
+        записи сохраняются после записей журнала. Если за время чтения
+        хранилище изменилось (clear() или add_many()), прочитанное
+        отбрасывается и журнал читается заново; после LOAD_ATTEMPTS
+        попыток последнее чтение идет под блокировкой.
+        """
+        with metrics.span("history.load"):
+            for _ in range(LOAD_ATTEMPTS):
+                with self._lock:
+                    generation = self._generation
+                fresh = self._read_log()
+                with self._lock:
+                    if self._generation == generation:
+                        self._merge(fresh)
+                        return
+            with self._lock:
+                self._merge(self._read_log())
+
+    def _read_log(self):
+        fresh = HistoryStore()
+        for record in self.log.load():
+            fresh._insert(record["password"], record["category"],
+                          record["date"], record.get("strength"))
+        return fresh
+
+    def _merge(self, fresh):
+        # Вызывается под self._lock
+        loaded = Counter(fresh._key(e) for e in fresh._entries.values())
+        for entry in list(self._entries.values()):
+            key = self._key(entry)
+            if loaded[key]:
+                loaded[key] -= 1
+            else:
+                fresh._insert(entry.password, entry.category, entry.date,
+                              entry.strength)
+        self._entries = fresh._entries
+        self._next_id = fresh._next_id
+        self.stats = fresh.stats
+        self.index = fresh.index
+        self._bucket_ids = fresh._bucket_ids
+        self._category_ids = fresh._category_ids
+
+    @staticmethod
+    def _key(entry):
+        return entry.password, entry.category, entry.date
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __iter__(self):
+        return iter(self._entries.values())
+
+    def snapshot(self):
+        """Список записей на текущий момент для обхода из другого потока"""
+        with self._lock:
+            return list(self._entries.values())
+
+    def get(self, entry_id):
+        return self._entries[entry_id]
+
+    def _insert(self, password, category, date, strength):
+        if strength is None:
+            strength = calculate_password_strength(password)
+        entry = HistoryEntry(self._next_id, password, category, date, strength)
+        self._entries[entry.id] = entry
+        self._next_id += 1
+        self.stats.add(strength, category)
+        self.index.add(entry.id, password, category)
+        self._bucket_ids[entry.bucket].append(entry.id)
+        self._category_ids.setdefault(category, []).append(entry.id)
+        return entry
+
+    def add(self, password, category, date=None, strength=None):
+        """Добавляет запись; надежность вычисляется один раз при вставке"""
+        return self.add_many([password], category, date, strength)[0]
+
+    def add_many(self, passwords, category, date=None, strength=None):
+        """Добавляет пакет записей одной дозаписью в журнал"""
+        if date is None:
+            date = datetime.now().strftime(DATE_FORMAT)
+        with self._lock:
+            self._generation += 1
+            entries = [self._insert(p, category, date, strength) for p in passwords]
+            if self.log is not None:
+                self.log.append([e.to_dict() for e in entries])
+        return entries
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self.stats.reset()
+            self.index.clear()
+            self._bucket_ids = [[], [], []]
+            self._category_ids = {}
+            if self.log is not None:
+                self.log.compact([])
+
+    def close(self):
+        if self.log is not None:
+            self.log.close()
+
+    def search_ids(self, text):
+        """Идентификаторы записей, у которых пароль или категория содержат text"""
+        with self._lock, metrics.span("history.search"):
+            return self.index.search(text)
+
+    def query_ids(self, text=None, bucket=None, category=None):
+        """Идентификаторы записей, подходящих под все заданные условия
+
+        Перебирается только самый короткий из списков кандидатов (группа,
+        категория или результат поиска), поэтому время пропорционально
+        размеру результата, а не всей истории.
+        """
+        with self._lock, metrics.span("history.query"):
+            lists = []
+            if bucket is not None:
+                lists.append(self._bucket_ids[bucket])
+            if category is not None:
+                lists.append(self._category_ids.get(category, []))
+            text_ids = self.index.search(text) if text else None
+            if text_ids is not None:
+                lists.append(text_ids)
+            if not lists:
+                return list(self._entries)
+
+            smallest = min(lists, key=len)
+            if len(lists) == 1:
+                return list(smallest)
+            text_set = set(text_ids) if text_ids is not None and smallest is not text_ids else None
+            entries = self._entries
+            return [i for i in smallest
+                    if (bucket is None or entries[i].bucket == bucket)
+                    and (category is None or entries[i].category == category)
+                    and (text_set is None or i in text_set)]
+
+    def query(self, text=None, bucket=None, category=None):
+        """Возвращает записи, подходящие под все заданные условия"""
+        with self._lock:
+            entries = self._entries
+            return [entries[i] for i in self.query_ids(text, bucket, category)]
+
+    def category_counts(self):
+        return dict(self.stats.categories)
+
+    def strength_distribution(self):
+        """Доли сильных, средних и слабых паролей"""
+        return self.stats.bucket_fractions()
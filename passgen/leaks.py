@@ -0,0 +1,198 @@
+"""Офлайн-проверка паролей по базам утечек в формате Have I Been Pwned
+
+Дамп вида "SHA1:COUNT" один раз преобразуется в отсортированный файл
+префиксов хэшей фиксированной ширины. При проверке файл открывается через
+mmap и просматривается двоичным поиском, поэтому даже многогигабайтная
+база не читается в память целиком.
+"""
+import hashlib
+import heapq
+import mmap
+import os
+import struct
+import tempfile
+
+from .bloom import BloomFilter
+
+LEAKS_INDEX_PATH = "leaks.bin"
+LEAKS_BLOOM_PATH = "leaks.bloom"
+
+_MAGIC = b"PGLEAKS1"
+_HEADER = struct.Struct("<8sI4x")
+DEFAULT_PREFIX_BYTES = 8
+SHA1_BYTES = 20
+
+
+def check_prefix_bytes(width):
+    if not 1 <= width <= SHA1_BYTES:
+        raise ValueError(f"Ширина префикса должна быть от 1 до {SHA1_BYTES} байт: {width}")
+
+
+def sha1_digest(password):
+    return hashlib.sha1(password.encode("utf-8")).digest()
+
+
+def _read_dump(dump_path, width):
+    """Префиксы хэшей из дампа; строки без хэша пропускаются"""
+    with open(dump_path, "r", encoding="ascii", errors="ignore") as f:
+        for line in f:
+            line = line.strip()
+            if len(line) < 40:
+                continue
+            try:
+                yield bytes.fromhex(line[:40])[:width]
+            except ValueError:
+                continue
+
+
+def _sorted_runs(prefixes, chunk_records, tmp_dir):
+    """Внешняя сортировка: отсортированные порции во временных файлах"""
+    runs = []
+    chunk = []
+    for prefix in prefixes:
+        chunk.append(prefix)
+        if len(chunk) >= chunk_records:
+            runs.append(_write_run(sorted(chunk), tmp_dir))
+            chunk = []
+    if chunk or not runs:
+        runs.append(_write_run(sorted(chunk), tmp_dir))
+    return runs
+
+
+def _write_run(chunk, tmp_dir):
+    f = tempfile.TemporaryFile(dir=tmp_dir)
+    f.write(b"".join(chunk))
+    f.seek(0)
+    return f
+
+
+def _iter_run(f, width):
+    while True:
+        record = f.read(width)
+        if len(record) < width:
+            return
+        yield record
+
+
+def build_index(dump_path, index_path=LEAKS_INDEX_PATH, bloom_path=None,
+                prefix_bytes=DEFAULT_PREFIX_BYTES, fp_rate=0.01, chunk_records=5000000):
+    """Преобразует дамп в индекс (и, при желании, фильтр Блума)
+
+    Возвращает количество уникальных префиксов в индексе.
+    """
+    check_prefix_bytes(prefix_bytes)
+    tmp_dir = os.path.dirname(os.path.abspath(index_path))
+    runs = _sorted_runs(_read_dump(dump_path, prefix_bytes), chunk_records, tmp_dir)
+    count = 0
+    tmp_path = index_path + ".tmp"
+    try:
+        with open(tmp_path, "wb") as out:
+            out.write(_HEADER.pack(_MAGIC, prefix_bytes))
+            previous = None
+            merged = heapq.merge(*[_iter_run(f, prefix_bytes) for f in runs])
+            for record in merged:
+                if record != previous:
+                    out.write(record)
+                    count += 1
+                    previous = record
+        os.replace(tmp_path, index_path)
+    finally:
+        for f in runs:
+            f.close()
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    if bloom_path:
+        with LeakIndex(index_path) as index:
+            bloom = BloomFilter(count, fp_rate)
+            for record in index:
+                bloom.add(record)
+        bloom.save(bloom_path)
+    return count
+
+
+class LeakIndex:
+    """Отсортированный файл префиксов SHA-1, открытый через mmap"""
+
+    def __init__(self, path=LEAKS_INDEX_PATH, bloom_path=None):
+        with open(path, "rb") as f:
+            header = f.read(_HEADER.size)
+            if len(header) < _HEADER.size or header[:len(_MAGIC)] != _MAGIC:
+                raise ValueError(f"{path}: не файл индекса утечек")
+            _, width = _HEADER.unpack(header)
+            check_prefix_bytes(width)
+            size = os.fstat(f.fileno()).st_size
+            if (size - _HEADER.size) % width:
+                raise ValueError(f"{path}: индекс утечек поврежден (оборван)")
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size > _HEADER.size else None
+        self.width = width
+        self.count = (size - _HEADER.size) // width
+        self.bloom = None
+        self.bloom_rejections = 0
+        if bloom_path:
+            try:
+                self.bloom = BloomFilter.load(bloom_path)
+            except BaseException:
+                self.close()
+                raise
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        for i in range(self.count):
+            yield self._record(i)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if self.bloom is not None and isinstance(self.bloom.bits, memoryview):
+            self.bloom.bits.release()
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+
+    def _record(self, i):
+        offset = _HEADER.size + i * self.width
+        return self._mm[offset:offset + self.width]
+
+    def _bisect(self, prefix, lo=0):
+        hi = self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._record(mid) < prefix:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def contains_digest(self, digest):
+        """Проверяет SHA-1 (20 байт) по индексу"""
+        prefix = digest[:self.width]
+        if self.bloom is not None and prefix not in self.bloom:
+            self.bloom_rejections += 1
+            return False
+        i = self._bisect(prefix)
+        return i < self.count and self._record(i) == prefix
+
+    def is_leaked(self, password):
+        return self.contains_digest(sha1_digest(password))
+
+    def check_many(self, passwords):
+        """Проверяет пакет паролей; поиск идет по отсортированным хэшам"""
+        prefixes = [sha1_digest(p)[:self.width] for p in passwords]
+        result = [False] * len(prefixes)
+        lo = 0
+        for i in sorted(range(len(prefixes)), key=prefixes.__getitem__):
+            prefix = prefixes[i]
+            if self.bloom is not None and prefix not in self.bloom:
+                self.bloom_rejections += 1
+                continue
+            # Хэши отсортированы, поэтому нижняя граница только растет
+            lo = self._bisect(prefix, lo)
+            result[i] = lo < self.count and self._record(lo) == prefix
+        return result
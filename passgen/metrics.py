@@ -0,0 +1,154 @@
+"""Счетчики и гистограммы задержек для основных операций
+
+Сбор выключен по умолчанию; в выключенном состоянии timed() и span()
+сводятся к одной проверке флага. Включается через enable(), ключ
+командной строки --metrics или флажок диагностики в настройках.
+"""
+import functools
+import threading
+from bisect import bisect_left
+from time import perf_counter
+
+# Верхние границы корзин гистограммы в секундах
+BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+_enabled = False
+_lock = threading.Lock()
+_counters = {}
+_histograms = {}  # имя -> [счетчики по корзинам + +Inf, сумма, количество]
+
+
+def enable():
+    global _enabled
+    _enabled = True
+
+
+def disable():
+    global _enabled
+    _enabled = False
+
+
+def is_enabled():
+    return _enabled
+
+
+def reset():
+    with _lock:
+        _counters.clear()
+        _histograms.clear()
+
+
+def count(name, n=1):
+    if not _enabled:
+        return
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + n
+
+
+def observe(name, seconds):
+    """Добавляет длительность в гистограмму name"""
+    if not _enabled:
+        return
+    with _lock:
+        histogram = _histograms.get(name)
+        if histogram is None:
+            histogram = _histograms[name] = [[0] * (len(BUCKETS) + 1), 0.0, 0]
+        histogram[0][bisect_left(BUCKETS, seconds)] += 1
+        histogram[1] += seconds
+        histogram[2] += 1
+
+
+def timed(name):
+    """Декоратор: время каждого вызова попадает в гистограмму name"""
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                observe(name, perf_counter() - start)
+        return wrapper
+    return decorate
+
+
+class _Span:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        observe(self.name, perf_counter() - self.start)
+        return False
+
+
+class _NullSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def span(name):
+    """Контекстный менеджер для замера участка кода"""
+    return _Span(name) if _enabled else _NULL_SPAN
+
+
+def snapshot():
+    """Текущие значения в виде словаря, пригодного для JSON"""
+    with _lock:
+        histograms = {}
+        for name, (buckets, total, n) in _histograms.items():
+            histograms[name] = {
+                "count": n,
+                "sum": total,
+                "buckets": dict(zip([str(b) for b in BUCKETS] + ["+Inf"], buckets)),
+            }
+        return {"counters": dict(_counters), "histograms": histograms}
+
+
+def _metric_name(name):
+    return "passgen_" + name.replace(".", "_").replace("-", "_")
+
+
+def to_prometheus():
+    """Значения в текстовом формате Prometheus"""
+    data = snapshot()
+    lines = []
+    for name, value in sorted(data["counters"].items()):
+        metric = _metric_name(name) + "_total"
+        lines.append(f"# TYPE {metric} counter")
+        lines.append(f"{metric} {value}")
+    for name, histogram in sorted(data["histograms"].items()):
+        metric = _metric_name(name) + "_seconds"
+        lines.append(f"# TYPE {metric} histogram")
+        cumulative = 0
+        for bound, n in histogram["buckets"].items():
+            cumulative += n
+            lines.append(f'{metric}_bucket{{le="{bound}"}} {cumulative}')
+        lines.append(f"{metric}_sum {histogram['sum']:.6f}")
+        lines.append(f"{metric}_count {histogram['count']}")
+    return "\n".join(lines) + "\n"
+
+
+def to_json():
+    import json
+    return json.dumps(snapshot(), ensure_ascii=False, indent=2)
+
+
+def dump(path):
+    """Записывает метрики в файл: .prom и .txt - Prometheus, иначе JSON"""
+    text = to_prometheus() if path.endswith((".prom", ".txt")) else to_json()
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
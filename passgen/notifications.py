@@ -0,0 +1,110 @@
+"""Всплывающие уведомления с очередью и одним переиспользуемым окном"""
+import time
+from collections import OrderedDict
+
+import customtkinter as ctk
+
+from . import metrics
+
+
+class NotificationManager:
+    """Показывает уведомления по одному в одном и том же окне
+
+    Уведомления с одинаковым заголовком объединяются: показывается
+    последнее сообщение и счетчик ("Отличный пароль! ×1000"). Очередь
+    ограничена maxlen заголовками, при переполнении отбрасываются самые
+    старые. Между показами выдерживается пауза min_interval мс, поэтому
+    стоимость не зависит от числа вызовов notify.
+    """
+
+    def __init__(self, window, maxlen=5, min_interval=300):
+        self.window = window
+        self.maxlen = maxlen
+        self.min_interval = min_interval
+        self.dropped = 0
+        self._queue = OrderedDict()  # заголовок -> [сообщение, количество, длительность]
+        self._current = None
+        self._hide_job = None
+        self._pump_job = None
+        self._last_hidden = 0.0
+        self._toast = None
+
+    def notify(self, title, message, duration=3000):
+        current = self._current
+        if current is not None and current[0] == title:
+            # Такое же уведомление уже на экране: обновляем его на месте
+            current[1] = message
+            current[2] += 1
+            metrics.count("notifications.merged")
+            self._render()
+            return
+        pending = self._queue.get(title)
+        if pending is not None:
+            pending[0] = message
+            pending[1] += 1
+            metrics.count("notifications.merged")
+        else:
+            if len(self._queue) >= self.maxlen:
+                self._queue.popitem(last=False)
+                self.dropped += 1
+                metrics.count("notifications.dropped")
+            self._queue[title] = [message, 1, duration]
+        self._pump()
+
+    def _pump(self):
+        if self._current is not None or self._pump_job is not None or not self._queue:
+            return
+        wait = self._last_hidden + self.min_interval / 1000 - time.monotonic()
+        if wait > 0:
+            self._pump_job = self.window.after(int(wait * 1000) + 1, self._on_pump_timer)
+            return
+        title, (message, count, duration) = self._queue.popitem(last=False)
+        self._current = [title, message, count]
+        metrics.count("notifications.shown")
+        self._show(duration)
+
+    def _on_pump_timer(self):
+        self._pump_job = None
+        self._pump()
+
+    def _create_toast(self):
+        toast = ctk.CTkToplevel(self.window)
+        toast.title("")
+        toast.overrideredirect(True)
+        self._title_label = ctk.CTkLabel(toast, text="", font=("Roboto", 14, "bold"))
+        self._title_label.pack(pady=5)
+        self._message_label = ctk.CTkLabel(toast, text="")
+        self._message_label.pack(pady=5)
+        return toast
+
+    def _render(self):
+        title, message, count = self._current
+        self._title_label.configure(text=f"{title} ×{count}" if count > 1 else title)
+        self._message_label.configure(text=message)
+
+    def _show(self, duration):
+        if self._toast is None:
+            self._toast = self._create_toast()
+        self._render()
+        self._toast.geometry("300x100+{}+{}".format(
+            self.window.winfo_x() + self.window.winfo_width() - 320,
+            self.window.winfo_y() + 20
+        ))
+        self._toast.deiconify()
+        self._toast.lift()
+        self._hide_job = self.window.after(duration, self._hide)
+
+    def _hide(self):
+        self._hide_job = None
+        self._current = None
+        self._toast.withdraw()
+        self._last_hidden = time.monotonic()
+        self._pump()
+
+    def close(self):
+        for job in (self._hide_job, self._pump_job):
+            if job is not None:
+                self.window.after_cancel(job)
+        if self._toast is not None:
+            self._toast.destroy()
+            self._toast = None
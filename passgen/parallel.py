@@ -0,0 +1,74 @@
+"""Параллельная генерация больших пакетов паролей на нескольких ядрах"""
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+from .bulk import DEFAULT_CHUNK_SIZE, check_chunk_size
+from .engine import generate_batch
+
+# Начиная с этого размера пакета запуск пула процессов окупается
+PARALLEL_THRESHOLD = 100000
+
+
+def _generate_chunk(policy, n):
+    return generate_batch(policy, n)
+
+
+def _mp_context():
+    """Контекст запуска процессов-исполнителей без fork
+
+    В интерфейсе пул создается, пока рабочие потоки могут держать
+    блокировки (например, пула энтропии); копия захваченной блокировки
+    в дочернем процессе после fork никогда не освободится.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+def _chunk_sizes(total, chunk_size):
+    check_chunk_size(chunk_size)
+    full, rest = divmod(total, chunk_size)
+    sizes = [chunk_size] * full
+    if rest:
+        sizes.append(rest)
+    return sizes
+
+
+def iter_parallel_chunks(policy, total, chunk_size=DEFAULT_CHUNK_SIZE, workers=None,
+                         ordered=True):
+    """Генерирует пароли порциями в пуле процессов
+
+    При ordered=True порции возвращаются в порядке отправки, иначе по мере
+    готовности. В работе одновременно не больше двух порций на процесс,
+    поэтому расход памяти не зависит от total.
+    """
+    workers = workers or os.cpu_count() or 1
+    sizes = deque(_chunk_sizes(total, chunk_size))
+    max_in_flight = workers * 2
+
+    with ProcessPoolExecutor(max_workers=workers, mp_context=_mp_context()) as pool:
+        in_flight = deque()
+
+        def submit():
+            while sizes and len(in_flight) < max_in_flight:
+                in_flight.append(pool.submit(_generate_chunk, policy, sizes.popleft()))
+
+        submit()
+        while in_flight:
+            if ordered:
+                yield in_flight.popleft().result()
+            else:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    in_flight.remove(future)
+                    yield future.result()
+            submit()
+
+
+def generate_parallel(policy, n, workers=None, chunk_size=DEFAULT_CHUNK_SIZE, ordered=True):
+    """Генерирует n паролей в пуле процессов и возвращает их списком"""
+    passwords = []
+    for chunk in iter_parallel_chunks(policy, n, chunk_size, workers, ordered):
+        passwords.extend(chunk)
+    return passwords
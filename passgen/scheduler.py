@@ -0,0 +1,172 @@
+"""Общий планировщик кадров для анимаций и периодических обновлений"""
+import time
+
+from . import metrics
+
+
+class _Task:
+    __slots__ = ("frames", "view", "due", "final", "interval")
+
+    def __init__(self, frames, view, due, final=None, interval=0):
+        self.frames = frames
+        self.view = view
+        self.due = due
+        self.final = final
+        self.interval = interval
+
+
+class FrameScheduler:
+    """Один цикл after вместо множества независимых цепочек
+
+    Анимация - генератор, который за один шаг рисует кадр и отдает
+    задержку до следующего кадра в миллисекундах (None - один кадр).
+    Задачи идентифицируются ключом: новая анимация с тем же ключом
+    отменяет предыдущую. Задачи с view выполняются, только когда
+    is_visible(view) истинно; скрытые анимации ставятся на паузу, а
+    периодические обновления выполняются при возвращении на вкладку.
+    Запросы перерисовки с одним ключом за кадр объединяются. Если за кадр
+    работа не уложилась в budget_ms, остаток переносится на следующий кадр.
+    В режиме reduced_motion анимации сразу доводятся до конца.
+    """
+
+    def __init__(self, window, fps=60, budget_ms=8, is_visible=None):
+        self.window = window
+        self.frame_ms = max(1, int(1000 / fps))
+        self.budget = budget_ms / 1000
+        self.is_visible = is_visible or (lambda view: True)
+        self.reduced_motion = False
+        self._animations = {}
+        self._periodic = {}
+        self._redraws = {}
+        self._scheduled = None
+
+    # Регистрация задач
+
+    def animate(self, key, frames, view=None, final=None, instant=False):
+        """Запускает анимацию frames, отменяя предыдущую с тем же ключом
+
+        final() вызывается вместо оставшихся кадров, если анимация
+        пропускается; без final генератор прокручивается до конца сразу.
+        """
+        self.cancel(key)
+        if self.reduced_motion or instant:
+            self._finish(_Task(frames, view, 0, final))
+            return
+        self._animations[key] = _Task(frames, view, 0, final)
+        self._wake()
+
+    def every(self, key, interval_ms, callback, view=None, immediate=True):
+        """Периодический вызов callback() раз в interval_ms"""
+        self.cancel(key)
+        due = 0 if immediate else time.monotonic() + interval_ms / 1000
+        self._periodic[key] = _Task(callback, view, due, interval=interval_ms / 1000)
+        self._wake()
+
+    def request_redraw(self, key, callback):
+        """Перерисовка в следующем кадре; повторные запросы объединяются"""
+        self._redraws[key] = callback
+        self._wake()
+
+    def cancel(self, key):
+        self._animations.pop(key, None)
+        self._periodic.pop(key, None)
+        self._redraws.pop(key, None)
+
+    def set_reduced_motion(self, enabled):
+        """Включает режим без анимаций и доводит текущие до конца"""
+        self.reduced_motion = enabled
+        if enabled:
+            animations, self._animations = self._animations, {}
+            for task in animations.values():
+                self._finish(task)
+
+    def view_shown(self):
+        """Вызывается при переключении вкладки, чтобы не ждать следующего кадра"""
+        self._wake()
+
+    # Цикл кадров
+
+    def _wake(self):
+        if self._scheduled is None:
+            self._scheduled = self.window.after(self.frame_ms, self._tick)
+
+    def _finish(self, task):
+        if task.final is not None:
+            task.final()
+        else:
+            for _ in task.frames:
+                pass
+
+    def _tick(self):
+        self._scheduled = None
+        try:
+            with metrics.span("scheduler.frame"):
+                self._run_frame()
+        except Exception:
+            # Исключение в задаче не должно останавливать цикл кадров
+            self._reschedule({})
+            raise
+
+    def _run_frame(self):
+        started = now = time.monotonic()
+        deadline = started + self.budget
+        visible = {}
+
+        def shown(view):
+            if view is None:
+                return True
+            if view not in visible:
+                visible[view] = self.is_visible(view)
+            return visible[view]
+
+        # Перерисовки выполняются всегда: их запросили по действию пользователя
+        redraws, self._redraws = self._redraws, {}
+        for callback in redraws.values():
+            with metrics.span("scheduler.redraw"):
+                callback()
+
+        for key, task in list(self._periodic.items()):
+            if time.monotonic() >= deadline:
+                break
+            if task.due <= now and shown(task.view):
+                task.due = now + task.interval
+                with metrics.span("scheduler.periodic"):
+                    task.frames()
+
+        for key, task in list(self._animations.items()):
+            if time.monotonic() >= deadline:
+                break
+            if task.due > now or not shown(task.view):
+                continue
+            if self._animations.get(key) is not task:
+                continue  # заменена во время этого кадра
+            try:
+                with metrics.span("scheduler.animation"):
+                    delay = next(task.frames)
+            except StopIteration:
+                del self._animations[key]
+                continue
+            task.due = now + (delay or self.frame_ms) / 1000
+            # Отработавшие задачи уходят в конец очереди, чтобы при
+            # нехватке бюджета не голодали остальные
+            if self._animations.get(key) is task:
+                del self._animations[key]
+                self._animations[key] = task
+
+        self._reschedule(visible)
+
+    def _reschedule(self, visible):
+        """Планирует следующий кадр, только если есть что выполнять"""
+        if self._scheduled is not None:
+            return  # кадр уже запрошен из задачи через _wake
+        if self._redraws:
+            self._wake()
+            return
+        pending = [t for t in list(self._animations.values()) + list(self._periodic.values())
+                   if t.view is None or visible.get(t.view, self.is_visible(t.view))]
+        if not pending:
+            # Все оставшиеся задачи на скрытых вкладках: ждем view_shown
+            return
+        delay = min(t.due for t in pending) - time.monotonic()
+        ms = max(self.frame_ms, int(delay * 1000))
+        self._scheduled = self.window.after(ms, self._tick)
@@ -0,0 +1,63 @@
+"""Инвертированный триграммный индекс для поиска подстрок в истории"""
+
+# Разделитель полей: подстрока запроса не может перейти через границу полей
+_FIELD_SEP = "\x00"
+
+
+def trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class TrigramIndex:
+    """Поиск подстрок без учета регистра по нескольким полям записи
+
+    Кандидаты находятся пересечением списков вхождений триграмм запроса,
+    затем проверяются по сохраненному тексту. Запросы короче трех символов
+    проверяются перебором.
+    """
+
+    def __init__(self):
+        self._postings = {}
+        self._docs = {}
+
+    def __len__(self):
+        return len(self._docs)
+
+    def add(self, doc_id, *fields):
+        fields = [f.lower() for f in fields]
+        self._docs[doc_id] = _FIELD_SEP.join(fields)
+        postings = self._postings
+        grams = set()
+        for field in fields:
+            grams |= trigrams(field)
+        for gram in grams:
+            ids = postings.get(gram)
+            if ids is None:
+                postings[gram] = {doc_id}
+            else:
+                ids.add(doc_id)
+
+    def clear(self):
+        self._postings.clear()
+        self._docs.clear()
+
+    def search(self, query):
+        """Возвращает отсортированные идентификаторы записей с подстрокой query"""
+        query = query.lower()
+        docs = self._docs
+        if len(query) < 3:
+            return [doc_id for doc_id, text in docs.items() if query in text]
+
+        postings = []
+        for gram in trigrams(query):
+            ids = self._postings.get(gram)
+            if not ids:
+                return []
+            postings.append(ids)
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for ids in postings[1:]:
+            candidates &= ids
+            if not candidates:
+                return []
+        return sorted(doc_id for doc_id in candidates if query in docs[doc_id])
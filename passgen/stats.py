@@ -0,0 +1,48 @@
+"""Инкрементальная статистика по паролям"""
+
+
+def strength_bucket(strength):
+    """Относит надежность к группе: 0 - сильные, 1 - средние, 2 - слабые"""
+    if strength >= 0.8:
+        return 0
+    if strength >= 0.5:
+        return 1
+    return 2
+
+
+class StatsAggregator:
+    """Счетчики, группы надежности, категории и средняя надежность
+
+    Каждое событие обновляет агрегаты за O(1); среднее хранится как точная
+    сумма, а не восстанавливается из округленного текста метки.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.count = 0
+        self.strength_sum = 0.0
+        self.buckets = [0, 0, 0]
+        self.categories = {}
+
+    def add(self, strength, category=None):
+        self.count += 1
+        self.strength_sum += strength
+        self.buckets[strength_bucket(strength)] += 1
+        if category is not None:
+            self.categories[category] = self.categories.get(category, 0) + 1
+
+    def add_many(self, strengths, category=None):
+        for strength in strengths:
+            self.add(strength, category)
+
+    @property
+    def mean_strength(self):
+        return self.strength_sum / self.count if self.count else 0.0
+
+    def bucket_fractions(self):
+        """Доли сильных, средних и слабых паролей"""
+        if not self.count:
+            return [0, 0, 0]
+        return [n / self.count for n in self.buckets]
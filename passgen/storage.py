@@ -0,0 +1,133 @@
+"""Журнал истории паролей: дозапись в JSONL с пакетным fsync"""
+import json
+import os
+import threading
+import time
+
+HISTORY_PATH = "password_history.jsonl"
+LEGACY_HISTORY_PATH = "password_history.json"
+
+
+class HistoryLog:
+    """Файл истории, в который записи только дописываются
+
+    fsync выполняется раз в fsync_every записей или раз в fsync_interval
+    секунд, поэтому при сбое теряется не больше одного пакета. Перезапись
+    файла (очистка, удаление оборванных строк) идет через временный файл
+    и os.replace, так что журнал всегда либо старый, либо новый целиком.
+    Все операции с файлом выполняются под блокировкой: журнал пишут и
+    поток интерфейса, и фоновая загрузка, которая чинит оборванный хвост.
+    """
+
+    def __init__(self, path=HISTORY_PATH, fsync_every=64, fsync_interval=1.0,
+                 legacy_path=LEGACY_HISTORY_PATH):
+        self.path = path
+        self.legacy_path = legacy_path
+        self.fsync_every = fsync_every
+        self.fsync_interval = fsync_interval
+        self._file = None
+        self._pending = 0
+        self._last_sync = time.monotonic()
+        self._lock = threading.RLock()
+
+    def load(self):
+        """Читает все записи журнала; оборванный хвост отбрасывается"""
+        with self._lock:
+            return self._load()
+
+    def _load(self):
+        # Чтение и починка под одной блокировкой: иначе недописанная в этот
+        # момент строка сочлась бы оборванной и пропала бы при compact()
+        if not os.path.exists(self.path):
+            return self._migrate_legacy()
+
+        with open(self.path, "rb") as f:
+            data = f.read()
+        records = []
+        damaged = bool(data) and not data.endswith(b"\n")
+        loads = json.loads
+        for line in data.splitlines():
+            if not line:
+                continue
+            try:
+                records.append(loads(line))
+            except ValueError:
+                damaged = True
+        if damaged:
+            self.compact(records)
+        return records
+
+    def _migrate_legacy(self):
+        """Переносит историю из старого password_history.json"""
+        if not self.legacy_path or not os.path.exists(self.legacy_path):
+            return []
+        try:
+            with open(self.legacy_path, "r", encoding="utf-8") as f:
+                records = json.load(f)
+        except ValueError:
+            return []
+        self.compact(records)
+        return records
+
+    def _open(self):
+        if self._file is None:
+            self._file = open(self.path, "a", encoding="utf-8")
+            if self._file.tell() and not self._ends_with_newline():
+                # Новая запись не должна склеиться с оборванной строкой,
+                # которую load() потом отбросит вместе с ней
+                self._file.write("\n")
+        return self._file
+
+    def _ends_with_newline(self):
+        with open(self.path, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+
+    def append(self, records):
+        """Дописывает записи одной операцией записи"""
+        if not records:
+            return
+        text = "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in records)
+        with self._lock:
+            f = self._open()
+            f.write(text)
+            f.flush()
+            self._pending += len(records)
+            if (self._pending >= self.fsync_every
+                    or time.monotonic() - self._last_sync >= self.fsync_interval):
+                self.sync()
+
+    def sync(self):
+        """Сбрасывает накопленные записи на диск"""
+        with self._lock:
+            if self._file is not None and self._pending:
+                self._file.flush()
+                os.fsync(self._file.fileno())
+            self._pending = 0
+            self._last_sync = time.monotonic()
+
+    def compact(self, records):
+        """Атомарно заменяет журнал файлом, содержащим только records"""
+        text = "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in records)
+        directory = os.path.dirname(os.path.abspath(self.path))
+        tmp_path = self.path + ".tmp"
+        with self._lock:
+            self.close()
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(text)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+            if hasattr(os, "O_DIRECTORY"):
+                fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+                try:
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self.sync()
+                self._file.close()
+                self._file = None
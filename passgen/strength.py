@@ -0,0 +1,89 @@
+"""Оценка надежности паролей"""
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+from .engine import SYMBOLS
+
+
+def calculate_password_strength(password):
+    """Возвращает надежность пароля от 0.0 до 1.0"""
+    score = 0
+
+    # Длина пароля
+    if len(password) >= 12:
+        score += 0.25
+    elif len(password) >= 8:
+        score += 0.15
+
+    # Наличие разных типов символов
+    if any(c.islower() for c in password):
+        score += 0.15
+    if any(c.isupper() for c in password):
+        score += 0.15
+    if any(c.isdigit() for c in password):
+        score += 0.2
+    if any(c in SYMBOLS for c in password):
+        score += 0.25
+
+    return min(score, 1.0)  # Максимальное значение 1.0
+
+
+class StrengthCache:
+    """LRU-кэш оценок надежности
+
+    Ключ - хэш blake2b с солью процесса, поэтому пароли в открытом виде
+    в кэше не хранятся.
+    """
+
+    def __init__(self, maxsize=4096, scorer=calculate_password_strength):
+        self.maxsize = maxsize
+        self.scorer = scorer
+        self.hits = 0
+        self.misses = 0
+        self._salt = os.urandom(16)
+        self._data = OrderedDict()
+        # Оценки запрашиваются и из главного потока, и из фоновых задач
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def _key(self, password):
+        return hashlib.blake2b(password.encode("utf-8"), digest_size=16,
+                               key=self._salt).digest()
+
+    def score(self, password):
+        key = self._key(password)
+        data = self._data
+        with self._lock:
+            try:
+                value = data[key]
+            except KeyError:
+                self.misses += 1
+                value = self.scorer(password)
+                data[key] = value
+                if len(data) > self.maxsize:
+                    data.popitem(last=False)
+                return value
+            self.hits += 1
+            data.move_to_end(key)
+            return value
+
+    def stats(self):
+        return {"size": len(self._data), "maxsize": self.maxsize,
+                "hits": self.hits, "misses": self.misses}
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+        self.hits = self.misses = 0
+
+
+strength_cache = StrengthCache()
+
+
+def cached_password_strength(password):
+    """Оценка надежности через общий кэш процесса"""
+    return strength_cache.score(password)
@@ -0,0 +1,128 @@
+"""Шаблоны паролей, компилируемые один раз в план подстановки
+
+Грамматика:
+    #        цифра
+    w / W    строчная / заглавная латинская буква
+    [...]    свой класс символов, допускаются диапазоны: [a-f0-9], [!@#]
+    {n}      повтор предыдущего элемента n раз: #{6}, [abc]{4}, x{3}
+    \\c       символ c как есть: \\#, \\w, \\[, \\{
+Остальные символы переносятся в пароль без изменений.
+"""
+from functools import lru_cache
+
+from . import entropy
+from .engine import DIGITS, LOWERCASE, UPPERCASE
+
+SLOT_CLASSES = {"#": DIGITS, "w": LOWERCASE, "W": UPPERCASE}
+
+
+class TemplateError(ValueError):
+    """Ошибка разбора шаблона"""
+
+
+def _parse_class(template, pos):
+    """Разбирает [...] начиная после '['; возвращает (алфавит, новая позиция)"""
+    chars = []
+    while pos < len(template) and template[pos] != "]":
+        c = template[pos]
+        if c == "\\" and pos + 1 < len(template):
+            pos += 1
+            c = template[pos]
+        elif (pos + 2 < len(template) and template[pos + 1] == "-"
+              and template[pos + 2] != "]"):
+            end = template[pos + 2]
+            if ord(end) < ord(c):
+                raise TemplateError(f"Неверный диапазон {c}-{end}")
+            chars.extend(chr(o) for o in range(ord(c), ord(end) + 1))
+            pos += 3
+            continue
+        chars.append(c)
+        pos += 1
+    if pos >= len(template):
+        raise TemplateError("Незакрытая скобка [")
+    # Убираем повторы, сохраняя порядок, чтобы выбор был равномерным
+    alphabet = "".join(dict.fromkeys(chars))
+    if not alphabet:
+        raise TemplateError("Пустой класс символов []")
+    return alphabet, pos + 1
+
+
+def _parse_repeat(template, pos):
+    """Разбирает {n} начиная с '{'; возвращает (n, новая позиция)"""
+    end = template.find("}", pos)
+    if end == -1:
+        raise TemplateError("Незакрытая скобка {")
+    text = template[pos + 1:end]
+    if not text.isdigit():
+        raise TemplateError(f"Неверное число повторов: {{{text}}}")
+    return int(text), end + 1
+
+
+class CompiledTemplate:
+    """План шаблона: последовательность литералов и слотов классов символов"""
+
+    def __init__(self, template, plan):
+        self.template = template
+        self.plan = plan  # кортеж (literal, None, 0) или (None, alphabet, count)
+
+    @property
+    def length(self):
+        return sum(len(lit) if lit is not None else count for lit, _, count in self.plan)
+
+    def expand(self, n=1):
+        """Генерирует n паролей за один проход по плану"""
+        columns = []
+        for literal, alphabet, count in self.plan:
+            if literal is not None:
+                columns.append([literal] * n)
+                continue
+            stream = entropy.default_pool.choose(alphabet, n * count)
+            columns.append([stream[i:i + count] for i in range(0, n * count, count)])
+        if not columns:
+            return [""] * n
+        return ["".join(parts) for parts in zip(*columns)]
+
+
+@lru_cache(maxsize=128)
+def compile_template(template):
+    """Компилирует шаблон в план; результат кэшируется по тексту шаблона"""
+    plan = []
+    pos = 0
+    while pos < len(template):
+        c = template[pos]
+        if c == "\\":
+            if pos + 1 >= len(template):
+                raise TemplateError("Шаблон заканчивается на \\")
+            item = (template[pos + 1], None, 0)
+            pos += 2
+        elif c == "[":
+            alphabet, pos = _parse_class(template, pos + 1)
+            item = (None, alphabet, 1)
+        elif c in SLOT_CLASSES:
+            item = (None, SLOT_CLASSES[c], 1)
+            pos += 1
+        else:
+            item = (c, None, 0)
+            pos += 1
+
+        if pos < len(template) and template[pos] == "{":
+            repeat, pos = _parse_repeat(template, pos)
+            literal, alphabet, count = item
+            item = (literal * repeat, None, 0) if literal is not None else (None, alphabet, repeat)
+
+        literal, alphabet, count = item
+        if literal == "" or (literal is None and count == 0):
+            continue  # x{0} и #{0} ничего не добавляют
+        # Сливаем соседние литералы и соседние слоты одного класса
+        if plan and literal is not None and plan[-1][0] is not None:
+            plan[-1] = (plan[-1][0] + literal, None, 0)
+        elif plan and alphabet is not None and plan[-1][1] == alphabet:
+            plan[-1] = (None, alphabet, plan[-1][2] + count)
+        else:
+            plan.append(item)
+    return CompiledTemplate(template, tuple(plan))
+
+
+def expand_template(template, n=1):
+    """Генерирует n паролей по шаблону"""
+    return compile_template(template).expand(n)
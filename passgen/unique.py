@@ -0,0 +1,118 @@
+"""Генерация без повторов: отсев уже выданных паролей"""
+from .bloom import ScalableBloomFilter
+from .engine import compile_policy, generate_batch
+
+# До этого объема повторы отсеиваются точным множеством
+EXACT_LIMIT = 1000000
+# Догенерация прекращается после STALL_FACTOR * space отсеянных подряд паролей
+STALL_FACTOR = 20
+
+
+class UniqueFilter:
+    """Пропускает только пароли, которые еще не встречались
+
+    Для небольших запусков используется множество, для десятков миллионов -
+    масштабируемый фильтр Блума с долей ложных срабатываний fp_rate (ложное
+    срабатывание лишь отбрасывает новый пароль, повтор пропущен не будет).
+    """
+
+    def __init__(self, expected=0, fp_rate=1e-6, exact_limit=EXACT_LIMIT):
+        if expected <= exact_limit:
+            self._seen = set()
+            self._add = self._add_exact
+        else:
+            self._seen = ScalableBloomFilter(min(expected, 1 << 24), fp_rate)
+            self._add = self._seen.add
+        self.seeded = 0
+        self.accepted = 0
+        self.rejected = 0
+
+    def _add_exact(self, password):
+        seen = self._seen
+        if password in seen:
+            return False
+        seen.add(password)
+        return True
+
+    def seed(self, passwords, policy=None):
+        """Заносит уже выданные пароли (например, из истории), не считая их
+
+        seeded - сколько из них занимает место в пространстве паролей. Если
+        передана policy, учитываются только пароли, которые она может
+        выдать: остальные в фильтр заносятся, но емкость не уменьшают.
+        """
+        fits = compile_policy(policy).allows if policy is not None else None
+        for password in passwords:
+            if self._add(password) and (fits is None or fits(password)):
+                self.seeded += 1
+
+    def add(self, password):
+        if self._add(password):
+            self.accepted += 1
+            return True
+        self.rejected += 1
+        return False
+
+    def filter(self, passwords):
+        """Оставляет из пакета только новые пароли"""
+        add = self.add
+        return [p for p in passwords if add(p)]
+
+
+def check_capacity(policy, total, already=0):
+    """Проверяет, что политика вообще допускает total новых паролей"""
+    compiled = compile_policy(policy)
+    # Нижняя оценка: обязательные символы стоят на первых позициях, прочие
+    # свободны. Точный подсчет нужен, только если оценки не хватает
+    free = policy.length - compiled.minimum * len(compiled.classes)
+    lower = len(compiled.alphabet) ** free
+    for chars in compiled.classes:
+        lower *= len(chars) ** compiled.minimum
+    if total + already <= lower:
+        return
+    space = compiled.space
+    if total + already > space:
+        raise ValueError(f"Политика допускает только {space} различных паролей")
+
+
+def iter_unique_chunks(chunks, unique, policy, chunk_size):
+    """Пропускает порции через фильтр и догенерирует отсеянное количество
+
+    Если политика почти исчерпана, ложные срабатывания фильтра Блума могут
+    навсегда закрыть оставшиеся пароли. Поэтому после STALL_FACTOR * space
+    подряд отсеянных паролей догенерация прекращается с ValueError: будь
+    новые пароли доступны, хотя бы один нашелся бы почти наверняка.
+    """
+    missing = 0
+    for chunk in chunks:
+        fresh = unique.filter(chunk)
+        missing += len(chunk) - len(fresh)
+        if fresh:
+            yield fresh
+    stalled = 0
+    limit = None
+    while missing > 0:
+        batch = generate_batch(policy, min(missing, chunk_size))
+        fresh = unique.filter(batch)
+        missing -= len(fresh)
+        if fresh:
+            stalled = 0
+            yield fresh
+            continue
+        stalled += len(batch)
+        if limit is None:
+            limit = STALL_FACTOR * compile_policy(policy).space
+        if stalled >= limit:
+            raise ValueError(f"Не удается получить еще {missing} новых паролей: "
+                             "политика почти исчерпана или их отсеивает фильтр "
+                             "повторов; уменьшите количество или долю ложных срабатываний")
+
+
+def generate_unique(policy, n, unique=None):
+    """Генерирует n паролей без повторов (и без уже занесенных в unique)"""
+    unique = unique or UniqueFilter(n)
+    check_capacity(policy, n, unique.seeded + unique.accepted)
+    passwords = []
+    for chunk in iter_unique_chunks([generate_batch(policy, n)], unique, policy, max(n, 1)):
+        passwords.extend(chunk)
+    return passwords
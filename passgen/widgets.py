@@ -0,0 +1,201 @@
+"""Виджеты интерфейса, не привязанные к конкретной вкладке"""
+import customtkinter as ctk
+
+
+class VirtualList(ctk.CTkFrame):
+    """Список, рисующий только видимые строки
+
+    Данные - любая последовательность с len() и индексированием. На холсте
+    создается ровно столько строк, сколько помещается в окне; при прокрутке
+    те же элементы холста получают новый текст через itemconfig, поэтому
+    стоимость прокрутки не зависит от числа записей. С планировщиком
+    (scheduler.FrameScheduler) перерисовки за один кадр объединяются.
+    """
+
+    def __init__(self, master, formatter=str, badge=None, on_copy=None,
+                 row_height=24, scheduler=None, **kwargs):
+        super().__init__(master, **kwargs)
+        self.scheduler = scheduler
+        self.formatter = formatter
+        self.badge = badge
+        self.on_copy = on_copy
+        self.row_height = row_height
+        self.items = []
+        self.top = 0
+        self._rows = []
+
+        self.canvas = ctk.CTkCanvas(self, bg="#2b2b2b", highlightthickness=0)
+        self.canvas.pack(side="left", fill="both", expand=True)
+        self.scrollbar = ctk.CTkScrollbar(self, command=self.yview)
+        self.scrollbar.pack(side="right", fill="y")
+
+        self.canvas.bind("<Configure>", self._on_resize)
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.canvas.bind(sequence, self._on_wheel)
+
+    # Данные
+
+    def set_items(self, items, keep_position=False):
+        self.items = items
+        if not keep_position:
+            self.top = 0
+        self._clamp()
+        self.redraw()
+
+    def __len__(self):
+        return len(self.items)
+
+    # Прокрутка
+
+    @property
+    def visible_rows(self):
+        return max(1, self.canvas.winfo_height() // self.row_height)
+
+    def _clamp(self):
+        self.top = max(0, min(self.top, len(self.items) - self.visible_rows))
+
+    def yview(self, action, value, unit=None):
+        """Обработчик полосы прокрутки: moveto или scroll"""
+        if action == "moveto":
+            self.top = int(float(value) * len(self.items))
+        elif action == "scroll":
+            step = self.visible_rows if unit == "pages" else 1
+            self.top += int(value) * step
+        self._clamp()
+        self.redraw()
+
+    def scroll_to_end(self):
+        self.top = len(self.items)
+        self._clamp()
+        self.redraw()
+
+    def _on_wheel(self, event):
+        if getattr(event, "num", None) == 4 or event.delta > 0:
+            self.yview("scroll", -3)
+        else:
+            self.yview("scroll", 3)
+
+    # Отрисовка
+
+    def _on_resize(self, event=None):
+        needed = self.visible_rows + 1
+        while len(self._rows) < needed:
+            self._rows.append(self._create_row(len(self._rows)))
+        self._clamp()
+        self.redraw()
+
+    def _create_row(self, slot):
+        """Создает элементы холста для одной строки; они переиспользуются"""
+        canvas = self.canvas
+        y = slot * self.row_height + self.row_height // 2
+        tag = f"row_{slot}"
+        badge_bg = canvas.create_rectangle(6, y - 8, 46, y + 8, width=0, tags=tag)
+        badge_text = canvas.create_text(26, y, fill="#1a1a1a", font=("Roboto", 9, "bold"), tags=tag)
+        text = canvas.create_text(54, y, anchor="w", fill="#dce4ee", font=("Roboto Mono", 11), tags=tag)
+        copy = canvas.create_text(0, y, anchor="e", text="📋", fill="#dce4ee", tags=(tag, f"copy_{slot}"))
+        canvas.tag_bind(f"copy_{slot}", "<Button-1>", lambda e, s=slot: self._copy_slot(s))
+        return badge_bg, badge_text, text, copy
+
+    def _copy_slot(self, slot):
+        index = self.top + slot
+        if self.on_copy and index < len(self.items):
+            self.on_copy(self.items[index])
+
+    def redraw(self):
+        if self.scheduler is not None:
+            self.scheduler.request_redraw(self, self.redraw_now)
+        else:
+            self.redraw_now()
+
+    def redraw_now(self):
+        canvas = self.canvas
+        width = canvas.winfo_width()
+        items = self.items
+        for slot, (badge_bg, badge_text, text, copy) in enumerate(self._rows):
+            index = self.top + slot
+            if index >= len(items):
+                canvas.itemconfigure(f"row_{slot}", state="hidden")
+                continue
+            item = items[index]
+            canvas.itemconfigure(f"row_{slot}", state="normal")
+            canvas.itemconfigure(text, text=self.formatter(item))
+            if self.badge:
+                label, color = self.badge(item)
+                canvas.itemconfigure(badge_bg, fill=color)
+                canvas.itemconfigure(badge_text, text=label)
+            else:
+                canvas.itemconfigure(badge_bg, state="hidden")
+                canvas.itemconfigure(badge_text, state="hidden")
+            y = slot * self.row_height + self.row_height // 2
+            canvas.coords(copy, width - 8, y)
+            if not self.on_copy:
+                canvas.itemconfigure(copy, state="hidden")
+
+        total = len(items)
+        if total:
+            self.scrollbar.set(self.top / total, min(1.0, (self.top + self.visible_rows) / total))
+        else:
+            self.scrollbar.set(0, 1)
+
+
+class SegmentMeter:
+    """Сегментный индикатор на холсте с элементами, созданными один раз
+
+    set() меняет видимость только тех сегментов, что перешли через
+    границу между старым и новым значением.
+    """
+
+    def __init__(self, canvas, segments=20, colors=("#ff0000", "#ff7f00", "#ffff00", "#00ff00"),
+                 top=5, bottom=35, gap=2):
+        self.canvas = canvas
+        self.top = top
+        self.bottom = bottom
+        self.gap = gap
+        self.lit = 0
+        self.items = []
+        for i in range(segments):
+            color = colors[min(len(colors) - 1, i * len(colors) // segments)]
+            self.items.append(canvas.create_rectangle(0, top, 0, bottom, fill=color,
+                                                      width=0, state="hidden"))
+        canvas.bind("<Configure>", self._layout, add="+")
+
+    def _layout(self, event=None):
+        segment_width = self.canvas.winfo_width() / len(self.items)
+        for i, item in enumerate(self.items):
+            self.canvas.coords(item, i * segment_width, self.top,
+                               (i + 1) * segment_width - self.gap, self.bottom)
+
+    def set(self, lit):
+        """Зажигает первые lit сегментов; возвращает, изменилось ли что-то"""
+        lit = max(0, min(len(self.items), int(lit)))
+        if lit == self.lit:
+            return False
+        low, high = sorted((self.lit, lit))
+        state = "normal" if lit > self.lit else "hidden"
+        for item in self.items[low:high]:
+            self.canvas.itemconfigure(item, state=state)
+        self.lit = lit
+        return True
+
+
+class BarChart:
+    """Столбцы на холсте, которые двигаются через coords без пересоздания"""
+
+    def __init__(self, canvas, count, base=180, bar_width=30, left=10, fill="#2ecc71"):
+        self.canvas = canvas
+        self.base = base
+        self.heights = [0] * count
+        self.items = [canvas.create_rectangle(i * bar_width + left, base,
+                                              (i + 1) * bar_width, base, fill=fill)
+                      for i in range(count)]
+        self.bar_width = bar_width
+        self.left = left
+
+    def set_height(self, index, height):
+        """Меняет высоту столбца; возвращает, изменилось ли что-то"""
+        if height == self.heights[index]:
+            return False
+        self.heights[index] = height
+        self.canvas.coords(self.items[index], index * self.bar_width + self.left,
+                           self.base - height, (index + 1) * self.bar_width, self.base)
+        return True
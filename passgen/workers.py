@@ -0,0 +1,145 @@
+"""Фоновые задачи с передачей результатов в главный поток Tk"""
+import queue
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from . import metrics
+
+
+class JobCancelled(Exception):
+    """Задача остановлена по запросу отмены"""
+
+
+class Job:
+    """Фоновая задача; функция задачи получает ее первым аргументом"""
+
+    def __init__(self, pool, on_done=None, on_error=None, on_progress=None, on_cancel=None):
+        self._pool = pool
+        self._cancel = threading.Event()
+        self.on_done = on_done
+        self.on_error = on_error
+        self.on_progress = on_progress
+        self.on_cancel = on_cancel
+
+    def cancel(self):
+        self._cancel.set()
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    def is_cancelled(self):
+        """Для передачи как cancel=job.is_cancelled в потоковые функции"""
+        return self._cancel.is_set()
+
+    def check(self):
+        """Прерывает задачу, если запрошена отмена"""
+        if self._cancel.is_set():
+            raise JobCancelled()
+
+    def report(self, done, total=None):
+        """Сообщает о прогрессе; вызывается из рабочего потока"""
+        self._pool._events.put(("progress", self, (done, total)))
+
+
+class WorkerPool:
+    """Пул потоков, результаты которого разбираются в цикле Tk через after
+
+    Обратные вызовы (on_done, on_error, on_progress, on_cancel) всегда
+    выполняются в главном потоке, поэтому в них можно трогать виджеты.
+    Очередь опрашивается только пока есть незавершенные задачи; из
+    нескольких сообщений о прогрессе одной задачи за опрос берется последнее.
+    """
+
+    def __init__(self, window, max_workers=2, poll_interval=50):
+        self.window = window
+        self.poll_interval = poll_interval
+        self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                            thread_name_prefix="passgen-worker")
+        self._events = queue.SimpleQueue()
+        self._jobs = set()
+        self._polling = False
+
+    def submit(self, func, *args, on_done=None, on_error=None, on_progress=None,
+               on_cancel=None):
+        job = Job(self, on_done, on_error, on_progress, on_cancel)
+        metrics.count("workers.jobs")
+        self._jobs.add(job)
+        self._executor.submit(self._run, job, func, args)
+        if not self._polling:
+            self._polling = True
+            self.window.after(self.poll_interval, self._drain)
+        return job
+
+    def _run(self, job, func, args):
+        try:
+            job.check()
+            result = func(job, *args)
+            job.check()
+        except JobCancelled:
+            self._events.put(("cancelled", job, None))
+        except Exception as e:
+            self._events.put(("error", job, e))
+        else:
+            self._events.put(("done", job, result))
+
+    def _drain(self):
+        try:
+            self._deliver()
+        finally:
+            # Ошибка в обратном вызове не должна останавливать опрос
+            if self._jobs:
+                self.window.after(self.poll_interval, self._drain)
+            else:
+                self._polling = False
+
+    def _deliver(self):
+        progress = {}
+        finished = []
+        while True:
+            try:
+                kind, job, payload = self._events.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "progress":
+                progress[job] = payload
+            else:
+                progress.pop(job, None)
+                finished.append((kind, job, payload))
+
+        for job, (done, total) in progress.items():
+            if job.on_progress and not job.cancelled:
+                self._call(job.on_progress, done, total)
+        for kind, job, payload in finished:
+            self._jobs.discard(job)
+            if kind == "done" and job.cancelled:
+                kind = "cancelled"
+            callback = {"done": job.on_done, "error": job.on_error,
+                        "cancelled": job.on_cancel}[kind]
+            if callback is None:
+                continue
+            if kind == "cancelled":
+                self._call(callback)
+            else:
+                self._call(callback, payload)
+
+    def _call(self, callback, *args):
+        """Вызывает обработчик; исключение передается в обработчик ошибок Tk"""
+        try:
+            callback(*args)
+        except Exception:
+            self.window.report_callback_exception(*sys.exc_info())
+
+    @property
+    def busy(self):
+        return bool(self._jobs)
+
+    def cancel_all(self):
+        for job in list(self._jobs):
+            job.cancel()
+
+    def shutdown(self):
+        """Отменяет незавершенные задачи и не ждет рабочие потоки"""
+        self.cancel_all()
+        self._executor.shutdown(wait=False)
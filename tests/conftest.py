@@ -0,0 +1,38 @@
+"""Общие заглушки для тестов без дисплея"""
+import time
+
+import pytest
+
+
+class FakeWindow:
+    """Окно Tk без дисплея: after() копит обратные вызовы, run() их выполняет"""
+
+    def __init__(self):
+        self.pending = []
+        self.errors = []
+
+    def after(self, ms, callback):
+        self.pending.append(callback)
+        return len(self.pending)
+
+    def report_callback_exception(self, exc_type, exc, tb):
+        self.errors.append(exc)
+
+    def run(self):
+        """Выполняет накопленные обратные вызовы; True, если они были"""
+        pending, self.pending = self.pending, []
+        for callback in pending:
+            callback()
+        return bool(pending)
+
+    def run_until(self, condition, timeout=5.0):
+        deadline = time.monotonic() + timeout
+        while not condition():
+            assert time.monotonic() < deadline, "условие не выполнилось"
+            self.run()
+            time.sleep(0.001)
+
+
+@pytest.fixture
+def window():
+    return FakeWindow()
@@ -0,0 +1,81 @@
+"""Гарантии политик генерации"""
+import random
+from itertools import product
+
+import pytest
+
+from passgen.engine import AMBIGUOUS, PROFILES, Policy, compile_policy, generate_batch, generate_password
+from passgen.unique import check_capacity
+
+POLICIES = [
+    PROFILES["Стандартный"],
+    PROFILES["Максимальная защита"],  # расстановка через sample, а не таблицу
+    Policy(4, True, True, True, True),
+    Policy(6, False, False, True, True, min_per_class=3),
+    Policy(300, True, True, True, True, min_per_class=5),  # длиннее плана draw
+]
+
+
+def assert_policy(policy, password):
+    compiled = compile_policy(policy)
+    assert len(password) == policy.length
+    assert set(password) <= set(compiled.alphabet)
+    if len(compiled.classes) > 1:
+        for chars in compiled.classes:
+            assert sum(c in chars for c in password) >= compiled.minimum
+
+
+@pytest.mark.parametrize("policy", POLICIES)
+@pytest.mark.parametrize("n", [1, 5, 200])
+def test_class_minimums_on_secure_path(policy, n):
+    for password in compile_policy(policy).generate(n):
+        assert_policy(policy, password)
+
+
+@pytest.mark.parametrize("policy", POLICIES)
+@pytest.mark.parametrize("n", [1, 200])
+def test_class_minimums_with_explicit_rng(policy, n):
+    for password in generate_batch(policy, n, random.Random(n)):
+        assert_policy(policy, password)
+
+
+def test_seeded_generation_is_reproducible():
+    policy = PROFILES["Стандартный"]
+    assert generate_batch(policy, 50, random.Random(7)) == generate_batch(policy, 50, random.Random(7))
+    assert generate_password(policy, random.Random(7)) == generate_password(policy, random.Random(7))
+    assert generate_batch(policy, 50) != generate_batch(policy, 50)
+
+
+def test_excluded_characters_never_appear():
+    policy = Policy(64, True, True, True, True, exclude_ambiguous=True, exclude="abc!")
+    for password in generate_batch(policy, 100):
+        assert not set(password) & set(AMBIGUOUS + "abc!")
+
+
+@pytest.mark.parametrize("policy", [
+    Policy(0, True, True, True, True),
+    Policy(8, False, False, False, False),
+    Policy(8, False, False, True, False, exclude="0123456789"),
+    Policy(7, True, True, True, True, min_per_class=2),
+])
+def test_impossible_policies_rejected(policy):
+    with pytest.raises(ValueError):
+        compile_policy(policy)
+
+
+def test_space_matches_brute_force():
+    policy = Policy(4, False, True, True, False, min_per_class=1,
+                    exclude="CDEFGHIJKLMNOPQRSTUVWXYZ23456789")
+    compiled = compile_policy(policy)
+    upper, digits = compiled.classes
+    expected = sum(1 for word in product(compiled.alphabet, repeat=4)
+                   if any(c in upper for c in word) and any(c in digits for c in word))
+    assert compiled.space == expected
+
+
+def test_capacity_check():
+    pin = Policy(4, False, False, True, False)
+    check_capacity(pin, 10000)
+    with pytest.raises(ValueError):
+        check_capacity(pin, 10001)
+    check_capacity(Policy(400, True, True, True, True, min_per_class=100), 10)
@@ -0,0 +1,95 @@
+"""Несмещенность и счетчики пула энтропии"""
+from array import array
+from collections import Counter
+
+import pytest
+
+from passgen import entropy
+from passgen.entropy import EntropyPool, draw_plan
+
+
+def cyclic_urandom(pattern):
+    """Подмена os.urandom, повторяющая pattern по кругу"""
+    state = {"pos": 0}
+
+    def urandom(n):
+        out = bytearray()
+        while len(out) < n:
+            take = min(n - len(out), len(pattern) - state["pos"])
+            out += pattern[state["pos"]:state["pos"] + take]
+            state["pos"] = (state["pos"] + take) % len(pattern)
+        return bytes(out)
+    return urandom
+
+
+@pytest.mark.parametrize("alphabet", ["ab", "abc", "0123456789",
+                                      "абвгд", "".join(map(chr, range(33, 127)))])
+def test_byte_tables_map_every_accepted_byte_equally(alphabet):
+    table, delete, limit, chars = entropy._byte_tables(alphabet)
+    mapped = bytes(range(256)).translate(table, delete)
+    assert len(mapped) == limit
+    text = mapped.decode("ascii") if chars is None else mapped.decode("latin-1").translate(chars)
+    counts = Counter(text)
+    assert set(counts) == set(alphabet)
+    assert len(set(counts.values())) == 1
+
+
+@pytest.mark.parametrize("size", [2, 3, 7, 100, 255, 256])
+def test_index_table_is_uniform(size):
+    table, delete, limit = entropy._index_table(size)
+    counts = Counter(bytes(range(256)).translate(table, delete))
+    assert set(counts) == set(range(size))
+    assert len(set(counts.values())) == 1
+
+
+def test_draw_rejects_biased_bytes(monkeypatch):
+    monkeypatch.setattr(entropy.os, "urandom", cyclic_urandom(bytes(range(256))))
+    pool = EntropyPool(buffer_size=256)
+    # 255 индексов в range(3) на одном полном цикле байтов 0..254
+    result = pool.draw(draw_plan([3] * 255))
+    assert Counter(result) == {0: 85, 1: 85, 2: 85}
+
+
+def test_large_range_rejects_words_above_limit(monkeypatch):
+    words = array("H", [65535, 7]).tobytes()
+    monkeypatch.setattr(entropy.os, "urandom", cyclic_urandom(words))
+    pool = EntropyPool(buffer_size=64)
+    assert pool.indices(1000, 10) == [7] * 10
+    assert pool.stats()["bytes_rejected"] > 0
+
+
+def test_choose_distribution_within_bounds():
+    pool = EntropyPool()
+    alphabet = "abcdefghij"
+    n = 100000
+    counts = Counter(pool.choose(alphabet, n))
+    expected = n / len(alphabet)
+    sigma = (expected * (1 - 1 / len(alphabet))) ** 0.5
+    assert set(counts) == set(alphabet)
+    assert all(abs(c - expected) < 6 * sigma for c in counts.values())
+
+
+@pytest.mark.parametrize("size", [1, 2, 256, 257, 11880, 70000])
+def test_indices_stay_in_range(size):
+    indices = EntropyPool().indices(size, 5000)
+    assert len(indices) == 5000
+    assert 0 <= min(indices) and max(indices) < size
+
+
+def test_counters_account_for_every_byte():
+    pool = EntropyPool(buffer_size=1024)
+    pool.choose("abc", 5000)
+    pool.indices(1000, 300)
+    pool.draw(draw_plan([5] * 40))
+    stats = pool.stats()
+    assert stats["refills"] > 1
+    assert stats["bytes_drawn"] - stats["bytes_consumed"] == len(pool._buffer) - pool._pos
+
+
+def test_after_fork_replaces_held_lock():
+    pool = EntropyPool()
+    pool.read(10)
+    pool._lock.acquire()
+    pool._after_fork()
+    assert len(pool.read(10)) == 10
+    assert pool.stats()["bytes_consumed"] == 10
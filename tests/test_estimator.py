@@ -0,0 +1,39 @@
+"""Оценка энтропии с поиском шаблонов"""
+import math
+
+import pytest
+
+from passgen.engine import PROFILES, SYMBOLS, generate_batch
+from passgen.estimator import STRONG_BITS, estimate, estimate_batch
+
+
+@pytest.mark.parametrize("password, kinds", [
+    ("password", ["dictionary"]),
+    ("P@ssw0rd", ["dictionary"]),  # замены leet
+    ("qwerty123", ["sequence", "sequence"]),
+    ("aaaaaaaa", ["repeat"]),
+    ("abcabcabc", ["repeat"]),
+])
+def test_patterns_are_found_and_cheap(password, kinds):
+    result = estimate(password)
+    assert [kind for kind, _ in result.patterns] == kinds
+    assert result.score < 0.3
+
+
+def test_random_password_has_full_entropy():
+    password = "Xk9#mQ2!vL7zR4$w"
+    result = estimate(password)
+    assert result.patterns == ()
+    assert result.bits == pytest.approx(len(password) * math.log2(26 + 26 + 10 + len(SYMBOLS)))
+    assert result.score == 1.0
+
+
+def test_empty_password():
+    assert estimate("") == (0.0, 0.0, ())
+
+
+def test_batch_matches_single_estimates():
+    passwords = generate_batch(PROFILES["Стандартный"], 200) + [
+        "", "password", "qwerty123", "aaaaaaaa", "пароль", "Word1234"]
+    expected = [min(estimate(p).bits / STRONG_BITS, 1.0) for p in passwords]
+    assert estimate_batch(passwords) == pytest.approx(expected)
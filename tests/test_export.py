@@ -0,0 +1,66 @@
+"""Потоковый экспорт истории"""
+import csv
+import gzip
+import io
+import json
+import lzma
+
+import pytest
+
+from passgen.export import detect_format, export_history
+from passgen.history import HistoryEntry
+
+ENTRIES = [HistoryEntry(i, f"Пароль{i}!", "Почта", "2024-01-01 00:00:00", i / 10)
+           for i in range(7)]
+
+
+def read(path):
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8", newline="").read()
+    if path.endswith(".xz"):
+        return lzma.open(path, "rt", encoding="utf-8", newline="").read()
+    with open(path, encoding="utf-8", newline="") as f:
+        return f.read()
+
+
+@pytest.mark.parametrize("name", ["out.json", "out.json.gz", "out.jsonl.xz"])
+@pytest.mark.parametrize("chunk_size", [1, 3, 100])
+def test_json_round_trip(tmp_path, name, chunk_size):
+    path = str(tmp_path / name)
+    assert export_history(ENTRIES, path, chunk_size=chunk_size) == len(ENTRIES)
+    text = read(path)
+    if ".jsonl" in name:
+        records = [json.loads(line) for line in text.splitlines()]
+    else:
+        records = json.loads(text)
+    assert records == [e.to_dict() for e in ENTRIES]
+
+
+def test_empty_json_is_valid(tmp_path):
+    path = str(tmp_path / "out.json")
+    assert export_history([], path) == 0
+    assert json.loads(read(path)) == []
+
+
+def test_csv_rows(tmp_path):
+    path = str(tmp_path / "out.csv.gz")
+    export_history(iter(ENTRIES), path, chunk_size=2)
+    rows = list(csv.reader(io.StringIO(read(path))))
+    assert rows[0] == ["Дата", "Пароль", "Категория", "Надежность"]
+    assert rows[1:] == [[e.date, e.password, e.category, f"{int(e.strength * 100)}%"]
+                        for e in ENTRIES]
+
+
+def test_progress_and_cancel(tmp_path):
+    reports = []
+    written = export_history(ENTRIES, str(tmp_path / "out.jsonl"), chunk_size=2,
+                             total=len(ENTRIES), progress=lambda *a: reports.append(a),
+                             cancel=lambda: len(reports) >= 2)
+    assert written == 4
+    assert reports == [(2, 7), (4, 7)]
+
+
+def test_detect_format():
+    assert detect_format("a.CSV") == ("csv", None)
+    assert detect_format("a.jsonl.bz2") == ("jsonl", ".bz2")
+    assert detect_format("a.txt") == ("json", None)
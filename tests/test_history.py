@@ -0,0 +1,94 @@
+"""Хранилище истории: запросы и загрузка из журнала"""
+import threading
+
+from passgen.history import HistoryStore
+from passgen.storage import HistoryLog
+
+
+def make_store(tmp_path, passwords=(), load=True):
+    store = HistoryStore(HistoryLog(str(tmp_path / "history.jsonl")), load=load)
+    if passwords:
+        store.add_many(list(passwords), "Личное", date="2024-01-01 00:00:00")
+    return store
+
+
+def test_query_by_text_bucket_and_category(tmp_path):
+    store = make_store(tmp_path)
+    store.add_many(["abc", "Xy7$Qw9!Lm2#"], "Личное")
+    store.add_many(["abcdef"], "Работа")
+    assert {e.password for e in store.query(text="abc")} == {"abc", "abcdef"}
+    assert [e.password for e in store.query(text="abc", category="Работа")] == ["abcdef"]
+    weak = store.query(bucket=2)
+    assert {e.password for e in weak} >= {"abc"}
+    assert store.category_counts() == {"Личное": 2, "Работа": 1}
+
+
+def test_reload_is_idempotent(tmp_path):
+    store = make_store(tmp_path, ["p%d" % i for i in range(5)])
+    store.load()
+    store.load()
+    assert len(store) == 5
+    store.close()
+    reopened = make_store(tmp_path)
+    assert sorted(e.password for e in reopened) == ["p%d" % i for i in range(5)]
+
+
+def test_entries_added_before_load_are_kept(tmp_path):
+    make_store(tmp_path, ["old"]).close()
+    store = make_store(tmp_path, load=False)
+    store.add_many(["new"], "Личное")
+    store.load()
+    assert [e.password for e in store] == ["old", "new"]
+
+
+def test_clear_during_load_is_not_undone(tmp_path):
+    make_store(tmp_path, ["p%d" % i for i in range(5)]).close()
+    store = make_store(tmp_path, load=False)
+    read_log = store._read_log
+    cleared = []
+
+    def read_then_clear():
+        fresh = read_log()
+        if not cleared:
+            cleared.append(True)
+            store.clear()
+        return fresh
+
+    store._read_log = read_then_clear
+    store.load()
+    assert len(store) == 0
+    assert store.log.load() == []
+
+
+def test_add_during_load_is_not_duplicated(tmp_path):
+    make_store(tmp_path, ["old"]).close()
+    store = make_store(tmp_path, load=False)
+    read_log = store._read_log
+    added = []
+
+    def read_then_add():
+        fresh = read_log()
+        if not added:
+            added.append(True)
+            store.add_many(["new"], "Личное")
+        return fresh
+
+    store._read_log = read_then_add
+    store.load()
+    assert sorted(e.password for e in store) == ["new", "old"]
+    assert sorted(r["password"] for r in store.log.load()) == ["new", "old"]
+
+
+def test_appends_during_tail_repair_are_kept(tmp_path):
+    path = tmp_path / "history.jsonl"
+    path.write_bytes(b'{"password": "a", "category": "c", "date": "d"}\n{"pass')
+    store = make_store(tmp_path, load=False)
+    thread = threading.Thread(target=lambda: [store.add_many(["w%d" % i], "c")
+                                              for i in range(200)])
+    thread.start()
+    store.load()
+    thread.join()
+    store.close()
+    passwords = [r["password"] for r in HistoryLog(str(path)).load()]
+    assert passwords[0] == "a"
+    assert sorted(passwords[1:]) == sorted("w%d" % i for i in range(200))
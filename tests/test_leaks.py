@@ -0,0 +1,66 @@
+"""Офлайн-индекс утечек и фильтр Блума"""
+import hashlib
+
+import pytest
+
+from passgen.bloom import BloomFilter
+from passgen.cli import main
+from passgen.leaks import LeakIndex, build_index
+
+LEAKED = ["password", "123456", "qwerty", "Пароль1"]
+
+
+@pytest.fixture
+def dump(tmp_path):
+    path = tmp_path / "dump.txt"
+    lines = ["%s:%d" % (hashlib.sha1(p.encode("utf-8")).hexdigest().upper(), i + 1)
+             for i, p in enumerate(LEAKED)]
+    path.write_text("\n".join(lines + lines[:2] + ["мусор", ""]) + "\n", encoding="utf-8")
+    return str(path)
+
+
+@pytest.mark.parametrize("prefix_bytes", [1, 8, 20])
+def test_index_round_trip(tmp_path, dump, prefix_bytes):
+    index_path = str(tmp_path / "leaks.bin")
+    bloom_path = str(tmp_path / "leaks.bloom")
+    assert build_index(dump, index_path, bloom_path, prefix_bytes, chunk_records=2) == len(LEAKED)
+    with LeakIndex(index_path, bloom_path) as index:
+        assert len(index) == len(LEAKED)
+        assert all(index.is_leaked(p) for p in LEAKED)
+        results = index.check_many(["Xk9#mQ2!vL7z"] + LEAKED)
+    assert results[1:] == [True] * len(LEAKED)
+    if prefix_bytes > 1:
+        assert results[0] is False
+
+
+def test_bloom_has_no_false_negatives(tmp_path):
+    bloom = BloomFilter(1000, 0.01)
+    items = ["item%d" % i for i in range(1000)]
+    for item in items:
+        bloom.add(item)
+    path = str(tmp_path / "f.bloom")
+    bloom.save(path)
+    loaded = BloomFilter.load(path)
+    assert all(item in loaded for item in items)
+    loaded.bits.release()
+
+
+@pytest.mark.parametrize("content", [b"", b"PGLEAKS1", b"NOTLEAKS" + bytes(8),
+                                     b"PGLEAKS1\x08\x00\x00\x00\x00\x00\x00\x00abc"])
+def test_corrupt_index_rejected(tmp_path, content):
+    path = tmp_path / "leaks.bin"
+    path.write_bytes(content)
+    with pytest.raises(ValueError):
+        LeakIndex(str(path))
+
+
+def test_cli_exit_codes(tmp_path, dump, capsys):
+    index_path = str(tmp_path / "leaks.bin")
+    assert main(["leaks", "build", dump, "--index", index_path]) == 0
+    assert main(["leaks", "check", "--index", index_path, "Xk9#mQ2!vL7z"]) == 0
+    assert main(["leaks", "check", "--index", index_path, "qwerty"]) == 1
+    assert main(["leaks", "check", "--index", str(tmp_path / "missing.bin"), "qwerty"]) == 2
+    assert main(["leaks", "build", str(tmp_path / "missing.txt"), "--index", index_path]) == 2
+    (tmp_path / "bad.bin").write_bytes(b"garbage")
+    assert main(["leaks", "check", "--index", str(tmp_path / "bad.bin"), "qwerty"]) == 2
+    assert "Не удалось" in capsys.readouterr().err
@@ -0,0 +1,80 @@
+"""Общий планировщик кадров"""
+import pytest
+
+from passgen.scheduler import FrameScheduler
+
+
+@pytest.fixture
+def scheduler(window):
+    visible = {"Генератор": True, "История": False}
+    scheduler = FrameScheduler(window, is_visible=lambda view: visible[view])
+    scheduler.visible = visible
+    return scheduler
+
+
+def frames(log, name, count):
+    for i in range(count):
+        log.append((name, i))
+        yield 0
+
+
+def run_frames(window, scheduler, count):
+    for _ in range(count):
+        for task in scheduler._animations.values():
+            task.due = 0  # не ждем реального времени между кадрами
+        if not window.run():
+            break
+
+
+def test_same_key_replaces_animation(window, scheduler):
+    log = []
+    scheduler.animate("a", frames(log, "old", 5))
+    scheduler.animate("a", frames(log, "new", 2))
+    run_frames(window, scheduler, 10)
+    assert log == [("new", 0), ("new", 1)]
+    assert not window.pending  # без задач цикл кадров останавливается
+
+
+def test_hidden_view_pauses_until_shown(window, scheduler):
+    log = []
+    scheduler.animate("a", frames(log, "hidden", 2), view="История")
+    run_frames(window, scheduler, 5)
+    assert log == [] and not window.pending
+    scheduler.visible["История"] = True
+    scheduler.view_shown()
+    run_frames(window, scheduler, 5)
+    assert log == [("hidden", 0), ("hidden", 1)]
+
+
+def test_reduced_motion_finishes_with_final(window, scheduler):
+    log = []
+    scheduler.animate("a", frames(log, "a", 10), final=lambda: log.append("final"))
+    run_frames(window, scheduler, 2)
+    scheduler.set_reduced_motion(True)
+    assert log[-1] == "final" and len(log) == 3
+    scheduler.animate("b", frames(log, "b", 3))
+    assert log[-3:] == [("b", 0), ("b", 1), ("b", 2)]
+
+
+def test_redraws_are_coalesced(window, scheduler):
+    calls = []
+    for i in range(5):
+        scheduler.request_redraw("meter", lambda i=i: calls.append(i))
+    window.run()
+    assert calls == [4]
+    assert len(window.pending) == 0
+
+
+def test_raising_task_does_not_stop_the_loop(window, scheduler):
+    log = []
+
+    def broken():
+        yield 0
+        raise RuntimeError("сбой кадра")
+
+    scheduler.animate("broken", broken())
+    scheduler.animate("ok", frames(log, "ok", 3))
+    with pytest.raises(RuntimeError):
+        run_frames(window, scheduler, 5)
+    run_frames(window, scheduler, 5)
+    assert log == [("ok", 0), ("ok", 1), ("ok", 2)]
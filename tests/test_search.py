@@ -0,0 +1,43 @@
+"""Триграммный поиск подстрок"""
+import random
+
+import pytest
+
+from passgen.search import TrigramIndex
+
+
+def brute_force(docs, query):
+    query = query.lower()
+    return sorted(i for i, fields in docs.items()
+                  if any(query in f.lower() for f in fields))
+
+
+@pytest.fixture
+def docs():
+    rng = random.Random(3)
+    alphabet = "abcXYZ01аб"
+    return {i: ("".join(rng.choice(alphabet) for _ in range(rng.randrange(1, 12))),
+                rng.choice(["Почта", "Банковские", "Общие"]))
+            for i in range(500)}
+
+
+def test_search_matches_brute_force(docs):
+    index = TrigramIndex()
+    for doc_id, fields in docs.items():
+        index.add(doc_id, *fields)
+    for query in ["a", "ab", "abc", "ABC", "x0", "почт", "ОБЩ", "xyz01", "zzz", ""]:
+        assert index.search(query) == brute_force(docs, query), query
+
+
+def test_query_does_not_span_fields():
+    index = TrigramIndex()
+    index.add(1, "abc", "def")
+    assert index.search("cde") == []
+    assert index.search("bc") == [1]
+
+
+def test_clear():
+    index = TrigramIndex()
+    index.add(1, "abcdef")
+    index.clear()
+    assert len(index) == 0 and index.search("abc") == []
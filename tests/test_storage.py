@@ -0,0 +1,63 @@
+"""Журнал истории: дозапись, починка оборванного хвоста, перенос старого файла"""
+import json
+
+from passgen.storage import HistoryLog
+
+RECORD = {"password": "Пароль1!", "category": "Общие", "date": "2024-01-01 00:00:00",
+          "strength": 0.8}
+
+
+def make_log(tmp_path, **kwargs):
+    kwargs.setdefault("legacy_path", str(tmp_path / "legacy.json"))
+    return HistoryLog(str(tmp_path / "history.jsonl"), **kwargs)
+
+
+def test_append_and_reload(tmp_path):
+    log = make_log(tmp_path, fsync_every=2)
+    log.append([RECORD])
+    log.append([dict(RECORD, password=str(i)) for i in range(3)])
+    log.close()
+    records = make_log(tmp_path).load()
+    assert records == [RECORD] + [dict(RECORD, password=str(i)) for i in range(3)]
+
+
+def test_torn_tail_is_dropped_and_file_repaired(tmp_path):
+    path = tmp_path / "history.jsonl"
+    good = json.dumps(RECORD, ensure_ascii=False) + "\n"
+    path.write_text(good + good + '{"password": "обо', encoding="utf-8")
+    assert make_log(tmp_path).load() == [RECORD, RECORD]
+    assert path.read_text(encoding="utf-8") == good + good
+
+
+def test_corrupt_line_in_the_middle_is_skipped(tmp_path):
+    path = tmp_path / "history.jsonl"
+    good = json.dumps(RECORD, ensure_ascii=False) + "\n"
+    path.write_text(good + "{не json}\n" + good, encoding="utf-8")
+    assert make_log(tmp_path).load() == [RECORD, RECORD]
+    assert make_log(tmp_path).load() == [RECORD, RECORD]
+
+
+def test_append_after_torn_tail_is_not_glued_to_it(tmp_path):
+    path = tmp_path / "history.jsonl"
+    path.write_text('{"password": "обо', encoding="utf-8")
+    log = make_log(tmp_path)
+    log.append([RECORD])
+    log.close()
+    assert make_log(tmp_path).load() == [RECORD]
+
+
+def test_legacy_history_is_migrated(tmp_path):
+    (tmp_path / "legacy.json").write_text(json.dumps([RECORD]), encoding="utf-8")
+    assert make_log(tmp_path).load() == [RECORD]
+    assert (tmp_path / "history.jsonl").exists()
+    assert make_log(tmp_path, legacy_path=None).load() == [RECORD]
+
+
+def test_compact_replaces_contents(tmp_path):
+    log = make_log(tmp_path)
+    log.append([RECORD, RECORD])
+    log.compact([])
+    log.append([RECORD])
+    log.close()
+    assert make_log(tmp_path).load() == [RECORD]
+    assert not (tmp_path / "history.jsonl.tmp").exists()
@@ -0,0 +1,22 @@
+"""Кэш оценок надежности"""
+from passgen.strength import StrengthCache, calculate_password_strength
+
+
+def test_cache_returns_scorer_value_and_counts_hits():
+    cache = StrengthCache(maxsize=4)
+    assert cache.score("Abc123!x") == calculate_password_strength("Abc123!x")
+    cache.score("Abc123!x")
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+
+def test_cache_is_bounded_and_evicts_least_recent():
+    calls = []
+    cache = StrengthCache(maxsize=2, scorer=lambda p: calls.append(p) or 0.5)
+    cache.score("a")
+    cache.score("b")
+    cache.score("a")
+    cache.score("c")  # вытесняет "b"
+    assert len(cache) == 2
+    cache.score("a")
+    cache.score("b")
+    assert calls == ["a", "b", "c", "b"]
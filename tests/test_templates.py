@@ -0,0 +1,38 @@
+"""Грамматика шаблонов паролей"""
+import re
+
+import pytest
+
+from passgen.templates import TemplateError, compile_template, expand_template
+
+
+@pytest.mark.parametrize("template, pattern", [
+    ("Word####!@", r"[A-Z]ord\d{4}!@"),  # W - заглавная буква
+    ("#{6}", r"\d{6}"),
+    ("w{3}W{2}", r"[a-z]{3}[A-Z]{2}"),
+    ("[a-f0-9]{8}", r"[a-f0-9]{8}"),
+    ("[а-я]{3}", r"[а-я]{3}"),
+    (r"\#\w\[\{x{3}", r"#w\[\{xxx"),
+    ("x{0}#{0}", r""),
+])
+def test_expansion_matches_grammar(template, pattern):
+    for password in expand_template(template, 50):
+        assert re.fullmatch(pattern, password), password
+
+
+def test_class_duplicates_do_not_bias():
+    compiled = compile_template("[aab]")
+    assert compiled.plan == ((None, "ab", 1),)
+
+
+def test_length():
+    assert compile_template("Word####!@").length == 10
+    assert compile_template("[abc]{5}x").length == 6
+
+
+@pytest.mark.parametrize("template", [
+    "[abc", "[]", "[z-a]", "#{", "#{x}", "#{-1}", "abc\\",
+])
+def test_bad_templates_rejected(template):
+    with pytest.raises(TemplateError):
+        compile_template(template)
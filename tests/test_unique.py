@@ -0,0 +1,45 @@
+"""Генерация без повторов"""
+import pytest
+
+from passgen.engine import Policy
+from passgen.unique import UniqueFilter, check_capacity, generate_unique, iter_unique_chunks
+
+PIN = Policy(4, False, False, True, False)
+
+
+@pytest.mark.parametrize("exact_limit", [10 ** 6, 0])  # множество и фильтр Блума
+def test_unique_batch_has_no_duplicates(exact_limit):
+    unique = UniqueFilter(5000, fp_rate=1e-9, exact_limit=exact_limit)
+    passwords = generate_unique(PIN, 5000, unique)
+    assert len(passwords) == len(set(passwords)) == 5000
+
+
+def test_whole_space_is_reachable():
+    passwords = generate_unique(PIN, 10000)
+    assert sorted(passwords) == ["%04d" % i for i in range(10000)]
+
+
+def test_seeded_passwords_are_not_repeated():
+    unique = UniqueFilter(100)
+    unique.seed("%04d" % i for i in range(9990))
+    passwords = generate_unique(PIN, 10, unique)
+    assert sorted(passwords) == ["%04d" % i for i in range(9990, 10000)]
+
+
+def test_seed_counts_only_passwords_the_policy_allows():
+    unique = UniqueFilter(100)
+    unique.seed(["0000", "12345", "abcd", "0001"], PIN)
+    assert unique.seeded == 2
+    check_capacity(PIN, 9998, unique.seeded)
+    with pytest.raises(ValueError):
+        check_capacity(PIN, 9999, unique.seeded)
+
+
+def test_blocked_space_raises_instead_of_looping():
+    # Как если бы ложные срабатывания фильтра Блума закрыли все оставшиеся
+    # пароли: догенерация не должна зацикливаться
+    digits = Policy(2, False, False, True, False)
+    unique = UniqueFilter(100, exact_limit=0)
+    unique.seed("%02d" % i for i in range(100))
+    with pytest.raises(ValueError):
+        list(iter_unique_chunks([["00"] * 5], unique, digits, 10))
@@ -0,0 +1,77 @@
+"""Пул фоновых задач с доставкой результатов в главный поток"""
+import threading
+
+import pytest
+
+from passgen.workers import WorkerPool
+
+
+@pytest.fixture
+def pool(window):
+    pool = WorkerPool(window, poll_interval=1)
+    yield pool
+    pool.shutdown()
+
+
+def test_results_are_delivered_on_the_main_thread(window, pool):
+    main = threading.get_ident()
+    delivered = []
+    pool.submit(lambda job, x: (threading.get_ident(), x * 2), 21,
+                on_done=lambda r: delivered.append((r, threading.get_ident())))
+    window.run_until(lambda: delivered)
+    (worker, value), caller = delivered[0]
+    assert value == 42 and caller == main and worker != main
+    window.run()
+    assert not pool.busy and not window.pending  # опрос остановлен
+
+
+def test_errors_and_cancellation(window, pool):
+    events = []
+    release = threading.Event()
+
+    def slow(job):
+        release.wait(5)
+        job.check()
+        return "готово"
+
+    pool.submit(lambda job: 1 / 0, on_error=lambda e: events.append(type(e)))
+    job = pool.submit(slow, on_done=events.append, on_cancel=lambda: events.append("отмена"))
+    job.cancel()
+    release.set()
+    window.run_until(lambda: len(events) == 2)
+    assert sorted(map(str, events)) == sorted([str(ZeroDivisionError), "отмена"])
+
+
+def test_progress_is_coalesced_to_latest(window, pool):
+    reports = []
+    reported = threading.Event()
+    done = threading.Event()
+
+    def work(job):
+        for i in range(1, 101):
+            job.report(i, 100)
+        reported.set()
+        done.wait(5)
+
+    pool.submit(work, on_progress=lambda d, t: reports.append(d))
+    assert reported.wait(5)
+    window.run()
+    assert reports == [100]
+    done.set()
+    window.run_until(lambda: not pool.busy)
+
+
+def test_raising_callback_does_not_stop_delivery(window, pool):
+    delivered = []
+
+    def explode(result):
+        raise RuntimeError("ошибка обработчика")
+
+    gate = threading.Event()
+    pool.submit(lambda job: 1, on_done=explode)
+    pool.submit(lambda job: gate.wait(5) and 2, on_done=delivered.append)
+    window.run_until(lambda: window.errors)
+    gate.set()
+    window.run_until(lambda: delivered)
+    assert delivered == [2]
+    assert isinstance(window.errors[0], RuntimeError)